@@ -10,15 +10,19 @@ https://github.com/albertowd/Wheellive-telemetry
 
 import a_ctypes_aux # pylint: disable=unused-import
 
+import os
+import time
+
 import ac
 
-from lib.lt_acd import ACD
 from lib.lt_components import BoxComponent
 from lib.lt_config import Config
 from lib.lt_engine_info import EngineInfo
+from lib.lt_loader import BLOCKING_LOAD_ENV, ProfileLoader
 from lib.lt_options_info import OptionsInfo
+from lib.lt_telemetry import configured_source, open_source
 from lib.lt_wheel_info import WheelInfo
-from lib.lt_util import clear_logs, export_saved_log, log
+from lib.lt_util import clear_logs, export_saved_log, flush_logs, log
 
 # APP VERSION
 LT_VERSION = "1.8.5"
@@ -29,10 +33,13 @@ class _State:  # pylint: disable=too-few-public-methods
     instead of reassigning module globals. """
 
     def __init__(self):
-        self.acd_obj = None
+        self.profile = None
         self.configs = None
         self.engine_info = None
+        self.loader = None
         self.options_info = None
+        self.source = None
+        self.startup_s = 0.0
         self.wheel_infos = {}
 
 
@@ -41,6 +48,8 @@ LT = _State()
 
 def acMain(ac_version: str) -> None:
     """ Initiates the program. """
+    start = time.perf_counter()
+    LT.startup_s = 0.0
     log("Starting Live Telemetry {} on AC Python API version {}...".format(
         LT_VERSION, ac_version))
 
@@ -50,12 +59,22 @@ def acMain(ac_version: str) -> None:
     log("Loading configs...")
     LT.configs = Config(LT_VERSION)
 
-    log("Loading {} info...".format(ac.getCarName(0)))
-    LT.acd_obj = ACD("content/cars/{}".format(ac.getCarName(0)))
-    log("Loaded correctly")
+    LT.source = open_source(configured_source(LT.configs))
+    log("Reading telemetry from {}.".format(type(LT.source).__name__))
+
+    # The car data loads on a worker thread while the windows are built,
+    # they show a loading message until acUpdate hands the profile over.
+    LT.loader = ProfileLoader("content/cars/{}".format(ac.getCarName(0)))
+    blocking = bool(os.environ.get(BLOCKING_LOAD_ENV, ""))
+    if blocking:
+        log("Loading {} info ({} is set)...".format(ac.getCarName(0), BLOCKING_LOAD_ENV))
+        LT.loader.load()
+    else:
+        log("Loading {} info in background...".format(ac.getCarName(0)))
+        LT.loader.start()
 
     log("Loading options window...")
-    LT.options_info = OptionsInfo(LT.configs)
+    LT.options_info = OptionsInfo(LT.configs, LT.source)
     boost_button_id = LT.options_info.get_button_id("BoostBar")
     if boost_button_id is not None:
         ac.addOnClickedListener(boost_button_id, on_click_boost)
@@ -76,7 +95,7 @@ def acMain(ac_version: str) -> None:
     ac.addOnClickedListener(LT.options_info.get_button_id("Wear"), on_click_wear)
 
     log("Loading engine window...")
-    LT.engine_info = EngineInfo(LT.acd_obj, LT.configs)
+    LT.engine_info = EngineInfo(LT.configs, LT.source)
     window_id = LT.engine_info.get_window_id()
     ac.addOnAppActivatedListener(window_id, on_activation)
     ac.addOnAppDismissedListener(window_id, on_dismiss)
@@ -84,7 +103,7 @@ def acMain(ac_version: str) -> None:
 
     log("Loading wheel windows...")
     for index in range(4):
-        info = WheelInfo(LT.acd_obj, LT.configs, index)
+        info = WheelInfo(LT.configs, index, LT.source)
         window_id = info.get_window_id()
         ac.addOnAppActivatedListener(window_id, on_activation)
         ac.addOnAppDismissedListener(window_id, on_dismiss)
@@ -95,7 +114,17 @@ def acMain(ac_version: str) -> None:
     ac.addRenderCallback(LT.wheel_infos["RL"].get_window_id(), on_render_rl)
     ac.addRenderCallback(LT.wheel_infos["RR"].get_window_id(), on_render_rr)
 
-    log("Live Telemetry started.")
+    LT.engine_info.set_loading(True)
+    for info in LT.wheel_infos.values():
+        info.set_loading(True)
+    # The loader may have finished already (warm cache on a fast disk).
+    set_profile(LT.loader.poll())
+
+    LT.startup_s = time.perf_counter() - start
+    if blocking:
+        log("Live Telemetry started in {:.1f} ms, loading the car data itself.".format(LT.startup_s * 1000.0))
+    else:
+        log("Live Telemetry started in {:.1f} ms.".format(LT.startup_s * 1000.0))
 
     return "Live Telemetry"
 
@@ -135,6 +164,12 @@ def acShutdown() -> None:
 
     LT.configs.save_config()
 
+    counts = [LT.engine_info.get_tick_counts()] + [info.get_tick_counts() for info in LT.wheel_infos.values()]
+    log("Window updates: {} processed, {} skipped without a new physics packet.".format(
+        sum(count[0] for count in counts), sum(count[1] for count in counts)))
+    log("Telemetry source: {}.".format(LT.source.summary()))
+    LT.source.close()
+
     if (
         LT.engine_info.has_data_logged()
         or LT.wheel_infos["FL"].has_data_logged() or LT.wheel_infos["FR"].has_data_logged()
@@ -148,22 +183,31 @@ def acShutdown() -> None:
         log("Deleting old csv data...")
         clear_logs()
 
-    LT.acd_obj = None
+    LT.profile = None
     LT.configs = None
     LT.engine_info = None
+    LT.loader = None
     LT.options_info = None
+    LT.source = None
     LT.wheel_infos = {}
     log("Live Telemetry ended.")
 
 
 def acUpdate(delta_t: float) -> None:
     """ Called every physics update. """
+    if LT.loader is not None:
+        flush_logs()
+        set_profile(LT.loader.poll())
+
+    # One read of the source shared by every window.
+    LT.source.poll(delta_t)
+
     if LT.engine_info.is_active():
-        LT.engine_info.update(delta_t)
+        LT.engine_info.tick(delta_t)
 
     for info in LT.wheel_infos.values():
         if info.is_active():
-            info.update(delta_t)
+            info.tick(delta_t)
 
 
 def on_activation(window_id: int) -> None:
@@ -333,6 +377,27 @@ def on_render_rr(delta_t: float) -> None:
         info.draw(delta_t)
 
 
+def set_profile(profile) -> None:
+    """ Hands the car profile loaded in background to every window. All
+    windows switch within the same main thread call, so no frame ever
+    mixes the loading state with the real curves. """
+    if profile is None:
+        return
+
+    LT.profile = profile
+    LT.engine_info.set_profile(profile)
+    for info in LT.wheel_infos.values():
+        info.set_profile(profile)
+
+    load_ms = LT.loader.get_elapsed() * 1000.0
+    startup_ms = LT.startup_s * 1000.0
+    LT.loader = None
+    if startup_ms > 0.0:
+        log("Car data ready after {:.1f} ms in background, acMain returned in {:.1f} ms.".format(load_ms, startup_ms))
+    else:
+        log("Car data ready after {:.1f} ms, before acMain returned.".format(load_ms))
+
+
 def toggle_option(name: str) -> None:
     """ Called to toggle the option for a settings on all widgets. """
     enabled = not LT.options_info.get_option(name)
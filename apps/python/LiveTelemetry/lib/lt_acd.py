@@ -9,121 +9,194 @@ Big thanks for aluigi@ZenHaxs.com that have the patience to help me to open the
 
 from collections import OrderedDict
 from configparser import ConfigParser, Error as ConfigError
-from struct import unpack
+from struct import unpack_from
 from sys import exc_info
+import mmap
 import os
 
 from lib.lt_util import log
 
 
 class ACD:
-    """ Stores the ACD file contents. """
+    """ Stores the ACD file contents.
 
-    def __init__(self, path):
-        """ Default constructor receives the ACD file path. """
+    Only an index of the inner files is built on construction; each file
+    is decrypted (or read, for the data folder) the first time it is
+    requested through ``get_file`` and memoized from then on.
+
+    With a ``CarCache`` whose "files" section is still valid, the car
+    sources aren't even opened: files come from the cache and the index
+    is only built if something outside it is requested.
+    """
+
+    def __init__(self, path, cache=None):
+        """ Default constructor receives the ACD file path and an optional car cache. """
         path_v = path.split("/")
 
         # Initiate the class fields.
+        self.__cache = cache
         self.__car = path_v[-1]
-        self.__content = bytearray()
+        self.__cached_names = None
+        self.__configs = {}
+        self.__content = bytes()
         self.__content_size = len(self.__content)
+        self.__file = None
         self.__files = OrderedDict()
+        self.__filtered = {}
+        self.__folder = None
+        self.__index = OrderedDict()
+        self.__indexed = False
         self.__key = generate_key(self.__car)
+        self.__key_tables = build_key_tables(self.__key)
+        self.__loaded = 0
+        self.__parses_avoided = 0
+        self.__path = path
+
+        if cache is not None and cache.has("files") and cache.has("names"):
+            log("Loading from car cache...")
+            self.__files.update(cache.get("files"))
+            self.__cached_names = set(cache.get("names"))
+        else:
+            self.__build_index()
+
+    def __build_index(self):
+        """ Indexes the car sources, data.acd or the data folder. """
+        self.__indexed = True
 
         # Verify if the data.acd exists to load car information.
+        path = self.__path
         data_acd_path = "{}/data.acd".format(path)
         if os.path.isfile(data_acd_path):
             log("Loading from data.acd...")
-            self.__load_from_file(data_acd_path)
+            self.__index_file(data_acd_path)
         else:
             # If it don't, try to load from data folder.
             log("Loading from data folder...")
-            self.__load_from_folder("{}/data".format(path))
+            self.__index_folder("{}/data".format(path))
 
-    def __load_from_file(self, path):
-        """ Loads the car information by the data.acd encrypted file. """
+    def __index_file(self, path):
+        """ Indexes the inner files of the data.acd encrypted file. """
 
-        # Read all the file into memory.
+        # Map the file read-only so inner files can be sliced straight out
+        # of it, falling back to reading it whole when mapping fails.
         try:
-            with open(path, "rb") as rb:
-                self.__content = bytearray(rb.read())
-                self.__content_size = len(self.__content)
+            self.__file = open(path, "rb")
+            self.__content_size = os.fstat(self.__file.fileno()).st_size
+            if self.__content_size > 0:
+                try:
+                    self.__content = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    log("Failed to map file {}, reading it instead:".format(path))
+                    for info in exc_info():
+                        log(info)
+                    self.__content = self.__file.read()
+                    self.__content_size = len(self.__content)
         except OSError:
             log("Failed to open file {}:".format(path))
             for info in exc_info():
                 log(info)
+            self.close()
 
         if self.__content_size > 8:
             # Verify the "version" of the file.
             offset = 0
-            dummy = unpack("l", self.__content[offset:offset + 4])[0]
+            dummy = unpack_from("<l", self.__content, offset)[0]
             offset += 4
             if dummy < 0:
                 # New cars, just pass the first 8 bytes.
-                dummy = unpack("L", self.__content[offset:offset + 4])[0]
+                dummy = unpack_from("<L", self.__content, offset)[0]
                 offset += 4
             else:
                 # Old cars don't have any version.
                 offset = 0
 
-            # Parse each inner file.
+            # Index each inner file.
             while offset < self.__content_size:
                 # Size of the file name.
-                name_size = unpack("L", self.__content[offset:offset + 4])[0]
+                name_size = unpack_from("<L", self.__content, offset)[0]
                 offset += 4
 
                 # File name.
-                file_name = self.__content[offset:offset +
-                                           name_size].decode("utf8")
+                file_name = bytes(self.__content[offset:offset +
+                                                 name_size]).decode("utf8")
                 offset += name_size
-                log(file_name)
 
                 # File size.
-                file_size = unpack("L", self.__content[offset:offset + 4])[0]
+                file_size = unpack_from("<L", self.__content, offset)[0]
                 offset += 4
 
-                # Get the content and slices each 4 bytes.
-                packed_content = self.__content[offset:offset +
-                                                file_size * 4][::4]
+                # Each decrypted byte is packed in 4 bytes.
+                self.__index[file_name] = (offset, file_size)
                 offset += file_size * 4
-
-                # Decrypt the content of the file.
-                decrypted_content = ""
-                key_size = len(self.__key)
-                for i in range(file_size):
-                    code = packed_content[i] - ord(self.__key[i % key_size])
-                    if code < 0:
-                        log("Invalid unicode code '{}' in file: {} @ byte {}".format(code, file_name, i))
-                        log("Using '33' (!) to continue parsing file.")
-                    decrypted_content += chr(33 if code < 0 else code)
-
-                # Save the decrypted file.
-                self.set_file(decrypted_content, file_name)
+            log("Indexed {} inner files.".format(len(self.__index)))
         elif self.__content_size > 0:
             log("File too small to decrypt: {} bytes.".format(self.__content_size))
 
-    def __load_from_folder(self, path):
-        """ Loads the car information by the data folder. """
-        for file_name in os.listdir(path):
+    def __index_folder(self, path):
+        """ Indexes the car information files of the data folder. """
+        self.__folder = path
+        try:
+            file_names = os.listdir(path)
+        except OSError:
+            log("Failed to list folder {}:".format(path))
+            for info in exc_info():
+                log(info)
+            return
+
+        for file_name in file_names:
             file_path = "{}/{}".format(path, file_name)
             if os.path.isfile(file_path):
-                try:
-                    with open(file_path, "r") as r: # pylint: disable=unspecified-encoding
-                        self.set_file(r.read(), file_name)
-                except OSError:
-                    log("Failed to open file {}:".format(file_name))
-                    for info in exc_info():
-                        log(info)
+                self.__index[file_name] = (file_path, os.path.getsize(file_path))
+
+    def __load_entry(self, name):
+        """ Decrypts (or reads) an indexed inner file. """
+        location, file_size = self.__index[name]
+        if self.__folder is not None:
+            try:
+                with open(location, "r") as r: # pylint: disable=unspecified-encoding
+                    return r.read()
+            except OSError:
+                log("Failed to open file {}:".format(name))
+                for info in exc_info():
+                    log(info)
+                return ""
+
+        # Slices each 4 bytes straight out of the mapped file, the only
+        # copies made are the key strides inside decrypt.
+        with memoryview(self.__content) as view:
+            packed_content = view[location:location + file_size * 4:4]
+            decrypted_content, invalid = decrypt(packed_content, self.__key_tables)
+            packed_content.release()
+        if len(invalid) > 0:
+            log("Invalid unicode codes in file: {} @ {} byte(s), first at {}. Using '33' (!) to continue parsing file.".format(
+                name, len(invalid), ", ".join(str(i) for i in invalid[:8])))
+        return decrypted_content
 
     def __str__(self):
         """ Just print some useful information. """
         info = "Car: {} - {}kb\n".format(self.__car,
                                          self.__content_size // 1024)
         info += "Key: {}\nFiles:\n".format(self.__key)
-        for name in self.__files:
-            info += "   {} - {}b\n".format(name, len(self.__files[name]))
+        for name in self.__index:
+            info += "   {} - {}b{}\n".format(name, self.__index[name][1],
+                                             "" if name in self.__files else " (not loaded)")
         return info
 
+    def close(self):
+        """ Releases the data.acd mapping. Inner files already loaded stay
+        available, the ones never requested are dropped from the index. """
+        if isinstance(self.__content, mmap.mmap):
+            self.__content.close()
+        self.__content = bytes()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        if self.__folder is None:
+            self.__index = OrderedDict(
+                (name, entry) for name, entry in self.__index.items() if name in self.__files)
+            # Don't reopen the car sources for names only the cache knew.
+            self.__indexed = True
+
     def filter_mod_file_content(self, file_content, prefixes=(";", "#")):
         """ Filters the file content splitting it on lines and removing
         the ones that starts with the prefixes.
@@ -137,9 +210,7 @@ class ACD:
 
     def get_abs_hz(self):
         """ Returns the ABS active rate in Hz. """
-        config = ConfigParser(
-            empty_lines_in_values=False, inline_comment_prefixes=(";",))
-        config.read_string(self.get_file("electronics.ini"))
+        config = self.get_config("electronics.ini")
 
         if config.has_option("ABS", "RATE_HZ"):
             try:
@@ -158,10 +229,8 @@ class ACD:
         Falls back to 0.2 (a reasonable default for street tires) when the
         section is missing or unparseable.
         """
-        config = ConfigParser(
-            empty_lines_in_values=False, inline_comment_prefixes=(";",))
         try:
-            config.read_string(self.get_file("electronics.ini"))
+            config = self.get_config("electronics.ini")
             if config.has_option("ABS", "SLIP_RATIO_LIMIT"):
                 return float(config.get("ABS", "SLIP_RATIO_LIMIT"))
         except (ConfigError, ValueError):
@@ -170,17 +239,67 @@ class ACD:
                 log(info)
         return 0.2
 
+    def get_config(self, name):
+        """ Returns the parsed view of an inner INI file, parsed on first
+        access and shared by every getter afterwards. """
+        if name in self.__configs:
+            self.__parses_avoided += 1
+            return self.__configs[name]
+        config = ConfigParser(
+            empty_lines_in_values=False, inline_comment_prefixes=(";",))
+        config.read_string(self.get_file(name))
+        self.__configs[name] = config
+        return config
+
     def get_file(self, name):
-        """ Returns the content of an inner file. """
+        """ Returns the content of an inner file, decrypting it on first access. """
         if name in self.__files:
             return self.__files[name]
+        if not self.__indexed:
+            # The cache knows every inner file name, so only go back to
+            # the car sources for a file that exists but wasn't cached.
+            if name not in self.__cached_names:
+                return ""
+            self.__build_index()
+        if name in self.__index:
+            content = self.__load_entry(name)
+            self.set_file(content, name)
+            self.__loaded += 1
+            return content
         return ""
 
+    def get_file_names(self):
+        """ Returns the names of every inner file. """
+        if not self.__indexed:
+            return sorted(self.__cached_names)
+        return list(self.__index.keys())
+
+    def get_filtered_file(self, name):
+        """ Returns an inner file with its comment lines filtered out,
+        memoized like ``get_config``. """
+        if name in self.__filtered:
+            self.__parses_avoided += 1
+            return self.__filtered[name]
+        content = self.filter_mod_file_content(self.get_file(name))
+        self.__filtered[name] = content
+        return content
+
+    def get_gear_ratios(self):
+        """ Returns the forward gear ratios, first gear first. """
+        config = self.get_config("drivetrain.ini")
+
+        try:
+            count = int(config.get("GEARS", "COUNT"))
+            return [float(config.get("GEARS", "GEAR_{}".format(gear))) for gear in range(1, count + 1)]
+        except:
+            log("Failed to get gear ratios:")
+            for info in exc_info():
+                log(info)
+            raise
+
     def get_ideal_pressure(self, compound, wheel):
         """ Returns the compound ideal pressure. """
-        config = ConfigParser(
-            empty_lines_in_values=False, inline_comment_prefixes=(";",))
-        config.read_string(self.get_file("tyres.ini"))
+        config = self.get_config("tyres.ini")
 
         try:
             name = get_tire_name(compound, config, wheel)
@@ -191,16 +310,17 @@ class ACD:
                 log(info)
             raise
 
+    def get_parses_avoided(self):
+        """ Returns how many INI / curve parses were served from memory. """
+        return self.__parses_avoided
+
     def get_power_curve(self):
         """ Returns the rpm x power curve. """
-        config = ConfigParser(
-            empty_lines_in_values=False, inline_comment_prefixes=(";",))
-        config.read_string(self.get_file("engine.ini"))
+        config = self.get_config("engine.ini")
 
         try:
             # Need to filter this file, thanks RSS
-            file_content = self.get_file(config.get("HEADER", "POWER_CURVE"))
-            return self.filter_mod_file_content(file_content)
+            return self.get_filtered_file(config.get("HEADER", "POWER_CURVE"))
         except:
             log("Failed to get rpm power curve:")
             for info in exc_info():
@@ -209,15 +329,12 @@ class ACD:
 
     def get_temp_curve(self, compound, wheel):
         """ Returns the compound temperature grip curve. """
-        config = ConfigParser(
-            empty_lines_in_values=False, inline_comment_prefixes=(";",))
-        config.read_string(self.get_file("tyres.ini"))
+        config = self.get_config("tyres.ini")
 
         try:
             name = "THERMAL_{}".format(get_tire_name(compound, config, wheel))
             # Need to filter this file, thanks RSS
-            file_content = self.get_file(config.get(name, "PERFORMANCE_CURVE"))
-            return self.filter_mod_file_content(file_content)
+            return self.get_filtered_file(config.get(name, "PERFORMANCE_CURVE"))
         except:
             log("Failed to get tire temperature curve {}:".format(compound))
             for info in exc_info():
@@ -226,26 +343,67 @@ class ACD:
 
     def get_wear_curve(self, compound, wheel):
         """ Returns the compound wear curve. """
-        config = ConfigParser(
-            empty_lines_in_values=False, inline_comment_prefixes=(";",))
-        config.read_string(self.get_file("tyres.ini"))
+        config = self.get_config("tyres.ini")
 
         try:
             name = get_tire_name(compound, config, wheel)
             # Need to filter this file, thanks RSS
-            file_content = self.get_file(config.get(name, "WEAR_CURVE"))
-            return self.filter_mod_file_content(file_content)
+            return self.get_filtered_file(config.get(name, "WEAR_CURVE"))
         except:
             log("Failed to get tire wear curve {}:".format(compound))
             for info in exc_info():
                 log(info)
             raise
 
+    def save_cache(self):
+        """ Stores every file loaded so far in the car cache, if any was
+        decoded from the car sources during this session. """
+        if self.__cache is None or self.__loaded == 0:
+            return
+        self.__cache.set("files", dict(self.__files))
+        self.__cache.set("names", self.get_file_names())
+        self.__cache.save()
+        self.__loaded = 0
+
     def set_file(self, content, name):
         """ Sets a new content to an inner file. """
         self.__files[name] = content
 
 
+def build_key_tables(key):
+    """ Builds one ``(key_code, table)`` pair per key character, where
+    ``table`` is a 256-entry ``bytes.translate`` map subtracting that key
+    code. Codes that would go negative map to '!' (33), matching the
+    legacy per-byte fallback. """
+    tables = []
+    for key_code in key.encode("ascii"):
+        tables.append((key_code, bytes(code - key_code if code >= key_code else 33 for code in range(256))))
+    return tables
+
+
+def decrypt(packed_content, key_tables):
+    """ Decrypts an inner file already sliced to one byte per packed int.
+
+    Key position ``i`` owns the bytes ``i, i + len(key), ...``; each of
+    those strides is translated in bulk and woven back into place, then
+    the whole buffer is decoded once (latin-1 maps every byte to the same
+    code point ``chr()`` would). Returns the decrypted string and the
+    sorted positions of the bytes that fell below their key code.
+    """
+    key_size = len(key_tables)
+    decrypted = bytearray(len(packed_content))
+    invalid = []
+    for i, (key_code, table) in enumerate(key_tables):
+        stride = bytes(packed_content[i::key_size])
+        decrypted[i::key_size] = stride.translate(table)
+        # Clean files never hold a byte below its key code, so the
+        # per-byte scan only runs on the (rare) broken mod strides.
+        if len(stride) > 0 and min(stride) < key_code:
+            invalid.extend(i + j * key_size for j, code in enumerate(stride) if code < key_code)
+    invalid.sort()
+    return decrypted.decode("latin-1"), invalid
+
+
 def generate_key(car_name):
     """ Generates the 8 values key from the car name. """
     i = 0
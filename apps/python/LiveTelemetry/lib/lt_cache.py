@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module to keep decoded car data between sessions.
+
+@author: albertowd
+"""
+
+from sys import exc_info
+import json
+import os
+
+from lib.lt_util import get_cfg_dir, log
+
+
+# Bump whenever the layout of a cached section changes so stale files
+# from older versions are ignored instead of misread.
+CACHE_VERSION = 2
+
+
+def get_cache_dir() -> str:
+    """ Returns the default cache folder, next to the app configs. """
+    return os.path.join(get_cfg_dir(), "cache")
+
+
+def source_fingerprint(car_path: str):
+    """ Returns a cheap fingerprint of the car source files: the size and
+    mtime of data.acd or, for unpacked cars, the file count, total size
+    and newest mtime of the data folder. None when the car has neither. """
+    data_acd_path = "{}/data.acd".format(car_path)
+    if os.path.isfile(data_acd_path):
+        stat = os.stat(data_acd_path)
+        return {"kind": "acd", "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    data_path = "{}/data".format(car_path)
+    if os.path.isdir(data_path):
+        count = 0
+        size = 0
+        mtime = 0
+        for file_name in os.listdir(data_path):
+            stat = os.stat("{}/{}".format(data_path, file_name))
+            count += 1
+            size += stat.st_size
+            mtime = max(mtime, stat.st_mtime_ns)
+        return {"kind": "folder", "count": count, "size": size, "mtime": mtime}
+
+    return None
+
+
+class CarCache:
+    """ One JSON file per car holding named sections of decoded data,
+    keyed by the car name and its source fingerprint. A cache whose
+    version, car or fingerprint doesn't match is discarded on load. """
+
+    def __init__(self, car_path: str, cache_dir: str = None) -> None:
+        """ Default constructor receives the car folder path. """
+        self.__car = car_path.split("/")[-1]
+        self.__dirty = False
+        self.__fingerprint = None
+        self.__path = os.path.join(cache_dir or get_cache_dir(), "{}.json".format(self.__car))
+        self.__sections = {}
+
+        try:
+            self.__fingerprint = source_fingerprint(car_path)
+        except OSError:
+            log("Failed to fingerprint car {}:".format(self.__car))
+            for info in exc_info():
+                log(info)
+
+        if self.__fingerprint is not None and os.path.isfile(self.__path):
+            self.__load()
+
+    def __load(self) -> None:
+        """ Reads the cache file, keeping its sections only if still valid. """
+        try:
+            with open(self.__path, "r", encoding="utf-8") as r:
+                payload = json.load(r)
+        except (OSError, ValueError):
+            log("Failed to read car cache {}:".format(self.__path))
+            for info in exc_info():
+                log(info)
+            return
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != CACHE_VERSION
+            or payload.get("car") != self.__car
+            or payload.get("source") != self.__fingerprint
+        ):
+            log("Car cache for {} is stale, ignoring it.".format(self.__car))
+            return
+
+        self.__sections = payload.get("sections", {})
+        log("Car cache hit for {}.".format(self.__car))
+
+    def get(self, section: str, default=None):
+        """ Returns a cached section, or the default when it isn't cached. """
+        return self.__sections.get(section, default)
+
+    def has(self, section: str) -> bool:
+        """ Returns if a section is cached. """
+        return section in self.__sections
+
+    def set(self, section: str, value) -> None:
+        """ Updates a section, it is only written on ``save``. """
+        self.__sections[section] = value
+        self.__dirty = True
+
+    def save(self) -> None:
+        """ Writes the cache file if any section changed. """
+        if not self.__dirty or self.__fingerprint is None:
+            return
+
+        payload = {
+            "version": CACHE_VERSION,
+            "car": self.__car,
+            "source": self.__fingerprint,
+            "sections": self.__sections,
+        }
+        tmp_path = "{}.tmp".format(self.__path)
+        try:
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as w:
+                json.dump(payload, w)
+            os.replace(tmp_path, self.__path)
+            self.__dirty = False
+        except OSError:
+            log("Failed to write car cache {}:".format(self.__path))
+            for info in exc_info():
+                log(info)
@@ -8,13 +8,14 @@ Module to keep an app color palette.
 
 
 class Colors:  # pylint: disable=too-few-public-methods
-    """ Colors used by the components. Pure constant container. """
+    """ Colors used by the components. Pure constant container, the RGBA
+    tuples are shared by every component and colour table. """
 
-    black = [0.0, 0.0, 0.0, 1.0]
-    blue = [0.4, 0.596, 0.948, 1.0]
-    brown = [0.513, 0.360, 0.231, 1.0]
-    green = [0.235, 0.702, 0.443, 1.0]
-    red = [1.0, 0.270, 0.0, 1.0]
-    transparent = [0.0, 0.0, 0.0, 0.0]
-    yellow = [0.941, 0.902, 0.549, 1.0]
-    white = [1.0, 1.0, 1.0, 1.0]
+    black = (0.0, 0.0, 0.0, 1.0)
+    blue = (0.4, 0.596, 0.948, 1.0)
+    brown = (0.513, 0.360, 0.231, 1.0)
+    green = (0.235, 0.702, 0.443, 1.0)
+    red = (1.0, 0.270, 0.0, 1.0)
+    transparent = (0.0, 0.0, 0.0, 0.0)
+    yellow = (0.941, 0.902, 0.549, 1.0)
+    white = (1.0, 1.0, 1.0, 1.0)
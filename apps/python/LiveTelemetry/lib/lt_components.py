@@ -11,9 +11,10 @@ import math
 import ac
 import acsys
 
-from lib.lt_acd import ACD
 from lib.lt_colors import Colors
-from lib.lt_interpolation import Power, TirePsi, TireTemp
+from lib.lt_interpolation import Power
+from lib.lt_profile import (TEMP_CORE, TEMP_INNER, TEMP_MIDDLE, TEMP_OUTER,
+                             TEMP_TIRE, CarProfile, WheelTyres)
 
 
 WARNING_TIME_S = 0.5
@@ -30,6 +31,9 @@ _LOAD_FLOOR = 0.30
 # Polygonal approximation for the suspension widget's mount-point rings.
 _SUSP_RING_SEGMENTS = 16
 
+# Camber resolution of the shared tire rotation, finer tilts aren't visible.
+_CAMBER_STEP_RAD = math.radians(0.05)
+
 
 class Background:  # pylint: disable=too-few-public-methods
     """ Class to draw a background in a box component. """
@@ -84,10 +88,6 @@ class BoxComponent:
     resolutions = ["HD", "FHD", "1440p", "UHD", "4K", "8K"]
     resolution_map = {"HD": 0.5, "FHD": 0.75, "1440p": 1.0, "UHD": 1.5, "4K": 1.6, "8K": 3.0}
 
-    # Tire-centre rotation pivot in unrotated logical coords; shared
-    # by Tire / Temps / Dirt so they tilt together under camber.
-    _TIRE_PIVOT_LOGICAL = (256.0, 128.0)
-
     def __init__(self, p_x=0.0, p_y=0.0, width=100.0, height=100.0, *, font=24.0):  # pylint: disable=too-many-arguments
         self.__ini_font = font
         self.__ini_box = Box(p_x, p_y, width, height)
@@ -121,40 +121,139 @@ class BoxComponent:
     def resize_fonts(self, resolution: str) -> None:
         """ Resize all the ac components with text. Must be overrided. """
 
+    def set_profile(self, profile: CarProfile) -> None:
+        """ Receives the car profile once it's loaded. Must be overrided
+        by the components reading car data. """
+
     @staticmethod
-    def _rotate(offset: tuple, centre: tuple, trig: tuple) -> tuple:
-        """ Rotates ``offset = (dx, dy)`` around ``centre = (cx, cy)``
-        using pre-computed ``trig = (cos, sin)``. """
-        dx, dy = offset
-        cx, cy = centre
-        cos_a, sin_a = trig
-        return (cx + cos_a * dx - sin_a * dy,
-                cy + sin_a * dx + cos_a * dy)
-
-    def _camber_rotation(self, camber: float) -> tuple:
-        """ Returns ``(pivot, trig)`` for the shared tire-pivot rotation. """
-        pivot = (BoxComponent._TIRE_PIVOT_LOGICAL[0] * self._mult,
-                 BoxComponent._TIRE_PIVOT_LOGICAL[1] * self._mult)
-        angle = -camber * _TIRE_CAMBER_AMPLIFY
-        return pivot, (math.cos(angle), math.sin(angle))
-
-    def _emit_rotated_quad(self, offsets: tuple, pivot: tuple, trig: tuple) -> None:
-        """ One rotated quad: 4 local offsets from ``pivot``, single
-        ``glBegin(Quads)`` (AC1 honours only one quad per begin). """
-        ac.glBegin(acsys.GL.Quads)
-        for offset in offsets:
-            ax, ay = self._rotate(offset, pivot, trig)
-            ac.glVertex2f(ax, ay)
-        ac.glEnd()
-
-    def _emit_rotated_rect(self, rect: tuple, pivot: tuple, trig: tuple) -> None:
-        """ ``_emit_rotated_quad`` for an axis-aligned ``(x, y, w, h)`` rect. """
-        x, y, w, h = rect
-        px, py = pivot
-        self._emit_rotated_quad(
-            ((x - px, y - py), (x + w - px, y - py),
-             (x + w - px, y + h - py), (x - px, y + h - py)),
-            pivot, trig)
+    def _emit_quads(quads) -> None:
+        """ Emits ready vertex quads, one ``glBegin(Quads)`` each (AC1
+        honours only one quad per begin). """
+        for quad in quads:
+            ac.glBegin(acsys.GL.Quads)
+            for vertex in quad:
+                ac.glVertex2f(*vertex)
+            ac.glEnd()
+
+
+class CamberRotation:
+    """ Camber rotation around the tire pivot, shared by the Tire, Temps
+    and Dirt of one wheel so they tilt together.
+
+    Camber is quantized to ``_CAMBER_STEP_RAD`` and every rotated vertex
+    list is kept until the quantized camber or the widget size changes,
+    so a settled tire costs no trigonometry at all. Each list is cached
+    by name along with its source geometry, which is compared (by
+    identity first) on every call to catch resizes and moving rects.
+    """
+
+    # Tire-centre rotation pivot in unrotated logical coords.
+    _PIVOT_LOGICAL = (256.0, 128.0)
+
+    def __init__(self):
+        self.__key = None
+        self.__vertices = {}
+        self.pivot = (0.0, 0.0)
+        self.trig = (1.0, 0.0)
+
+    def __cached(self, name: str, source):
+        """ Returns the cached vertices of ``source``, None when stale. """
+        entry = self.__vertices.get(name)
+        if entry is not None and (entry[0] is source or entry[0] == source):
+            return entry[1]
+        return None
+
+    def __rotate(self, offsets) -> list:
+        """ Rotates ``(dx, dy)`` offsets from the pivot into absolute points. """
+        px, py = self.pivot
+        cos_a, sin_a = self.trig
+        return [(px + cos_a * dx - sin_a * dy, py + sin_a * dx + cos_a * dy) for dx, dy in offsets]
+
+    def points(self, name: str, points: tuple) -> list:
+        """ Returns the absolute ``points`` rotated. """
+        vertices = self.__cached(name, points)
+        if vertices is None:
+            px, py = self.pivot
+            vertices = self.__rotate([(x - px, y - py) for x, y in points])
+            self.__vertices[name] = (points, vertices)
+        return vertices
+
+    def quads(self, name: str, offsets: tuple) -> list:
+        """ Returns the quads of 4 offsets from the pivot rotated. """
+        vertices = self.__cached(name, offsets)
+        if vertices is None:
+            px, py = self.pivot
+            cos_a, sin_a = self.trig
+            vertices = [[(px + cos_a * dx - sin_a * dy, py + sin_a * dx + cos_a * dy) for dx, dy in quad]
+                        for quad in offsets]
+            self.__vertices[name] = (offsets, vertices)
+        return vertices
+
+    def rects(self, name: str, rects: tuple) -> list:
+        """ Returns the axis-aligned ``(x, y, w, h)`` rects rotated. """
+        vertices = self.__cached(name, rects)
+        if vertices is None:
+            px, py = self.pivot
+            vertices = []
+            for x, y, w, h in rects:
+                left, top = x - px, y - py
+                vertices.append(self.__rotate(((left, top), (left + w, top), (left + w, top + h), (left, top + h))))
+            self.__vertices[name] = (rects, vertices)
+        return vertices
+
+    def update(self, camber: float, mult: float) -> None:
+        """ Moves to another camber or size, dropping every cached list
+        only when the quantized key changed. Cheap to call from each
+        component's draw, the first one of the frame does the work. """
+        key = (int(round(camber / _CAMBER_STEP_RAD)), mult)
+        if key == self.__key:
+            return
+        self.__key = key
+        self.__vertices = {}
+        angle = -key[0] * _CAMBER_STEP_RAD * _TIRE_CAMBER_AMPLIFY
+        self.pivot = (CamberRotation._PIVOT_LOGICAL[0] * mult, CamberRotation._PIVOT_LOGICAL[1] * mult)
+        self.trig = (math.cos(angle), math.sin(angle))
+
+
+class Label:
+    """ AC label that remembers its last text, colour, font size and
+    position, forwarding only the calls that change them. Each ``ac``
+    call crosses into the game while most readouts repeat from one
+    frame to the next. Every update of a label must go through it. """
+
+    def __init__(self, window_id: int, text="", align="center"):
+        self.__color = None
+        self.__id = ac.addLabel(window_id, text)
+        self.__position = None
+        self.__size = None
+        self.__text = text
+        ac.setFontAlignment(self.__id, align)
+        ac.setCustomFont(self.__id, "Arial", 0, 1)
+
+    def set_color(self, color: tuple) -> None:
+        """ Sets the font color. """
+        if color != self.__color:
+            self.__color = color
+            ac.setFontColor(self.__id, *color)
+
+    def set_position(self, pos_x: float, pos_y: float) -> None:
+        """ Sets the label position inside its window. """
+        position = (pos_x, pos_y)
+        if position != self.__position:
+            self.__position = position
+            ac.setPosition(self.__id, pos_x, pos_y)
+
+    def set_size(self, size: float) -> None:
+        """ Sets the font size. """
+        if size != self.__size:
+            self.__size = size
+            ac.setFontSize(self.__id, size)
+
+    def set_text(self, text: str) -> None:
+        """ Sets the label text. """
+        if text != self.__text:
+            self.__text = text
+            ac.setText(self.__id, text)
 
 
 class BatteryBar(BoxComponent):
@@ -194,14 +293,12 @@ class BatteryBar(BoxComponent):
     ``OFF`` branch is short-circuited upstream in InfoWindow.draw).
     """
 
-    def __init__(self, _acd: ACD, resolution: str, window_id: int,
+    def __init__(self, resolution: str, window_id: int,
                  y_offset: float = -88.0):
         super().__init__(0.0, y_offset, 512.0, 24.0)
         self._back.color = Colors.black
 
-        self.__lb = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb, "center")
-        ac.setCustomFont(self.__lb, "Arial", 0, 1)
+        self.__lb = Label(window_id)
 
         self.__visible = False
         self.__spawn_charge = None
@@ -209,7 +306,7 @@ class BatteryBar(BoxComponent):
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb, "")
+        self.__lb.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         # User override via the options-window cycle button. "OFF" is
@@ -247,7 +344,7 @@ class BatteryBar(BoxComponent):
             show = self.__visible
 
         if not show:
-            ac.setText(self.__lb, "")
+            self.__lb.set_text("")
             return
 
         self._draw()
@@ -273,30 +370,28 @@ class BatteryBar(BoxComponent):
         else:
             text = "BAT {:.0f}%".format(ratio * 100.0)
 
-        ac.setFontColor(self.__lb, color[0], color[1], color[2], color[3])
-        ac.setText(self.__lb, text)
+        self.__lb.set_color(color)
+        self.__lb.set_text(text)
 
     def resize_fonts(self, resolution: str) -> None:
-        ac.setFontSize(self.__lb, self._font)
-        ac.setPosition(self.__lb, self._box.center[0], self._box.rect[1] - self._font - 8)
+        self.__lb.set_size(self._font)
+        self.__lb.set_position(self._box.center[0], self._box.rect[1] - self._font - 8)
 
 
 class BoostBar(BoxComponent):
     """ Class to handle boost bar change. """
 
-    def __init__(self, _acd: ACD, resolution: str, window_id: int):
+    def __init__(self, resolution: str, window_id: int):
         # Initial size is 512x85
         super().__init__(0.0, -24.0, 512.0, 24.0)
         self._back.color = Colors.black
 
-        self.__lb = ac.addLabel(window_id, "- bar")
-        ac.setFontAlignment(self.__lb, "center")
-        ac.setCustomFont(self.__lb, "Arial", 0, 1)
+        self.__lb = Label(window_id, "- bar")
 
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb, "")
+        self.__lb.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         self._draw()
@@ -311,12 +406,12 @@ class BoostBar(BoxComponent):
         ac.glColor4f(*color)
         ac.glQuad(*p_bar)
 
-        ac.setFontColor(self.__lb, color[0], color[1], color[2], color[3])
-        ac.setText(self.__lb, "{:.2f} bar".format(max(0.0, turbo_boost)))
+        self.__lb.set_color(color)
+        self.__lb.set_text("{:.2f} bar".format(max(0.0, turbo_boost)))
 
     def resize_fonts(self, resolution: str) -> None:
-        ac.setFontSize(self.__lb, self._font)
-        ac.setPosition(self.__lb, self._box.center[0], self._box.rect[1] - self._font - 8)
+        self.__lb.set_size(self._font)
+        self.__lb.set_position(self._box.center[0], self._box.rect[1] - self._font - 8)
 
 
 class Camber(BoxComponent):
@@ -327,19 +422,13 @@ class Camber(BoxComponent):
     side; class kept named ``Camber`` so the existing option still
     toggles it. """
 
-    def __init__(self, acd: ACD, resolution: str, wheel):
+    def __init__(self, tyres: WheelTyres, resolution: str, wheel):
         # Same rect as the old trapezoidal Camber strip — flush with tire bottom.
         super().__init__(188.0, 256.0, 136.0, 15.0)
         self.__wheel = wheel
-        # Per-axle ideal pressure for the pressure-bias term. Falls back to
-        # TirePsi's 26 psi default on any ACD parse failure (ConfigParser
-        # errors, missing keys, unparseable mod data).
-        ideal = None
-        try:
-            ideal = acd.get_ideal_pressure(ac.getCarTyreCompound(0), wheel)
-        except Exception:  # pylint: disable=broad-except
-            ideal = None
-        self.__ideal_psi = float(ideal) if ideal and ideal > 0.0 else 26.0
+        # Per-axle ideal pressure of the active compound for the
+        # pressure-bias term, follows pit-stop compound swaps.
+        self.__tyres = tyres
         self.resize(resolution)
 
     def _zone_weights(self, data) -> tuple:
@@ -350,7 +439,7 @@ class Camber(BoxComponent):
         camber_axis = max(-1.0, min(1.0, camber_n / _CAMBER_FULL_BIAS_RAD))
 
         # Pressure bias: +1 bowed (edges carry), -1 crowned (centre).
-        tire_p_norm = data.tire_p / self.__ideal_psi if self.__ideal_psi > 0.0 else 1.0
+        tire_p_norm = data.tire_p / self.__tyres.active.ideal_pressure
         p_bias = max(-1.0, min(1.0, (1.0 - tire_p_norm) / _PRESSURE_FULL_BIAS))
 
         # Load magnitude scales the patch. data.tire_l is in N/(5g).
@@ -395,7 +484,8 @@ class Dirt(BoxComponent):
     """ Class to handle tire dirt draw. Rotates with the tire so the
     dirt level visibly follows the tire's camber tilt. """
 
-    def __init__(self, resolution: str):
+    def __init__(self, rotation: CamberRotation, resolution: str):
+        self.__rotation = rotation
         # Initial size is 136x116
         super().__init__(188.0, 128.0, 136.0, 116.0)
         self.resize(resolution)
@@ -406,9 +496,9 @@ class Dirt(BoxComponent):
                 self._box.rect[1] + self._box.rect[3] - dirt,
                 self._box.rect[2],
                 dirt)
-        pivot, trig = self._camber_rotation(data.camber)
+        self.__rotation.update(data.camber, self._mult)
         ac.glColor4f(*Colors.brown)
-        self._emit_rotated_rect(rect, pivot, trig)
+        self._emit_quads(self.__rotation.rects("dirt", (rect,)))
 
 
 class Height(BoxComponent):
@@ -440,16 +530,16 @@ class Height(BoxComponent):
         super().__init__(
             448.0 if wheel.is_left() else 0.0, 208.0, 64.0, 48.0)
         self._back.color = Colors.white
+        self.__arrows = ()
+        self.__bars = ()
         self.__warn_time = 0.0
 
-        self.__lb = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb, "center")
-        ac.setCustomFont(self.__lb, "Arial", 0, 1)
+        self.__lb = Label(window_id)
 
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb, "")
+        self.__lb.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         if data.height < 0.02:
@@ -462,6 +552,19 @@ class Height(BoxComponent):
         self._back.color = color
         ac.glColor4f(*color)
 
+        # 2 reference-surface bars and 2 arrow triangles, built on resize.
+        for rect in self.__bars:
+            ac.glQuad(*rect)
+        for triangle in self.__arrows:
+            ac.glBegin(acsys.GL.Triangles)
+            for vertex in triangle:
+                ac.glVertex2f(*vertex)
+            ac.glEnd()
+
+        self.__lb.set_text("{:03.1f} mm".format(data.height))
+        self.__lb.set_color(color)
+
+    def resize_fonts(self, resolution: str) -> None:
         m = self._mult
         rx, ry = self._box.rect[0], self._box.rect[1]
         w = self._box.rect[2]
@@ -471,33 +574,21 @@ class Height(BoxComponent):
         arrow_half_w = 6.0 * m
         cx = rx + w * 0.5
 
-        # 2 reference-surface bars (top + bottom).
-        ac.glQuad(rx, ry, w, bar_h)
-        ac.glQuad(rx, ry + h - bar_h, w, bar_h)
+        # Top + bottom bars.
+        self.__bars = ((rx, ry, w, bar_h), (rx, ry + h - bar_h, w, bar_h))
 
-        # 2 arrow triangles — top points up at the top bar, bottom
-        # points down at the bottom bar.
+        # Top arrow points up at the top bar, bottom one points down at
+        # the bottom bar.
         top_apex_y = ry + bar_h
         top_base_y = top_apex_y + arrow_h
-        ac.glBegin(acsys.GL.Triangles)
-        ac.glVertex2f(cx, top_apex_y)
-        ac.glVertex2f(cx - arrow_half_w, top_base_y)
-        ac.glVertex2f(cx + arrow_half_w, top_base_y)
-        ac.glEnd()
-
         bot_apex_y = ry + h - bar_h
         bot_base_y = bot_apex_y - arrow_h
-        ac.glBegin(acsys.GL.Triangles)
-        ac.glVertex2f(cx, bot_apex_y)
-        ac.glVertex2f(cx - arrow_half_w, bot_base_y)
-        ac.glVertex2f(cx + arrow_half_w, bot_base_y)
-        ac.glEnd()
-
-        ac.setText(self.__lb, "{:03.1f} mm".format(data.height))
-        ac.setFontColor(self.__lb, *color)
+        self.__arrows = (
+            ((cx, top_apex_y), (cx - arrow_half_w, top_base_y), (cx + arrow_half_w, top_base_y)),
+            ((cx, bot_apex_y), (cx - arrow_half_w, bot_base_y), (cx + arrow_half_w, bot_base_y)),
+        )
 
-    def resize_fonts(self, resolution: str) -> None:
-        ac.setFontSize(self.__lb, self._font)
+        self.__lb.set_size(self._font)
         # Vertically centred between the two arrow bases. AC1 anchors
         # the label by its top edge and its baseline sits low inside
         # the rendered glyph box, so the visible centre of the text
@@ -505,9 +596,8 @@ class Height(BoxComponent):
         # by half the font height. Bumping the offset to `font · 0.8`
         # nudges the text up enough that the x-height of the readout
         # lines up with the centre of the gap between the bars.
-        ac.setPosition(
-            self.__lb, self._box.center[0],
-            self._box.center[1] - self._font * 0.8)
+        self.__lb.set_position(
+            self._box.center[0], self._box.center[1] - self._font * 0.8)
 
 
 class Load(BoxComponent):
@@ -548,10 +638,10 @@ class Lock(BoxComponent):
 
     texture_id = 0
 
-    def __init__(self, acd: ACD, resolution: str, wheel):
-        abs_hz = acd.get_abs_hz()
-        self.__abs_cycle = (1.0 / abs_hz) if abs_hz > 0.0 else 3600.0
-        self.__abs_timeout_s = 0.0 if abs_hz > 0.0 else 3600.0
+    def __init__(self, resolution: str, wheel):
+        # No ABS blinking until the car profile tells the ABS rate.
+        self.__abs_cycle = 3600.0
+        self.__abs_timeout_s = 3600.0
 
         # Initial size is 85x85
         super().__init__(
@@ -596,15 +686,19 @@ class Lock(BoxComponent):
 
         self._draw(Lock.texture_id)
 
+    def set_profile(self, profile: CarProfile) -> None:
+        abs_hz = profile.abs_hz
+        self.__abs_cycle = (1.0 / abs_hz) if abs_hz > 0.0 else 3600.0
+        self.__abs_timeout_s = 0.0 if abs_hz > 0.0 else 3600.0
+
 
 class Pressure(BoxComponent):
     """ Class to handle tire pressure draw. """
 
     texture_id = 0
 
-    def __init__(self, acd: ACD, resolution: str, wheel, window_id: int):
-        self.__calc = TirePsi(acd.get_ideal_pressure(
-            ac.getCarTyreCompound(0), wheel))
+    def __init__(self, tyres: WheelTyres, resolution: str, wheel, window_id: int):
+        self.__tyres = tyres
 
         # Initial size is 85x85
         super().__init__(
@@ -615,73 +709,64 @@ class Pressure(BoxComponent):
             Pressure.texture_id = ac.newTexture(
                 "apps/python/LiveTelemetry/img/pressure.png")
 
-        self.__lb = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb, "center")
-        ac.setCustomFont(self.__lb, "Arial", 0, 1)
+        self.__lb = Label(window_id)
 
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb, "")
+        self.__lb.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         psi = data.tire_p
-        ac.setText(self.__lb, "{:3.1f} psi".format(psi))
+        self.__lb.set_text("{:3.1f} psi".format(psi))
 
-        color = self.__calc.interpolate_color(psi)
-        ac.setFontColor(self.__lb, color[0], color[1], color[2], color[3])
+        color = self.__tyres.active.psi.interpolate_color(psi)
+        self.__lb.set_color(color)
         self._back.color = color
         self._draw(Pressure.texture_id)
 
     def resize_fonts(self, resolution: str) -> None:
-        ac.setFontSize(self.__lb, self._font)
-        ac.setPosition(
-            self.__lb, self._box.center[0], self._box.rect[1] + self._box.rect[3])
+        self.__lb.set_size(self._font)
+        self.__lb.set_position(self._box.center[0], self._box.rect[1] + self._box.rect[3])
 
 
 class RPMPower(BoxComponent):
     """ Class to handle best power change. """
 
-    def __init__(self, acd: ACD, resolution: str, window_id: int):
-        self.__calc = Power(acd.get_power_curve())
+    def __init__(self, resolution: str, window_id: int):
+        # Empty curve until the car profile is loaded.
+        self.__calc = Power()
 
         # Initial size is 512x85
         super().__init__(0.0, 0.0, 512.0, 50.0)
         self._back.color = Colors.black
 
-        self.__lb_hp = ac.addLabel(window_id, "- HP")
-        ac.setFontAlignment(self.__lb_hp, "left")
-        ac.setCustomFont(self.__lb_hp, "Arial", 0, 1)
+        self.__lb_hp = Label(window_id, "- HP", "left")
 
         # Gear + speed sit centred between HP (left) and RPM (right),
         # matching the live-telemetry-evo engine bar layout. Both kept
         # in their own labels so they can be repositioned independently
         # when the widget resolution changes.
-        self.__lb_gear = ac.addLabel(window_id, "-")
-        ac.setFontAlignment(self.__lb_gear, "center")
-        ac.setCustomFont(self.__lb_gear, "Arial", 0, 1)
+        self.__lb_gear = Label(window_id, "-")
 
-        self.__lb_speed = ac.addLabel(window_id, "- KMH")
-        ac.setFontAlignment(self.__lb_speed, "center")
-        ac.setCustomFont(self.__lb_speed, "Arial", 0, 1)
+        self.__lb_speed = Label(window_id, "- KMH")
 
-        self.__lb_rpm = ac.addLabel(window_id, "- RPM")
-        ac.setFontAlignment(self.__lb_rpm, "right")
-        ac.setCustomFont(self.__lb_rpm, "Arial", 0, 1)
+        self.__lb_rpm = Label(window_id, "- RPM", "right")
 
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb_hp, "")
-        ac.setText(self.__lb_gear, "")
-        ac.setText(self.__lb_speed, "")
-        ac.setText(self.__lb_rpm, "")
+        self.__lb_hp.set_text("")
+        self.__lb_gear.set_text("")
+        self.__lb_speed.set_text("")
+        self.__lb_rpm.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         self._draw()
 
         rpm = data.rpm
-        ratio = min(rpm / data.max_rpm, 1.0)
+        # The remote telemetry source has no maxRpm, the bar stays empty.
+        ratio = min(rpm / data.max_rpm, 1.0) if data.max_rpm > 0 else 0.0
         torque = self.__calc.interpolate(rpm)
         # kers_deploy_kw is only ever > 0 while the hybrid system is
         # actually pushing power to the wheels (button held or MCU auto-
@@ -691,12 +776,12 @@ class RPMPower(BoxComponent):
         p_bar = copy.copy(self._box.rect)
         p_bar[2] *= ratio
 
-        color = self.__calc.interpolate_color(rpm)
+        color = self.__calc.interpolate_color(rpm, data.gear)
         ac.glColor4f(*color)
         ac.glQuad(*p_bar)
 
-        ac.setFontColor(self.__lb_hp, color[0], color[1], color[2], color[3])
-        ac.setText(self.__lb_hp, "{} HP".format(hp))
+        self.__lb_hp.set_color(color)
+        self.__lb_hp.set_text("{} HP".format(hp))
         # AC1 gear convention: 0 = R, 1 = N, 2..N = forward. Map to a
         # single-char glyph so a 2-digit speed next to it still reads
         # cleanly inside the centre slot.
@@ -706,31 +791,29 @@ class RPMPower(BoxComponent):
             gear_text = "N"
         else:
             gear_text = "{}".format(data.gear - 1)
-        ac.setFontColor(self.__lb_gear, *Colors.white)
-        ac.setText(self.__lb_gear, gear_text)
-        ac.setFontColor(self.__lb_speed, *Colors.white)
-        ac.setText(self.__lb_speed, "{} KMH".format(int(data.speed_kmh)))
-        ac.setFontColor(self.__lb_rpm, color[0], color[1], color[2], color[3])
-        ac.setText(self.__lb_rpm, "{} RPM".format(rpm))
+        self.__lb_gear.set_color(Colors.white)
+        self.__lb_gear.set_text(gear_text)
+        self.__lb_speed.set_color(Colors.white)
+        self.__lb_speed.set_text("{} KMH".format(int(data.speed_kmh)))
+        self.__lb_rpm.set_color(color)
+        self.__lb_rpm.set_text("{} RPM".format(rpm))
 
     def resize_fonts(self, resolution: str) -> None:
         bottom = self._box.rect[1] + self._box.rect[3]
-        ac.setFontSize(self.__lb_hp, self._font)
-        ac.setPosition(self.__lb_hp, self._box.rect[0], bottom)
+        self.__lb_hp.set_size(self._font)
+        self.__lb_hp.set_position(self._box.rect[0], bottom)
         # Gear at 40% of the bar width, speed at 60% — symmetric around
         # the centre so the two centred labels split the middle band
         # without colliding with the HP / RPM edges.
-        ac.setFontSize(self.__lb_gear, self._font)
-        ac.setPosition(
-            self.__lb_gear,
-            self._box.rect[0] + self._box.rect[2] * 0.4, bottom)
-        ac.setFontSize(self.__lb_speed, self._font)
-        ac.setPosition(
-            self.__lb_speed,
-            self._box.rect[0] + self._box.rect[2] * 0.6, bottom)
-        ac.setFontSize(self.__lb_rpm, self._font)
-        ac.setPosition(
-            self.__lb_rpm, self._box.rect[0] + self._box.rect[2], bottom)
+        self.__lb_gear.set_size(self._font)
+        self.__lb_gear.set_position(self._box.rect[0] + self._box.rect[2] * 0.4, bottom)
+        self.__lb_speed.set_size(self._font)
+        self.__lb_speed.set_position(self._box.rect[0] + self._box.rect[2] * 0.6, bottom)
+        self.__lb_rpm.set_size(self._font)
+        self.__lb_rpm.set_position(self._box.rect[0] + self._box.rect[2], bottom)
+
+    def set_profile(self, profile: CarProfile) -> None:
+        self.__calc = profile.get_power()
 
 
 class Suspension(BoxComponent):
@@ -761,7 +844,10 @@ class Suspension(BoxComponent):
         super().__init__(
             362.0 if wheel.is_left() else 86.0, 0.0, 64.0, 256.0)
         self._back.color = Colors.white
+        self.__inner = (0.0, 0.0, 0.0, 0.0)
         self.__mult = BoxComponent.resolution_map[resolution]
+        self.__rings = []
+        self.__walls = ()
         self.resize(resolution)
 
     def draw(self, data, delta_t: float) -> None:
@@ -774,57 +860,65 @@ class Suspension(BoxComponent):
             self._back.color = Colors.blue if data.susp_v else Colors.white
         ac.glColor4f(*self._back.color)
 
-        m = self.__mult
-        rx, ry = self._box.rect[0], self._box.rect[1]
-        wall = 10.0 * m
-        body_top = ry + 34.0 * m
-        body_bot = ry + 222.0 * m
-        body_h = body_bot - body_top
-        inner_left = rx + 10.0 * m
-        inner_right = rx + 54.0 * m
-        inner_top = ry + 44.0 * m
-        inner_bot = ry + 212.0 * m
-        inner_w = inner_right - inner_left
-
-        # 4 body-frame quads (left / right / top / bottom walls).
-        ac.glQuad(rx, body_top, wall, body_h)
-        ac.glQuad(inner_right, body_top, wall, body_h)
-        ac.glQuad(inner_left, body_top, inner_w, wall)
-        ac.glQuad(inner_left, inner_bot, inner_w, wall)
-
-        # Mount-point rings — centres at (32, 22) and (32, 234) in
-        # logical coords (matches the SVG packers path).
-        self._emit_ring(rx + 32.0 * m, ry + 22.0 * m)
-        self._emit_ring(rx + 32.0 * m, ry + 234.0 * m)
+        # 4 body-frame quads and the 2 mount-point rings, built on resize.
+        for rect in self.__walls:
+            ac.glQuad(*rect)
+        for quad in self.__rings:
+            ac.glBegin(acsys.GL.Quads)
+            for vertex in quad:
+                ac.glVertex2f(*vertex)
+            ac.glEnd()
 
         # Inner travel fill — same colour as the frame; height shrinks
         # toward zero as the strut compresses.
-        fill_h = min(inner_bot - inner_top,
-                     max(0.0, (inner_bot - inner_top) * (1.0 - travel)))
+        inner_left, inner_top, inner_w, inner_h = self.__inner
+        fill_h = min(inner_h, max(0.0, inner_h * (1.0 - travel)))
         if fill_h > 0.0:
             ac.glQuad(inner_left, inner_top, inner_w, fill_h)
 
-    def _emit_ring(self, cx: float, cy: float) -> None:
+    def _ring_quads(self, cx: float, cy: float) -> list:
         """ ``_SUSP_RING_SEGMENTS`` trapezoidal quads spanning the
         annulus between the inner and outer radii. """
         m = self.__mult
         r_o = 22.0 * m
         r_i = 10.0 * m
         step = (2.0 * math.pi) / _SUSP_RING_SEGMENTS
+        quads = []
         for i in range(_SUSP_RING_SEGMENTS):
             t1 = step * i
             t2 = step * (i + 1)
             c1, s1 = math.cos(t1), math.sin(t1)
             c2, s2 = math.cos(t2), math.sin(t2)
-            ac.glBegin(acsys.GL.Quads)
-            ac.glVertex2f(cx + r_i * c1, cy + r_i * s1)
-            ac.glVertex2f(cx + r_o * c1, cy + r_o * s1)
-            ac.glVertex2f(cx + r_o * c2, cy + r_o * s2)
-            ac.glVertex2f(cx + r_i * c2, cy + r_i * s2)
-            ac.glEnd()
+            quads.append(((cx + r_i * c1, cy + r_i * s1),
+                          (cx + r_o * c1, cy + r_o * s1),
+                          (cx + r_o * c2, cy + r_o * s2),
+                          (cx + r_i * c2, cy + r_i * s2)))
+        return quads
 
     def resize_fonts(self, resolution: str) -> None:
+        """ Builds the static geometry, which only changes with the size. """
         self.__mult = BoxComponent.resolution_map[resolution]
+        m = self.__mult
+        rx, ry = self._box.rect[0], self._box.rect[1]
+        wall = 10.0 * m
+        body_top = ry + 34.0 * m
+        body_h = 188.0 * m
+        inner_left = rx + 10.0 * m
+        inner_right = rx + 54.0 * m
+        inner_w = inner_right - inner_left
+
+        # Left / right / top / bottom walls.
+        self.__walls = (
+            (rx, body_top, wall, body_h),
+            (inner_right, body_top, wall, body_h),
+            (inner_left, body_top, inner_w, wall),
+            (inner_left, ry + 212.0 * m, inner_w, wall),
+        )
+        # Mount-point rings — centres at (32, 22) and (32, 234) in
+        # logical coords (matches the SVG packers path).
+        self.__rings = (self._ring_quads(rx + 32.0 * m, ry + 22.0 * m) +
+                        self._ring_quads(rx + 32.0 * m, ry + 234.0 * m))
+        self.__inner = (inner_left, ry + 44.0 * m, inner_w, 168.0 * m)
 
 
 class Temps(BoxComponent):  # pylint: disable=too-many-instance-attributes
@@ -835,50 +929,39 @@ class Temps(BoxComponent):  # pylint: disable=too-many-instance-attributes
     visually attached to their bump under camber (AC1 can't rotate the
     glyphs themselves, but it does honour per-frame ``setPosition``). """
 
-    def __init__(self, acd: ACD, resolution: str, wheel, window_id: int):
-        self.__calc = TireTemp(acd.get_temp_curve(
-            ac.getCarTyreCompound(0), wheel))
+    def __init__(self, tyres: WheelTyres, rotation: CamberRotation, resolution: str, wheel, window_id: int):  # pylint: disable=too-many-arguments
+        self.__rotation = rotation
+        self.__tyres = tyres
         self.__wheel = wheel
 
         # Initial size is 160x256
         super().__init__(176.0, 0.0, 160.0, 256.0, font=12.0)
         self.__mult = 1.0
-        # Geometry cached in resize_fonts and consumed both by draw()
-        # (for the rotated quads) and by the per-frame label
-        # repositioning below.
-        self.__band_left = 0.0
-        self.__inner_x = 0.0
-        self.__middle_x = 0.0
-        self.__outer_x = 0.0
-        self.__top_y = 0.0
-        self.__part = 0.0
-        self.__quarter = 0.0
+        # Unrotated geometry built in resize_fonts, rotated through the
+        # shared CamberRotation: the core block quads, the bottom bumps
+        # and the top-bump centres anchoring the labels (both in
+        # inner / middle / outer order).
+        self.__anchors = ()
+        self.__bump_rects = ()
+        self.__core_rects = ()
         self.__zone_font = 8.0
         self.__core_font = 16.0
 
         # Per-zone labels. clear() blanks the text — AC has no removeLabel.
         # Arial Bold (preloaded in acMain) makes the small zone readouts
         # legible against the coloured bump quads.
-        self.__lb_i = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_i, "center")
-        ac.setCustomFont(self.__lb_i, "Arial", 0, 1)
-        self.__lb_m = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_m, "center")
-        ac.setCustomFont(self.__lb_m, "Arial", 0, 1)
-        self.__lb_o = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_o, "center")
-        ac.setCustomFont(self.__lb_o, "Arial", 0, 1)
-        self.__lb_c = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_c, "center")
-        ac.setCustomFont(self.__lb_c, "Arial", 0, 1)
+        self.__lb_i = Label(window_id)
+        self.__lb_m = Label(window_id)
+        self.__lb_o = Label(window_id)
+        self.__lb_c = Label(window_id)
 
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb_i, "")
-        ac.setText(self.__lb_m, "")
-        ac.setText(self.__lb_o, "")
-        ac.setText(self.__lb_c, "")
+        self.__lb_i.set_text("")
+        self.__lb_m.set_text("")
+        self.__lb_o.set_text("")
+        self.__lb_c.set_text("")
 
     def _zone_xs(self, pad: float, part: float) -> tuple:
         """ Returns (band_left, inner_x, middle_x, outer_x). INNER sits
@@ -891,42 +974,74 @@ class Temps(BoxComponent):  # pylint: disable=too-many-instance-attributes
             return band_left, band_left + 2.0 * part, middle_x, band_left
         return band_left, band_left, middle_x, band_left + 2.0 * part
 
-    def _draw_zone(self, temp: float, x: float, label, rot: tuple) -> None:
+    def _draw_zone(self, zone: int, label, bump: tuple, anchor: tuple) -> None:
         """ One zone column: colored text readout in the TOP bump slot
         (the bump quad is dropped so AC1 doesn't paint over the label),
         solid colored quad in the BOTTOM bump as the visual indicator.
-        ``rot = (pivot, trig)``. """
-        color = self.__calc.interpolate_color(
-            temp, self.__calc.interpolate(temp))
-        pivot, trig = rot
+        ``zone`` indexes the temperatures the wheel evaluated this update,
+        ``bump`` is the rotated bottom bump and ``anchor`` the rotated
+        top-bump centre. """
+        temp = self.__tyres.temps[zone]
+        color = self.__tyres.temp_colors[zone]
 
         # Bottom bump only — solid coloured bar at the band bottom.
         ac.glColor4f(*color)
-        self._emit_rotated_rect(
-            (x, self.__top_y + self.__quarter * 7.0,
-             self.__part, self.__quarter), pivot, trig)
+        self._emit_quads((bump,))
 
         # Top bump replaced by the value text itself, coloured in the
         # zone temp colour. AC1's render callback fires *after* UI paint
         # (per `addRenderCallback` docs), so any solid quad we emit lands
         # on top of the labels — dropping the top-bump quad lets the
         # zone readout actually show up.
-        ac.setText(label, "{}".format(int(temp)))
-        ac.setFontColor(label, *color)
+        label.set_text("{}".format(int(temp)))
+        label.set_color(color)
 
-        # Rotate the top-bump centre around the tire pivot. AC1's
-        # setPosition anchors the text by its top edge (horizontally
+        # AC1's setPosition anchors the text by its top edge (horizontally
         # centred when align=center), so subtract half the font height
         # to drop the glyph centre onto the rotated bump centre.
-        px, py = pivot
-        cx = x + self.__part * 0.5
-        cy = self.__top_y + self.__quarter * 0.5
-        rx, ry = self._rotate((cx - px, cy - py), pivot, trig)
-        ac.setPosition(label, rx, ry - self.__zone_font * 0.5)
+        label.set_position(anchor[0], anchor[1] - self.__zone_font * 0.5)
 
     def draw(self, data, delta_t: float) -> None:
-        rot = self._camber_rotation(data.camber)
-        pivot, trig = rot
+        self.__rotation.update(data.camber, self.__mult)
+
+        # Core block — framing quads around the core readout, see resize_fonts.
+        core_color = self.__tyres.temp_colors[TEMP_CORE]
+        ac.glColor4f(*core_color)
+        self._emit_quads(self.__rotation.rects("temps_core", self.__core_rects))
+
+        # Per-zone bumps + text readouts, both following the rotation.
+        bumps = self.__rotation.rects("temps_bumps", self.__bump_rects)
+        anchors = self.__rotation.points("temps_labels", self.__anchors)
+        self._draw_zone(TEMP_INNER, self.__lb_i, bumps[0], anchors[0])
+        self._draw_zone(TEMP_MIDDLE, self.__lb_m, bumps[1], anchors[1])
+        self._draw_zone(TEMP_OUTER, self.__lb_o, bumps[2], anchors[2])
+
+        # Core readout fits inside the carved gap, coloured in the core
+        # temp colour so the magnitude still reads at a glance.
+        self.__lb_c.set_text("{}°C".format(int(self.__tyres.temps[TEMP_CORE])))
+        self.__lb_c.set_color(core_color)
+        self.__lb_c.set_position(self._box.center[0],
+                                 self._box.center[1] - (self.__core_font * 0.5))
+
+    def resize_fonts(self, resolution: str) -> None:  # pylint: disable=too-many-locals
+        self.__mult = BoxComponent.resolution_map[resolution]
+        self.__zone_font = max(16.0, self._font * 1.35)
+        self.__core_font = self._font * 1.6
+        for lb in (self.__lb_i, self.__lb_m, self.__lb_o):
+            lb.set_size(self.__zone_font)
+        self.__lb_c.set_size(self.__core_font)
+
+        # Re-derive band geometry from the resized box so draw() and the
+        # per-frame label positions agree. Padding mirrors the original
+        # 12 px inset at mult=1.0.
+        pad = 12 * self.__mult
+        quarter = (self._box.rect[3] - 2.0 * pad) * 0.125
+        part = (self._box.rect[2] - 2.0 * pad) / 3.0
+        top_y = self._box.rect[1] + pad
+        band_left, inner_x, middle_x, outer_x = self._zone_xs(pad, part)
+        zone_xs = (inner_x, middle_x, outer_x)
+        self.__bump_rects = tuple((x, top_y + quarter * 7.0, part, quarter) for x in zone_xs)
+        self.__anchors = tuple((x + part * 0.5, top_y + quarter * 0.5) for x in zone_xs)
 
         # Core block — drawn as four quads that frame the centre column
         # where the core readout sits. AC1 paints labels first and GL
@@ -934,83 +1049,38 @@ class Temps(BoxComponent):  # pylint: disable=too-many-instance-attributes
         # number; the carve-out is the middle column only (inner +
         # outer columns still carry the core colour across the gap row
         # so the band doesn't read as half-empty).
-        core_color = self.__calc.interpolate_color(
-            data.tire_t_c, self.__calc.interpolate(data.tire_t_c))
-        ac.glColor4f(*core_color)
-        band_top = self.__top_y + self.__quarter
-        band_w = self.__part * 3.0
+        band_top = top_y + quarter
+        band_w = part * 3.0
         gap_h = self.__core_font * 1.4
         gap_top = self._box.center[1] - gap_h * 0.5
         gap_bot = gap_top + gap_h
         top_h = max(0.0, gap_top - band_top)
-        bot_h = max(0.0, (band_top + self.__quarter * 6.0) - gap_bot)
-        if top_h > 0.0:
-            self._emit_rotated_rect(
-                (self.__band_left, band_top, band_w, top_h), pivot, trig)
-        if bot_h > 0.0:
-            self._emit_rotated_rect(
-                (self.__band_left, gap_bot, band_w, bot_h), pivot, trig)
+        bot_h = max(0.0, (band_top + quarter * 6.0) - gap_bot)
         # Left + right side quads filling the gap row's outer edges.
         # The carve-out is wider than the middle column so a 3-digit
         # core reading (e.g. "100°C") doesn't get overpainted by the
         # filler quads — kept symmetric around the centre.
-        gap_row_h = gap_bot - gap_top
-        gap_w = self.__part * 1.8
+        gap_w = part * 1.8
         gap_left = self._box.center[0] - gap_w * 0.5
         gap_right = gap_left + gap_w
-        left_filler_w = max(0.0, gap_left - self.__band_left)
-        right_filler_w = max(
-            0.0, (self.__band_left + band_w) - gap_right)
-        if gap_row_h > 0.0:
-            if left_filler_w > 0.0:
-                self._emit_rotated_rect(
-                    (self.__band_left, gap_top,
-                     left_filler_w, gap_row_h), pivot, trig)
-            if right_filler_w > 0.0:
-                self._emit_rotated_rect(
-                    (gap_right, gap_top,
-                     right_filler_w, gap_row_h), pivot, trig)
-
-        # Per-zone bumps + text readouts (positions rotated inside _draw_zone).
-        self._draw_zone(data.tire_t_i, self.__inner_x, self.__lb_i, rot)
-        self._draw_zone(data.tire_t_m, self.__middle_x, self.__lb_m, rot)
-        self._draw_zone(data.tire_t_o, self.__outer_x, self.__lb_o, rot)
-
-        # Core readout fits inside the carved gap, coloured in the core
-        # temp colour so the magnitude still reads at a glance.
-        ac.setText(self.__lb_c, "{}°C".format(int(data.tire_t_c)))
-        ac.setFontColor(self.__lb_c, *core_color)
-        ac.setPosition(self.__lb_c, self._box.center[0],
-                       self._box.center[1] - (self.__core_font * 0.5))
-
-    def resize_fonts(self, resolution: str) -> None:
-        self.__mult = BoxComponent.resolution_map[resolution]
-        self.__zone_font = max(16.0, self._font * 1.35)
-        self.__core_font = self._font * 1.6
-        for lb in (self.__lb_i, self.__lb_m, self.__lb_o):
-            ac.setFontSize(lb, self.__zone_font)
-        ac.setFontSize(self.__lb_c, self.__core_font)
-
-        # Re-derive band geometry from the resized box so draw() and the
-        # per-frame label positions agree. Padding mirrors the original
-        # 12 px inset at mult=1.0.
-        pad = 12 * self.__mult
-        self.__quarter = (self._box.rect[3] - 2.0 * pad) * 0.125
-        self.__part = (self._box.rect[2] - 2.0 * pad) / 3.0
-        self.__top_y = self._box.rect[1] + pad
-        (self.__band_left, self.__inner_x,
-         self.__middle_x, self.__outer_x) = self._zone_xs(pad, self.__part)
+        left_filler_w = max(0.0, gap_left - band_left)
+        right_filler_w = max(0.0, (band_left + band_w) - gap_right)
+        rects = ((band_left, band_top, band_w, top_h),
+                 (band_left, gap_bot, band_w, bot_h),
+                 (band_left, gap_top, left_filler_w, gap_h),
+                 (gap_right, gap_top, right_filler_w, gap_h))
+        self.__core_rects = tuple(rect for rect in rects if rect[2] > 0.0 and rect[3] > 0.0)
 
         # Seed an initial label position so the first paint (before
         # draw() runs) has something sensible — draw() then refreshes
         # positions per-frame from the camber-rotated bump centres.
-        label_y = self.__top_y + (self.__quarter - self.__zone_font) * 0.5
-        half_part = self.__part * 0.5
-        ac.setPosition(self.__lb_i, self.__inner_x + half_part, label_y)
-        ac.setPosition(self.__lb_m, self.__middle_x + half_part, label_y)
-        ac.setPosition(self.__lb_o, self.__outer_x + half_part, label_y)
-        ac.setPosition(self.__lb_c, self._box.center[0],
-                       self._box.center[1] - (self.__core_font * 0.5))
+        label_y = top_y + (quarter - self.__zone_font) * 0.5
+        half_part = part * 0.5
+        self.__lb_i.set_position(inner_x + half_part, label_y)
+        self.__lb_m.set_position(middle_x + half_part, label_y)
+        self.__lb_o.set_position(outer_x + half_part, label_y)
+        self.__lb_c.set_position(self._box.center[0],
+                                 self._box.center[1] - (self.__core_font * 0.5))
 
 
 # Tire-shape geometry + tire-load circle constants (match evo).
@@ -1032,9 +1102,10 @@ class Tire(BoxComponent):
     around the IMO band with tread cuts on top/bottom. Rotates with
     camber around the shared tire pivot. """
 
-    def __init__(self, acd: ACD, resolution: str, wheel):
-        self.__calc = TireTemp(acd.get_temp_curve(
-            ac.getCarTyreCompound(0), wheel))
+    def __init__(self, tyres: WheelTyres, rotation: CamberRotation, resolution: str):
+        self.__body = ()
+        self.__rotation = rotation
+        self.__tyres = tyres
         # 160x256 — Temps/Dirt/Load coords depend on this footprint.
         super().__init__(176.0, 0.0, 160.0, 256.0)
         self._back.color = Colors.white
@@ -1042,16 +1113,14 @@ class Tire(BoxComponent):
 
     def draw(self, data, delta_t: float) -> None:
         """ Draws the tire. """
-        temp = data.tire_t_c * 0.75 + \
-            ((data.tire_t_i + data.tire_t_m + data.tire_t_o) / 3.0) * 0.25
-        color = self.__calc.interpolate_color(
-            temp, self.__calc.interpolate(temp))
-        ac.glColor4f(*color)
-        pivot, trig = self._camber_rotation(data.camber)
-        self._draw_body(pivot, trig)
+        # Core-weighted blend, evaluated with the other wheel temperatures.
+        ac.glColor4f(*self.__tyres.temp_colors[TEMP_TIRE])
+        self.__rotation.update(data.camber, self._mult)
+        self._emit_quads(self.__rotation.quads("tire", self.__body))
 
-    def _draw_body(self, pivot: tuple, trig: tuple) -> None:
-        """ Side + tread-cut top/bottom strips + corner fans. """
+    def resize_fonts(self, resolution: str) -> None:
+        """ Builds the body offsets from the pivot: side + tread-cut
+        top/bottom strips + corner fans. Only the rotation is per frame. """
         rect = self._box.rect
         half_w = rect[2] * 0.5
         half_h = rect[3] * 0.5
@@ -1059,12 +1128,8 @@ class Tire(BoxComponent):
         inner_w = half_w - chamfer
         inner_h = half_h - chamfer
         geom = (half_w, half_h, inner_w, inner_h)
-
-        for strip in self._side_strips(geom):
-            self._emit_rotated_quad(strip, pivot, trig)
-        for strip in self._top_bottom_strips(geom):
-            self._emit_rotated_quad(strip, pivot, trig)
-        self._draw_corner_fans(inner_w, inner_h, chamfer, pivot, trig)
+        self.__body = (self._side_strips(geom) + self._top_bottom_strips(geom) +
+                       self._corner_fans(inner_w, inner_h, chamfer))
 
     @staticmethod
     def _side_strips(geom: tuple) -> tuple:
@@ -1109,34 +1174,26 @@ class Tire(BoxComponent):
              (inner_w, half_h),   (cut_out, half_h)),
         )
 
-    def _draw_corner_fans(self, inner_w: float, inner_h: float,  # pylint: disable=too-many-arguments,too-many-positional-arguments
-                          radius: float, pivot: tuple, trig: tuple) -> None:
-        """ Four quarter-circle fans rounding the outer corners. """
+    @staticmethod
+    def _corner_fans(inner_w: float, inner_h: float, radius: float) -> tuple:
+        """ Four quarter-circle fans rounding the outer corners, each of
+        ``_TIRE_CORNER_SEGMENTS`` triangles sent as degenerate quads
+        (last vertex repeated). """
         step = (math.pi * 0.5) / _TIRE_CORNER_SEGMENTS
         specs = (
-            (-inner_w, -inner_h, math.pi,        radius, step),  # TL
-            (inner_w,  -inner_h, math.pi * 1.5,  radius, step),  # TR
-            (inner_w,   inner_h, 0.0,            radius, step),  # BR
-            (-inner_w,  inner_h, math.pi * 0.5,  radius, step),  # BL
+            (-inner_w, -inner_h, math.pi),        # TL
+            (inner_w,  -inner_h, math.pi * 1.5),  # TR
+            (inner_w,   inner_h, 0.0),            # BR
+            (-inner_w,  inner_h, math.pi * 0.5),  # BL
         )
-        for spec in specs:
-            self._emit_corner_fan(spec, pivot, trig)
-
-    def _emit_corner_fan(self, spec: tuple, pivot: tuple, trig: tuple) -> None:
-        """ ``_TIRE_CORNER_SEGMENTS`` fan triangles for one rounded
-        corner. ``spec = (fx, fy, t_start, radius, step)``. Each
-        triangle is a degenerate quad (last vertex repeated). """
-        fx, fy, t_start, radius, step = spec
-        for i in range(_TIRE_CORNER_SEGMENTS):
-            t1 = t_start + step * i
-            t2 = t1 + step
-            offsets = (
-                (fx, fy),
-                (fx + radius * math.cos(t1), fy + radius * math.sin(t1)),
-                (fx + radius * math.cos(t2), fy + radius * math.sin(t2)),
-                (fx + radius * math.cos(t2), fy + radius * math.sin(t2)),
-            )
-            self._emit_rotated_quad(offsets, pivot, trig)
+        quads = []
+        for fx, fy, t_start in specs:
+            for i in range(_TIRE_CORNER_SEGMENTS):
+                t1 = t_start + step * i
+                t2 = t1 + step
+                edge = (fx + radius * math.cos(t2), fy + radius * math.sin(t2))
+                quads.append(((fx, fy), (fx + radius * math.cos(t1), fy + radius * math.sin(t1)), edge, edge))
+        return tuple(quads)
 
 
 class Wear(BoxComponent):
@@ -1172,9 +1229,7 @@ class Wear(BoxComponent):
         self._back.border = Colors.white
         self._back.size = 1.5
 
-        self.__lb = ac.addLabel(window_id, "Tire Wear")
-        ac.setFontAlignment(self.__lb, "center")
-        ac.setCustomFont(self.__lb, "Arial", 0, 1)
+        self.__lb = Label(window_id, "Tire Wear")
         # Highest normalised tyreWear seen this session; None until the
         # first non-zero reading so we don't lock in a 0.0 baseline
         # before AC has populated the physics block.
@@ -1183,11 +1238,11 @@ class Wear(BoxComponent):
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb, "")
+        self.__lb.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
-        ac.setText(self.__lb, "Tire Wear")
-        ac.setFontColor(self.__lb, *Colors.white)
+        self.__lb.set_text("Tire Wear")
+        self.__lb.set_color(Colors.white)
 
         # Self-calibrate against the peak grip seen so far. Until AC has
         # delivered a sensible reading (>0), keep the bar pinned at
@@ -1233,9 +1288,8 @@ class Wear(BoxComponent):
             ac.glQuad(fill_x, bar_y, fill_w, bar_h)
 
     def resize_fonts(self, resolution: str) -> None:
-        ac.setFontSize(self.__lb, self._font)
-        ac.setPosition(
-            self.__lb, self._box.center[0], self._box.rect[1])
+        self.__lb.set_size(self._font)
+        self.__lb.set_position(self._box.center[0], self._box.rect[1])
 
 
 class WheelTitle(BoxComponent):
@@ -1246,13 +1300,12 @@ class WheelTitle(BoxComponent):
     (the render callback paints primitives *after* UI labels, so
     anything on top of a solid quad disappears).
 
-    Compound is published per-frame by AC's graphics block via
-    ``ac.getCarTyreCompound(0)``; we cache it on the component and
-    only re-read when the string changes (pit-stop tyre swaps
-    re-publish).
+    Compound comes from the wheel's ``WheelTyres`` selector, which the
+    wheel window feeds once per update; like every ``Label`` it is only
+    rewritten when the string changes (pit-stop tyre swaps re-publish).
     """
 
-    def __init__(self, resolution: str, wheel, window_id: int):
+    def __init__(self, tyres: WheelTyres, resolution: str, wheel, window_id: int):
         # Same x as the height widget so the wheel ID + compound and
         # the ride-height readout share a column. 64×40 leaves room
         # for the ID row (font 20) + compound row (font 14) with a
@@ -1260,44 +1313,32 @@ class WheelTitle(BoxComponent):
         super().__init__(
             448.0 if wheel.is_left() else 0.0, 4.0, 64.0, 40.0, font=20.0)
         self.__wheel = wheel
-        self.__lb_id = ac.addLabel(window_id, wheel.name())
-        ac.setFontAlignment(self.__lb_id, "center")
-        ac.setCustomFont(self.__lb_id, "Arial", 0, 1)
-        self.__lb_compound = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_compound, "center")
-        ac.setCustomFont(self.__lb_compound, "Arial", 0, 1)
-        self.__last_compound = ""
+        self.__lb_id = Label(window_id, wheel.name())
+        self.__lb_compound = Label(window_id)
+        self.__tyres = tyres
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb_id, "")
-        ac.setText(self.__lb_compound, "")
+        self.__lb_id.set_text("")
+        self.__lb_compound.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
-        ac.setText(self.__lb_id, self.__wheel.name())
-        ac.setFontColor(self.__lb_id, *Colors.white)
-
-        try:
-            compound = ac.getCarTyreCompound(0) or ""
-        except (TypeError, ValueError):
-            compound = ""
-        if compound != self.__last_compound:
-            self.__last_compound = compound
-            ac.setText(self.__lb_compound,
-                       compound[:3].upper() if compound else "")
-        ac.setFontColor(self.__lb_compound, *Colors.white)
+        self.__lb_id.set_text(self.__wheel.name())
+        self.__lb_id.set_color(Colors.white)
+
+        compound = self.__tyres.compound or ""
+        self.__lb_compound.set_text(compound[:3].upper())
+        self.__lb_compound.set_color(Colors.white)
 
     def resize_fonts(self, resolution: str) -> None:
         m = self._mult
         id_font = self._font            # 20 logical
         compound_font = self._font * 0.7  # ~14 logical
-        ac.setFontSize(self.__lb_id, id_font)
-        ac.setFontSize(self.__lb_compound, compound_font)
-        ac.setPosition(
-            self.__lb_id, self._box.center[0], self._box.rect[1])
-        ac.setPosition(
-            self.__lb_compound, self._box.center[0],
-            self._box.rect[1] + id_font + 2.0 * m)
+        self.__lb_id.set_size(id_font)
+        self.__lb_compound.set_size(compound_font)
+        self.__lb_id.set_position(self._box.center[0], self._box.rect[1])
+        self.__lb_compound.set_position(
+            self._box.center[0], self._box.rect[1] + id_font + 2.0 * m)
 
 
 # Engine widget chip / readout positions. The engine widget grew from
@@ -1318,15 +1359,12 @@ class EngineChips(BoxComponent):
         super().__init__(0.0, _ENGINE_CHIPS_Y, 512.0, _ENGINE_CHIPS_H, font=12.0)
         self.__mult = BoxComponent.resolution_map[resolution]
         # 6 label slots; populated cells centred, the rest blanked.
-        self.__labels = [ac.addLabel(window_id, "") for _ in range(6)]
-        for lb in self.__labels:
-            ac.setFontAlignment(lb, "center")
-            ac.setCustomFont(lb, "Arial", 0, 1)
+        self.__labels = [Label(window_id) for _ in range(6)]
         self.resize(resolution)
 
     def clear(self) -> None:
         for lb in self.__labels:
-            ac.setText(lb, "")
+            lb.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         chips = []
@@ -1354,16 +1392,16 @@ class EngineChips(BoxComponent):
         for idx, lb in enumerate(self.__labels):
             if idx < len(chips):
                 label, color = chips[idx]
-                ac.setText(lb, label)
-                ac.setFontColor(lb, *color)
-                ac.setPosition(lb, x_start + cell_w * (idx + 0.5), y_center)
+                lb.set_text(label)
+                lb.set_color(color)
+                lb.set_position(x_start + cell_w * (idx + 0.5), y_center)
             else:
-                ac.setText(lb, "")
+                lb.set_text("")
 
     def resize_fonts(self, resolution: str) -> None:
         self.__mult = BoxComponent.resolution_map[resolution]
         for lb in self.__labels:
-            ac.setFontSize(lb, self._font)
+            lb.set_size(self._font)
 
 
 class EngineReadouts(BoxComponent):
@@ -1378,17 +1416,13 @@ class EngineReadouts(BoxComponent):
 
     def __init__(self, resolution: str, window_id: int):
         super().__init__(0.0, _ENGINE_READOUTS_Y, 512.0, _ENGINE_READOUTS_H, font=12.0)
-        self.__lb_fuel = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_fuel, "center")
-        ac.setCustomFont(self.__lb_fuel, "Arial", 0, 1)
-        self.__lb_bbias = ac.addLabel(window_id, "")
-        ac.setFontAlignment(self.__lb_bbias, "center")
-        ac.setCustomFont(self.__lb_bbias, "Arial", 0, 1)
+        self.__lb_fuel = Label(window_id)
+        self.__lb_bbias = Label(window_id)
         self.resize(resolution)
 
     def clear(self) -> None:
-        ac.setText(self.__lb_fuel, "")
-        ac.setText(self.__lb_bbias, "")
+        self.__lb_fuel.set_text("")
+        self.__lb_bbias.set_text("")
 
     def draw(self, data, delta_t: float) -> None:
         rect = self._box.rect
@@ -1398,18 +1432,17 @@ class EngineReadouts(BoxComponent):
         # bias. The "%F" suffix on brake bias mirrors the evo widget so
         # the polarity (front-biased = higher number) is unambiguous.
         cell_w = rect[2] * 0.5
-        ac.setText(self.__lb_fuel, "FUEL {:.1f} L".format(max(0.0, data.fuel)))
-        ac.setFontColor(self.__lb_fuel, *Colors.white)
-        ac.setPosition(self.__lb_fuel, rect[0] + cell_w * 0.5, y_center)
+        self.__lb_fuel.set_text("FUEL {:.1f} L".format(max(0.0, data.fuel)))
+        self.__lb_fuel.set_color(Colors.white)
+        self.__lb_fuel.set_position(rect[0] + cell_w * 0.5, y_center)
 
         if data.brake_bias > 0.0:
-            ac.setText(self.__lb_bbias,
-                       "BBIAS {}%F".format(int(round(data.brake_bias * 100))))
-            ac.setFontColor(self.__lb_bbias, *Colors.white)
-            ac.setPosition(self.__lb_bbias, rect[0] + cell_w * 1.5, y_center)
+            self.__lb_bbias.set_text("BBIAS {}%F".format(int(round(data.brake_bias * 100))))
+            self.__lb_bbias.set_color(Colors.white)
+            self.__lb_bbias.set_position(rect[0] + cell_w * 1.5, y_center)
         else:
-            ac.setText(self.__lb_bbias, "")
+            self.__lb_bbias.set_text("")
 
     def resize_fonts(self, resolution: str) -> None:
         for lb in (self.__lb_fuel, self.__lb_bbias):
-            ac.setFontSize(lb, self._font)
+            lb.set_size(self._font)
@@ -8,10 +8,10 @@ Module to load and save app options.
 
 from configparser import ConfigParser, Error as ConfigError
 from math import floor
-from os import path
+from os import makedirs, path
 from sys import exc_info
 
-from lib.lt_util import get_docs_path, log
+from lib.lt_util import APP_CFG_DIR, get_cfg_dir, get_docs_path, log
 
 
 # Options window dimensions — a fixed AC dialog that does not scale,
@@ -74,7 +74,7 @@ class Config:
     def __init__(self, lt_version: str) -> None:
         """ Loads or creates the app configuration file. """
 
-        self.__base_path = path.join(path.dirname(path.realpath(__file__)), "..", "cfg")
+        self.__base_path = get_cfg_dir()
         settings_path = path.join(self.__base_path, "conf.ini")
 
         self.__configs = ConfigParser(allow_no_value=True, comment_prefixes=(";","#","/","_"), empty_lines_in_values=False, inline_comment_prefixes=(";","#","/","_"), strict=False)
@@ -108,6 +108,7 @@ class Config:
         """ Initializes the in-memory config with default sections and values. """
         self.__configs["About"] = {"Version": lt_version}
         self.__configs["Options"] = {}
+        self.__configs["Telemetry"] = {}
         self.__configs["Windows"] = {}
         self.__configs["Windows Positions"] = {}
 
@@ -116,16 +117,16 @@ class Config:
         self.__set_default_window_positions(height, width)
 
     def __load_documented_defaults(self) -> None:
-        """ Copies [Options] and [Windows] from settings_defaults.ini.
+        """ Copies [Options], [Telemetry] and [Windows] from settings_defaults.ini.
 
         settings_defaults.ini is the single source of truth for documented
         defaults so the runtime cannot drift from the docs. [Windows
         Positions] is computed from screen resolution instead.
         """
-        defaults_path = path.join(self.__base_path, "settings_defaults.ini")
+        defaults_path = path.join(APP_CFG_DIR, "settings_defaults.ini")
         defaults = ConfigParser(allow_no_value=True, comment_prefixes=(";","#","/","_"), empty_lines_in_values=False, inline_comment_prefixes=(";","#","/","_"), strict=False)
         defaults.read(defaults_path)
-        for section in ("Options", "Windows"):
+        for section in ("Options", "Telemetry", "Windows"):
             if defaults.has_section(section):
                 for name, value in defaults.items(section):
                     # ConfigParser keeps inline-comment-stripped values
@@ -197,6 +198,11 @@ class Config:
         """ Returns a option value as a string. """
         return self.__get_str("Options", name)
 
+    def get_telemetry_source(self) -> str:
+        """ Returns where the telemetry comes from, see lt_telemetry.open_source.
+        Configs written before the [Telemetry] section read the shared memory. """
+        return self.__configs.get("Telemetry", "source", fallback="shm")
+
     def get_version(self) -> str:
         """ Returns the config file version. """
         return self.__get_str("About", "version")
@@ -214,6 +220,7 @@ class Config:
 
     def save_config(self) -> None:
         """ Writes the actual options on the configuration file. """
+        makedirs(self.__base_path, exist_ok=True)
         with open(path.join(self.__base_path, "conf.ini"), "w", encoding="utf-8") as cfg_file:
             self.__configs.write(cfg_file)
 
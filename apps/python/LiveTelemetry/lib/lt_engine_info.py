@@ -10,7 +10,6 @@ import copy
 from lib.lt_components import (BatteryBar, BoostBar, BoxComponent,
                                EngineChips, EngineReadouts, RPMPower)
 from lib.lt_info_window import InfoWindow
-from lib.sim_info import info
 
 
 # Logical engine widget height in pixels at 1440p / mult=1.0.
@@ -104,11 +103,12 @@ class Data:  # pylint: disable=too-few-public-methods,too-many-instance-attribut
 class EngineInfo(InfoWindow):
     """ Engine info to draw and update. """
 
-    def __init__(self, acd, configs):
-        """ Default constructor. """
+    def __init__(self, configs, source):
+        """ Default constructor receives the telemetry source to read. """
         super().__init__("Live Telemetry Engine")
         self._data = Data()
-        self._info = info
+        # Read through the pages the source refreshes once per acUpdate.
+        self._info = source.pages
         self._options = {key: configs.get_bool_option(key)
                          for key in ("BoostBar", "Logging", "RPMPower")}
         # BatteryBar is a tri-state string (AUTO / ON / OFF), not a
@@ -126,9 +126,9 @@ class EngineInfo(InfoWindow):
             configs, "EN",
             int(512 * mult), int(_ENGINE_LOGICAL_H * mult))
 
-        has_turbo = info.static.maxTurboBoost > 0.0
+        has_turbo = source.read_static().maxTurboBoost > 0.0
         if has_turbo:
-            self._components.append(BoostBar(acd, size, self._window_id))
+            self._components.append(BoostBar(size, self._window_id))
         # BatteryBar is always added — it self-hides on pure-ICE cars
         # via runtime activity detection (see its docstring). We can't
         # gate on kersMaxJ at init because AC1 leaves that at 0 for
@@ -138,9 +138,9 @@ class EngineInfo(InfoWindow):
         # y=-88 (ending at y=-64) so its bar clears the boost label at
         # y≈-56 — see BatteryBar's docstring for the stack geometry.
         self._components.append(BatteryBar(
-            acd, size, self._window_id,
+            size, self._window_id,
             y_offset=-88.0 if has_turbo else -24.0))
-        self._components.append(RPMPower(acd, size, self._window_id))
+        self._components.append(RPMPower(size, self._window_id))
         # Always-on driver-aid chips + analog readouts (see lt_info_window
         # for the missing-key default-True dispatch). Cheap text-only
         # additions; hiding them would just be extra UI noise.
@@ -157,6 +157,13 @@ class EngineInfo(InfoWindow):
         for component in self._components:
             component.resize(resolution)
 
+    def tick(self, delta_t: float) -> bool:
+        """ Re-plumbs the user's BatteryBar mode every tick, new packet or
+        not — the option may have been toggled via the menu button
+        mid-session, or while paused. """
+        self._data.battery_bar_mode = self._options.get("BatteryBar", "AUTO")
+        return super().tick(delta_t)
+
     def update(self, delta_t: float):
         """ Updates the engine information.
 
@@ -172,9 +179,6 @@ class EngineInfo(InfoWindow):
         prev_charge = self._data.kers_charge
         prev_kw = self._data.kers_deploy_kw
         self._data.update(self._info)
-        # Re-plumb the user's BatteryBar mode every tick — the option
-        # may have been toggled via the menu button mid-session.
-        self._data.battery_bar_mode = self._options.get("BatteryBar", "AUTO")
         if delta_t > 0.0 and self._data.kers_charge < prev_charge:
             raw_kw = max(
                 0.0, (self._data.kers_current_kj - prev_kj) / delta_t)
@@ -9,6 +9,7 @@ Owns the AC window handle and the shared component/draw plumbing.
 import ac
 
 from lib.lt_colors import Colors
+from lib.lt_components import Label
 from lib.lt_config import anchor_to_top_left, top_left_to_anchor
 
 
@@ -21,7 +22,16 @@ class InfoWindow:
         self._components = []
         self._data = None
         self._data_log = []
+        # Last physics / graphics packetId the window processed, see tick.
+        self._graphics_id = None
+        self._info = None
+        self._loading = False
         self._options = {}
+        self._physics_id = None
+        # Time of the ticks skipped since the last update, see tick.
+        self._skipped_t = 0.0
+        self._ticks_processed = 0
+        self._ticks_skipped = 0
         self._widget_w = 0
         self._widget_h = 0
         self._window_id = ac.newApp(title)
@@ -29,6 +39,8 @@ class InfoWindow:
         ac.setBackgroundOpacity(self._window_id, 0.0)
         ac.setIconPosition(self._window_id, 0, -10000)
         ac.setTitle(self._window_id, "")
+        self.__lb_loading = Label(self._window_id)
+        self.__lb_loading.set_color(Colors.white)
 
     def _apply_initial_geometry(self, configs, name: str, width: int, height: int) -> None:
         """ Sets the window size and positions it from the persisted
@@ -54,6 +66,8 @@ class InfoWindow:
         ac.setPosition(self._window_id, new_tl[0], new_tl[1])
         self._widget_w = new_w
         self._widget_h = new_h
+        # A Size cycle while the car data loads keeps the message centered.
+        self.__lb_loading.set_position(new_w / 2.0, new_h / 2.0)
 
     def get_anchor_position(self):
         """ Returns the current window position in anchor-space coords
@@ -89,6 +103,11 @@ class InfoWindow:
         """ Returns the window id. """
         return self._window_id
 
+    def get_tick_counts(self) -> tuple:
+        """ Returns how many ticks ran the update and how many were
+        skipped because AC published no new physics packet. """
+        return (self._ticks_processed, self._ticks_skipped)
+
     def has_data_logged(self) -> bool:
         """ Returns if the info has data logged. """
         return len(self._data_log) > 0
@@ -101,13 +120,59 @@ class InfoWindow:
         """ Toggles the window status. """
         self._active = active
 
+    def set_loading(self, loading: bool) -> None:
+        """ Toggles the loading state: while the car data loads in the
+        background only a loading message is drawn. """
+        self._loading = loading
+        if loading:
+            for component in self._components:
+                component.clear()
+        self.__lb_loading.set_text("Loading car data..." if loading else "")
+        self.__lb_loading.set_position(self._widget_w / 2.0, self._widget_h / 2.0)
+
+    def set_profile(self, profile) -> None:
+        """ Hands the loaded car profile to every component and leaves
+        the loading state. """
+        for component in self._components:
+            component.set_profile(profile)
+        self.set_loading(False)
+
     def set_option(self, name, value) -> None:
         """ Updates an option value. """
         self._options[name] = value
 
+    def tick(self, delta_t: float) -> bool:
+        """ Runs ``update`` (and its logging) only when AC published a new
+        physics packet since the last one this window processed, which
+        skips the repeated ticks of high frame rates and pauses. A new
+        graphics packet alone only refreshes the timestamp. ``update``
+        gets the time since the last update, skipped ticks included, so
+        rates over it stay per second. Returns if the window updated. """
+        physics_id = self._info.physics.packetId
+        graphics_id = self._info.graphics.packetId
+        if physics_id != self._physics_id:
+            self._physics_id = physics_id
+            self._graphics_id = graphics_id
+            self._ticks_processed += 1
+            elapsed = self._skipped_t + delta_t
+            self._skipped_t = 0.0
+            self.update(elapsed)
+            return True
+        if graphics_id != self._graphics_id:
+            self._graphics_id = graphics_id
+            self._data.timestamp = self._info.graphics.iCurrentTime
+        self._skipped_t += delta_t
+        self._ticks_skipped += 1
+        return False
+
+    def update(self, delta_t: float) -> None:
+        """ Reads the current tick into the window data. Must be overrided. """
+
     def draw(self, delta_t: float) -> None:
         """ Draws all enabled components on screen. """
         ac.setBackgroundOpacity(self._window_id, 0.0)
+        if self._loading:
+            return
         for component in self._components:
             # `.get(..., True)` so always-on components added in 1.8.0
             # (Compound, EngineChips, EngineReadouts) render without
@@ -5,70 +5,170 @@ Handles wheel interpolations and colors.
 
 @author: albertowd
 """
+from bisect import bisect_right
+import math
+
 from lib.lt_colors import Colors
 from lib.lt_util import color_interpolate
 
+# AC's embedded Python doesn't ship NumPy, the batch interpolation falls
+# back to plain Python there.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Sampling steps of the colour tables, small enough that the quantized
+# colour stays within a couple of percent of the exact one. The pressure
+# step is a fraction of the reference, the same for every car.
+GRIP_COLOR_STEP = 0.0002
+PSI_COLOR_STEP = 0.002
+RPM_COLOR_STEP = 10.0
+
+# RPM step of the upshift search, in RPM.
+SHIFT_RPM_STEP = 10.0
+
+# Upper bound of colour table entries, mod curves spanning absurd ranges
+# get a coarser step instead of a huge table.
+COLOR_TABLE_MAX_SIZE = 8192
+
+
+def parse_lut(content="", normalize=False) -> list:
+    """ Parses an inner '.lut' ACD file content into ``(x, y)`` points. """
+    points = []
+    lines = content.split("\n")
+    for line in lines:
+        if len(line) > 0:
+            values = line.split("|")
+            values[0] = float(values[0])
+            values[1] = float(values[1])
+            if normalize:
+                values[1] /= 100.0
+            points.append((values[0], values[1]))
+    return points
+
+
+class ColorTable:  # pylint: disable=too-few-public-methods
+    """ A colour function sampled once on ``[low, high]`` at a fixed step.
+
+    ``function`` must be constant below ``low`` and above ``high``, those
+    two colours answer every value outside the range. Lookups round to
+    the nearest sample and return shared RGBA tuples, nothing is
+    allocated per call.
+    """
+
+    def __init__(self, function, low: float, high: float, step: float):
+        if high < low:
+            high = low
+        count = int(math.ceil((high - low) / step)) + 1
+        if count > COLOR_TABLE_MAX_SIZE:
+            count = COLOR_TABLE_MAX_SIZE
+            step = (high - low) / (count - 1)
+        self.__above = tuple(function(high + step))
+        self.__below = tuple(function(low - step))
+        self.__colors = [tuple(function(low + i * step)) for i in range(count)]
+        self.__high = high
+        self.__inv_step = 1.0 / step
+        self.__low = low
+
+    def lookup(self, value: float) -> tuple:
+        """ Returns the colour of the sample nearest to the value. """
+        if value < self.__low:
+            return self.__below
+        if not value <= self.__high:
+            return self.__above
+        return self.__colors[int((value - self.__low) * self.__inv_step + 0.5)]
+
 
 class Curve:  # pylint: disable=too-few-public-methods
     """ Handles default curve interpolation. """
 
-    def __init__(self, content="", normalize=False):
-        """ Default constructor receives an inner '.lut' ACD file content. """
+    def __init__(self, content="", normalize=False, points=None):
+        """ Default constructor receives an inner '.lut' ACD file content
+        or its already parsed ``(x, y)`` points. """
         self._curve = []
         self._max = (0.0, 0.0)
+        self._sorted = True
+        self._strict = False
+        self._xs = []
+        self._ys = []
+
+        if points is None:
+            points = parse_lut(content, normalize)
+        self._set_points(points)
+
+    def _scan(self, current: float) -> int:
+        """ Linear search for the (rare) curves not sorted by x, where
+        bisect would disagree with the first-match semantics. """
+        for index, x_value in enumerate(self._xs):
+            if current < x_value:
+                return index
+        return len(self._xs)
 
-        lines = content.split("\n")
-        for line in lines:
-            if len(line) > 0:
-                values = line.split("|")
-                values[0] = float(values[0])
-                values[1] = float(values[1])
-                if normalize:
-                    values[1] /= 100.0
-                self._curve.append((values[0], values[1]))
+    def _set_points(self, points) -> None:
+        """ Stores the breakpoints as parallel x / y lists for bisect. """
+        self._curve = [(point[0], point[1]) for point in points]
+        self._max = (0.0, 0.0)
+        for point in self._curve:
+            if point[1] > self._max[1]:
+                self._max = point
 
-                if values[1] > self._max[1]:
-                    self._max = (values[0], values[1])
+        self._xs = [point[0] for point in self._curve]
+        self._ys = [point[1] for point in self._curve]
+        self._sorted = all(x_0 <= x_1 for x_0, x_1 in zip(self._xs, self._xs[1:]))
+        # numpy.interp only agrees with interpolate on strictly increasing x.
+        self._strict = len(self._xs) > 0 and all(x_0 < x_1 for x_0, x_1 in zip(self._xs, self._xs[1:]))
 
     def interpolate(self, current: float) -> float:
-        """ Interpolates the current value in the curve. """
-        for index, point in enumerate(self._curve):
-            if current < point[0]:
-                if index == 0:
-                    return point[1]
-                p_point = self._curve[index - 1]
-                p_diff = point[0] - p_point[0]
-                c_diff = (current - p_point[0]) / p_diff
-                v_diff = point[1] - p_point[1]
-                return p_point[1] + (v_diff * c_diff)
-        return self._curve[-1][1] if len(self._curve) > 0 else 0.0
+        """ Interpolates the current value in the curve, clamped to the
+        first / last value outside of it. """
+        xs = self._xs
+        ys = self._ys
+        # First breakpoint above the value, the segment ends on it.
+        index = bisect_right(xs, current) if self._sorted else self._scan(current)
+        if index < len(xs):
+            if index == 0:
+                return ys[0]
+            p_x = xs[index - 1]
+            p_diff = xs[index] - p_x
+            c_diff = (current - p_x) / p_diff
+            v_diff = ys[index] - ys[index - 1]
+            return ys[index - 1] + (v_diff * c_diff)
+        return ys[-1] if len(ys) > 0 else 0.0
+
+    def interpolate_many(self, values) -> list:
+        """ Interpolates a sequence of values in one call, through NumPy
+        when it's available. """
+        if numpy is not None and self._strict:
+            return numpy.interp(values, self._xs, self._ys).tolist()
+        return [self.interpolate(value) for value in values]
 
 
 class Power(Curve):
     """ Handles power interpolations. """
 
-    def __init__(self, content=""):
-        """ Default constructor receives an inner '.lut' ACD file content. """
-        super().__init__(content)
-
-        new_curve = []
-        self._max = (0.0, 0.0)
+    def __init__(self, content="", points=None, shift_rpm=()):
+        """ Default constructor receives an inner '.lut' ACD file content
+        or its already parsed ``(rpm, torque)`` points, and optionally the
+        shift RPM of each AC gear index (0 where there's no shift hint). """
+        super().__init__(content, points=points)
 
         # Processes the curve to HP values
+        new_curve = []
         for point in self._curve:
             rpm = point[0]
             torque = point[1]
-            new_point = (rpm, (torque * rpm) / 5252)
-
-            if new_point[1] > self._max[1]:
-                self._max = new_point
+            new_curve.append((rpm, (torque * rpm) / 5252))
 
-            new_curve.append(new_point)
+        self._set_points(new_curve)
+        self.__colors = ColorTable(self._color, self._xs[0] if self._xs else 0.0,
+                                   self._xs[-1] if self._xs else 0.0, RPM_COLOR_STEP)
+        self.__shift_rpm = tuple(shift_rpm)
 
-        self._curve = new_curve
-
-    def interpolate_color(self, rpm: int) -> list:
-        """ Interpolates the power color thourgh the current RPM value. """
+    def _color(self, rpm: float) -> tuple:
+        """ Exact power color of a RPM value, sampled into the color table. """
+        if self._max[1] <= 0.0:
+            return Colors.white
         perc = self.interpolate(rpm) / self._max[1]
         if perc < 0.995:
             if rpm < self._max[0]:
@@ -78,6 +178,46 @@ class Power(Curve):
             return Colors.red
         return Colors.green
 
+    def compute_shift_rpm(self, ratios, limiter: float = 0.0) -> list:
+        """ Returns the upshift RPM by AC gear index (0 = R, 1 = N, 2 = 1st
+        gear, ...): the first RPM from peak power on where the engine,
+        dropped to the next gear's RPM, already makes more power than it
+        does now. Shifting when it never crosses before the limiter (or
+        the curve end) is at the limiter. 0 where there's no hint. """
+        table = [0.0] * (len(ratios) + 2)
+        if self._max[1] <= 0.0:
+            return table
+
+        end = self._xs[-1] if limiter <= 0.0 else min(self._xs[-1], limiter)
+        for gear in range(len(ratios) - 1):
+            if not 0.0 < ratios[gear + 1] < ratios[gear]:
+                continue
+            drop = ratios[gear + 1] / ratios[gear]
+            shift = end
+            rpm = self._max[0]
+            while rpm < end:
+                if self.interpolate(rpm) < self.interpolate(rpm * drop):
+                    shift = rpm
+                    break
+                rpm += SHIFT_RPM_STEP
+            table[gear + 2] = shift
+        return table
+
+    def interpolate_color(self, rpm: int, gear: int = -1) -> tuple:
+        """ Interpolates the power color thourgh the current RPM value.
+
+        With a shift RPM for the gear, green means the next gear already
+        gives more power and the peak band turns blue (hold) below it,
+        past peak power included when the shift RPM is above the band.
+        Otherwise it's the plain band around peak power. """
+        color = self.__colors.lookup(rpm)
+        if 0 <= gear < len(self.__shift_rpm) and self.__shift_rpm[gear] > 0.0:
+            if rpm >= self.__shift_rpm[gear]:
+                return Colors.green
+            if color in (Colors.green, Colors.red):
+                return Colors.blue
+        return color
+
 
 class TirePsi:
     """ Handles tire pressure interpolations. """
@@ -85,13 +225,11 @@ class TirePsi:
     def __init__(self, ref=26.0):
         """ Default constructor receives a reference value. """
         self.__ref = ref
+        # Blue below 95% and red above 105% of the reference.
+        self.__colors = ColorTable(self._color, ref * 0.95, ref * 1.05, ref * PSI_COLOR_STEP)
 
-    def interpolate(self, psi: float) -> float:
-        """ Returns the normalized psi. """
-        return psi / self.__ref
-
-    def interpolate_color(self, psi: float) -> list:
-        """ Interpolates the pressure color through the current value. """
+    def _color(self, psi: float) -> tuple:
+        """ Exact pressure color of a value, sampled into the color table. """
         perc = self.interpolate(psi)
         if perc < 0.95:
             return Colors.blue
@@ -101,16 +239,58 @@ class TirePsi:
             return color_interpolate(Colors.green, Colors.red, max(0.0, perc - 1.00) / 0.05)
         return Colors.red
 
+    def interpolate(self, psi: float) -> float:
+        """ Returns the normalized psi. """
+        return psi / self.__ref
+
+    def interpolate_color(self, psi: float) -> tuple:
+        """ Interpolates the pressure color through the current value. """
+        return self.__colors.lookup(psi)
+
 
 class TireTemp(Curve):
     """ Handles tire temperature interpolations. """
 
-    def __init__(self, content="") -> None:
-        """ Default constructor receives an inner '.lut' ACD file content. """
-        super().__init__(content)
+    def __init__(self, content="", points=None) -> None:
+        """ Default constructor receives an inner '.lut' ACD file content
+        or its already parsed ``(temp, grip)`` points. """
+        super().__init__(content, points=points)
+        # The color blends into green over the last 2% of grip, from blue
+        # below the grip peak temperature and from red above it. One table
+        # per side, keyed by grip: the grip never goes past the curve's
+        # peak, and below 98% the color is constant.
+        self.__peak = self._max[0]
+        high = max(0.98, self._max[1])
+        self.__cold_colors = ColorTable(self._cold_color, 0.98, high, GRIP_COLOR_STEP)
+        self.__hot_colors = ColorTable(self._hot_color, 0.98, high, GRIP_COLOR_STEP)
+
+    @staticmethod
+    def _cold_color(grip: float) -> tuple:
+        """ Exact color of a grip below the grip peak temperature. """
+        return color_interpolate(Colors.blue, Colors.green, max(0.0, grip - 0.98) / 0.02)
 
-    def interpolate_color(self, temp: float, interpolated: float) -> list:
-        """ Interpolates the temperature color through the interpolated value. """
+    def _color(self, temp: float) -> tuple:
+        """ Exact temperature color, sampled into the color tables. """
         if temp < self._max[0]:
-            return color_interpolate(Colors.blue, Colors.green, max(0.0, interpolated - 0.98) / 0.02)
-        return color_interpolate(Colors.red, Colors.green, max(0.0, interpolated - 0.98) / 0.02)
+            return self._cold_color(self.interpolate(temp))
+        return self._hot_color(self.interpolate(temp))
+
+    @staticmethod
+    def _hot_color(grip: float) -> tuple:
+        """ Exact color of a grip from the grip peak temperature on. """
+        return color_interpolate(Colors.red, Colors.green, max(0.0, grip - 0.98) / 0.02)
+
+    def interpolate_color(self, temp: float, grip: float = None) -> tuple:
+        """ Interpolates the temperature color through the current value
+        and its grip, interpolated here when not given. """
+        if grip is None:
+            grip = self.interpolate(temp)
+        if temp < self.__peak:
+            return self.__cold_colors.lookup(grip)
+        return self.__hot_colors.lookup(grip)
+
+    def interpolate_colors(self, temps) -> tuple:
+        """ Returns the grips and the colors of a sequence of temperatures,
+        evaluating the curve once for all of them. """
+        grips = self.interpolate_many(temps)
+        return grips, [self.interpolate_color(temp, grip) for temp, grip in zip(temps, grips)]
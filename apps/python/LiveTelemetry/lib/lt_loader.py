@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module to load the car profile without blocking AC's loading screen.
+
+@author: albertowd
+"""
+
+from sys import exc_info
+import threading
+import time
+
+from lib.lt_cache import CarCache
+from lib.lt_profile import CarProfile, load_profile
+from lib.lt_util import log
+
+# Loads the car data inside acMain instead, the way the app did before
+# the loader thread, so both startup times can be measured.
+BLOCKING_LOAD_ENV = "LT_BLOCKING_LOAD"
+
+
+class ProfileLoader:
+    """ Loads the car profile on a daemon thread.
+
+    The worker only touches the car files and the cache, never the ``ac``
+    module: its log messages are queued by ``log`` and the finished
+    profile is handed over through ``poll``, which the main thread calls
+    from acUpdate so the swap never happens in the middle of a frame.
+    """
+
+    def __init__(self, car_path: str):
+        """ Default constructor receives the car folder path. """
+        self.__car_path = car_path
+        self.__done = threading.Event()
+        self.__elapsed = 0.0
+        self.__profile = None
+        self.__thread = threading.Thread(target=self.__run, name="LiveTelemetryLoader")
+        self.__thread.daemon = True
+
+    def __run(self) -> None:
+        """ Worker body, always ends with a profile, empty when loading failed. """
+        start = time.perf_counter()
+        try:
+            self.__profile = load_profile(self.__car_path, CarCache(self.__car_path))
+        except Exception:  # pylint: disable=broad-except
+            log("Failed to load car data, widgets will use neutral defaults:")
+            for info in exc_info():
+                log(info)
+            self.__profile = CarProfile()
+        self.__elapsed = time.perf_counter() - start
+        self.__done.set()
+
+    def get_elapsed(self) -> float:
+        """ Returns how many seconds the worker took to load the profile. """
+        return self.__elapsed
+
+    def poll(self):
+        """ Returns the loaded profile once, None while it is loading or
+        after it was already handed over. """
+        if not self.__done.is_set() or self.__profile is None:
+            return None
+        profile = self.__profile
+        self.__profile = None
+        return profile
+
+    def load(self) -> None:
+        """ Loads in the calling thread, returns once the profile is ready. """
+        self.__run()
+
+    def start(self) -> None:
+        """ Starts loading in the background. """
+        self.__thread.start()
@@ -12,14 +12,13 @@ import ac
 
 from lib.lt_colors import Colors
 from lib.lt_config import Config
-from lib.sim_info import info
 
 
 class OptionsInfo:
     """ Options info to change app options while in game. """
 
-    def __init__(self, configs: Config):
-        """ Default constructor. """
+    def __init__(self, configs: Config, source):
+        """ Default constructor receives the telemetry source to read. """
         self.__buttons = {}
         bool_keys = ("Camber", "Dirt", "Height", "Load", "Lock", "Logging",
                      "Pressure", "RPMPower", "Suspension", "Temps", "Tire", "Wear")
@@ -32,7 +31,7 @@ class OptionsInfo:
         self.__options["BatteryBar"] = configs.get_option("BatteryBar")
 
         # Only expose BoostBar toggle for turbocharged cars.
-        if info.static.maxTurboBoost > 0.0:
+        if source.read_static().maxTurboBoost > 0.0:
             self.__options["BoostBar"] = configs.get_bool_option("BoostBar")
 
         self.__window_id = ac.newApp("Live Telemetry")
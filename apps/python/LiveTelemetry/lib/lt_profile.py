@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module to compile, once per car, every curve and constant the widgets need.
+
+@author: albertowd
+"""
+
+from array import array
+from configparser import Error as ConfigError
+from sys import exc_info
+
+from lib.lt_acd import ACD, get_tire_name
+from lib.lt_colors import Colors
+from lib.lt_interpolation import Curve, Power, TirePsi, TireTemp, parse_lut
+from lib.lt_util import WheelPos, log
+
+
+# Axle name by WheelPos.is_front(), matching the tyres.ini section prefixes.
+_AXLES = ("FRONT", "REAR")
+_AXLE_WHEELS = {"FRONT": WheelPos(0), "REAR": WheelPos(2)}
+
+# Ideal pressure used when a compound can't be resolved, same as TirePsi's.
+_DEFAULT_IDEAL_PSI = 26.0
+
+# Positions of the wheel temperatures evaluated by WheelTyres.update_temps.
+TEMP_CORE = 0
+TEMP_INNER = 1
+TEMP_MIDDLE = 2
+TEMP_OUTER = 3
+TEMP_TIRE = 4
+
+
+def _to_arrays(points) -> tuple:
+    """ Splits ``(x, y)`` points into two compact float arrays. """
+    return (array("d", [point[0] for point in points]),
+            array("d", [point[1] for point in points]))
+
+
+def _to_points(arrays: tuple) -> list:
+    """ Inverse of ``_to_arrays``. """
+    return list(zip(arrays[0], arrays[1]))
+
+
+class TyreCompound:  # pylint: disable=too-few-public-methods
+    """ One tyres.ini compound section of one axle. """
+
+    def __init__(self, section="", short_name="", ideal_pressure=_DEFAULT_IDEAL_PSI,
+                 temp_curve=None, wear_curve=None):  # pylint: disable=too-many-arguments
+        self.ideal_pressure = ideal_pressure
+        self.section = section
+        self.short_name = short_name
+        self.temp_curve = temp_curve or (array("d"), array("d"))
+        self.wear_curve = wear_curve or (array("d"), array("d"))
+
+    @classmethod
+    def from_dict(cls, values: dict):
+        """ Rebuilds a compound from ``to_dict`` output. """
+        return cls(values["section"], values["short_name"], float(values["ideal_pressure"]),
+                   (array("d", values["temp_curve"][0]), array("d", values["temp_curve"][1])),
+                   (array("d", values["wear_curve"][0]), array("d", values["wear_curve"][1])))
+
+    def to_dict(self) -> dict:
+        """ Returns a JSON-friendly copy of the compound. """
+        return {
+            "ideal_pressure": self.ideal_pressure,
+            "section": self.section,
+            "short_name": self.short_name,
+            "temp_curve": [list(self.temp_curve[0]), list(self.temp_curve[1])],
+            "wear_curve": [list(self.wear_curve[0]), list(self.wear_curve[1])],
+        }
+
+
+class CarProfile:
+    """ Every curve and constant the widgets read from the car data,
+    compiled in one pass so all components share the same objects.
+
+    Curves are kept as pairs of float arrays; the ``Power`` and
+    ``TireTemp`` interpolators built from them are created on first use
+    and shared afterwards. ``to_dict`` / ``from_dict`` round-trip the
+    profile through the car cache so a warm start never opens data.acd.
+    """
+
+    def __init__(self):
+        self.abs_hz = 0.0
+        self.abs_slip_limit = 0.2
+        self.power_curve = (array("d"), array("d"))
+        # Upshift RPM by AC gear index, see Power.compute_shift_rpm. Empty
+        # when drivetrain.ini can't be read and the bar keeps the band.
+        self.shift_rpm = []
+        # Per axle: compounds by section, section by SHORT_NAME and the
+        # [COMPOUND_DEFAULT] section used when no SHORT_NAME matches.
+        self.tyres = {axle: {} for axle in _AXLES}
+        self.tyre_names = {axle: {} for axle in _AXLES}
+        self.tyre_defaults = {axle: "" for axle in _AXLES}
+        self.__power = None
+        self.__tyre_sets = {}
+
+    @staticmethod
+    def __compile_compound(acd: ACD, short_name: str, wheel: WheelPos):
+        """ Resolves and compiles one compound, None when it can't be parsed. """
+        try:
+            return TyreCompound(
+                get_tire_name(short_name, acd.get_config("tyres.ini"), wheel), short_name,
+                acd.get_ideal_pressure(short_name, wheel),
+                _to_arrays(parse_lut(acd.get_temp_curve(short_name, wheel))),
+                _to_arrays(parse_lut(acd.get_wear_curve(short_name, wheel))))
+        except Exception:  # pylint: disable=broad-except
+            log("Skipping tire compound '{}' on {}.".format(short_name, "front" if wheel.is_front() else "rear"))
+            return None
+
+    @classmethod
+    def from_acd(cls, acd: ACD):
+        """ Compiles the profile from the car's data files. """
+        profile = cls()
+        profile.abs_slip_limit = acd.get_abs_slip_limit()
+        try:
+            profile.abs_hz = acd.get_abs_hz()
+        except Exception:  # pylint: disable=broad-except
+            profile.abs_hz = 0.0
+        try:
+            profile.power_curve = _to_arrays(parse_lut(acd.get_power_curve()))
+        except Exception:  # pylint: disable=broad-except
+            log("Car has no usable power curve.")
+        try:
+            profile.shift_rpm = Power(points=_to_points(profile.power_curve)).compute_shift_rpm(
+                acd.get_gear_ratios(), get_limiter(acd))
+        except Exception:  # pylint: disable=broad-except
+            log("Car has no usable gear ratios, the RPM bar keeps the peak power band.")
+
+        try:
+            config = acd.get_config("tyres.ini")
+        except ConfigError:
+            log("Failed to parse tyres.ini:")
+            for info in exc_info():
+                log(info)
+            return profile
+
+        for axle in _AXLES:
+            # Every SHORT_NAME of the axle plus "" (which never matches a
+            # SHORT_NAME) to resolve the [COMPOUND_DEFAULT] section, all
+            # through the same get_tire_name logic the ACD getters use.
+            short_names = [""]
+            for section in config.sections():
+                if section.startswith(axle) and config.has_option(section, "SHORT_NAME"):
+                    short_names.append(config.get(section, "SHORT_NAME"))
+            for short_name in short_names:
+                compound = profile.__compile_compound(acd, short_name, _AXLE_WHEELS[axle])
+                if compound is None:
+                    continue
+                profile.tyres[axle].setdefault(compound.section, compound)
+                if short_name == "":
+                    profile.tyre_defaults[axle] = compound.section
+                else:
+                    profile.tyre_names[axle].setdefault(short_name, compound.section)
+
+        return profile
+
+    @classmethod
+    def from_dict(cls, values: dict):
+        """ Rebuilds a profile from ``to_dict`` output. """
+        profile = cls()
+        profile.abs_hz = float(values["abs_hz"])
+        profile.abs_slip_limit = float(values["abs_slip_limit"])
+        profile.power_curve = (array("d", values["power_curve"][0]), array("d", values["power_curve"][1]))
+        profile.shift_rpm = [float(rpm) for rpm in values["shift_rpm"]]
+        for axle in _AXLES:
+            axle_values = values["tyres"][axle]
+            profile.tyres[axle] = {section: TyreCompound.from_dict(compound)
+                                   for section, compound in axle_values["compounds"].items()}
+            profile.tyre_names[axle] = dict(axle_values["names"])
+            profile.tyre_defaults[axle] = axle_values["default"]
+        return profile
+
+    def get_compound(self, compound: str, wheel) -> TyreCompound:
+        """ Returns the compound section by SHORT_NAME, the default one when
+        nothing matches, or a neutral placeholder when the car has none. """
+        axle = _AXLES[0] if wheel.is_front() else _AXLES[1]
+        section = self.tyre_names[axle].get(compound, self.tyre_defaults[axle])
+        if section in self.tyres[axle]:
+            return self.tyres[axle][section]
+        return TyreCompound()
+
+    def get_power(self) -> Power:
+        """ Returns the shared rpm x power interpolator. """
+        if self.__power is None:
+            self.__power = Power(points=_to_points(self.power_curve), shift_rpm=self.shift_rpm)
+        return self.__power
+
+    def get_tyre_set(self, compound: str, wheel):
+        """ Returns the shared interpolators of a compound. """
+        tyre = self.get_compound(compound, wheel)
+        key = (_AXLES[0] if wheel.is_front() else _AXLES[1], tyre.section)
+        if key not in self.__tyre_sets:
+            self.__tyre_sets[key] = TyreSet(tyre)
+        return self.__tyre_sets[key]
+
+    def to_dict(self) -> dict:
+        """ Returns a JSON-friendly copy of the profile. """
+        return {
+            "abs_hz": self.abs_hz,
+            "abs_slip_limit": self.abs_slip_limit,
+            "power_curve": [list(self.power_curve[0]), list(self.power_curve[1])],
+            "shift_rpm": list(self.shift_rpm),
+            "tyres": {axle: {
+                "compounds": {section: compound.to_dict() for section, compound in self.tyres[axle].items()},
+                "names": self.tyre_names[axle],
+                "default": self.tyre_defaults[axle],
+            } for axle in _AXLES},
+        }
+
+
+class TyreSet:  # pylint: disable=too-few-public-methods
+    """ Ready to use interpolators of one compound. """
+
+    def __init__(self, compound: TyreCompound):
+        # Nonsense mod values fall back to TirePsi's 26 psi default.
+        self.ideal_pressure = compound.ideal_pressure if compound.ideal_pressure > 0.0 else _DEFAULT_IDEAL_PSI
+        self.psi = TirePsi(self.ideal_pressure)
+        self.section = compound.section
+        self.temp = TireTemp(points=_to_points(compound.temp_curve))
+        self.wear = Curve(points=_to_points(compound.wear_curve))
+
+
+class WheelTyres:
+    """ Selects the active compound of one wheel among every compound of
+    its axle, all built as soon as the car profile is set. A pit-stop
+    compound swap is then a dictionary lookup instead of a data.acd read.
+    It also evaluates the wheel temperatures once per update for the
+    components drawing them. """
+
+    def __init__(self, profile: CarProfile, wheel):
+        self.__default = None
+        self.__sets = {}
+        self.__wheel = wheel
+        self.active = None
+        self.compound = None
+        self.temp_colors = [Colors.white] * 5
+        self.temps = (0.0,) * 5
+        self.set_profile(profile)
+
+    def select(self, compound: str) -> bool:
+        """ Switches the active set when the compound changed, returns if it did. """
+        if compound == self.compound:
+            return False
+        self.compound = compound
+        self.active = self.__sets.get(compound, self.__default)
+        return True
+
+    def set_profile(self, profile: CarProfile) -> None:
+        """ Rebuilds the sets from another profile, keeping the compound. """
+        axle = _AXLES[0] if self.__wheel.is_front() else _AXLES[1]
+        self.__default = profile.get_tyre_set("", self.__wheel)
+        self.__sets = {name: profile.get_tyre_set(name, self.__wheel) for name in profile.tyre_names[axle]}
+        compound, self.compound = self.compound, None
+        self.active = self.__default
+        if compound is not None:
+            self.select(compound)
+
+    def update_temps(self, data) -> None:
+        """ Evaluates the active compound curve once per update for every
+        temperature the wheel draws, indexed by the TEMP_* constants: core,
+        inner, middle, outer and the blend the Tire body shows. Their grips
+        pick the colors, the components only read the results. """
+        tire = data.tire_t_c * 0.75 + ((data.tire_t_i + data.tire_t_m + data.tire_t_o) / 3.0) * 0.25
+        self.temps = (data.tire_t_c, data.tire_t_i, data.tire_t_m, data.tire_t_o, tire)
+        _grips, self.temp_colors = self.active.temp.interpolate_colors(self.temps)
+
+
+def get_limiter(acd: ACD) -> float:
+    """ Returns the engine.ini rev limiter, 0 when the car doesn't set one. """
+    config = acd.get_config("engine.ini")
+    if config.has_option("ENGINE_DATA", "LIMITER"):
+        return float(config.get("ENGINE_DATA", "LIMITER"))
+    return 0.0
+
+
+def load_profile(car_path: str, cache=None) -> CarProfile:
+    """ Returns the car profile from the car cache when it's still valid,
+    compiling it from the car's data files (and caching it) otherwise. """
+    if cache is not None and cache.has("profile"):
+        try:
+            return CarProfile.from_dict(cache.get("profile"))
+        except (KeyError, TypeError, ValueError):
+            log("Cached car profile is unreadable, compiling it again.")
+
+    acd = ACD(car_path, cache)
+    profile = CarProfile.from_acd(acd)
+    log("Car data parses avoided: {}".format(acd.get_parses_avoided()))
+    if cache is not None:
+        cache.set("profile", profile.to_dict())
+    acd.save_cache()
+    acd.close()
+    if cache is not None:
+        cache.save()
+    return profile
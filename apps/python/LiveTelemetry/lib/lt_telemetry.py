@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Module with the sources the info windows read each tick from: AC's shared
+memory pages, AC's UDP remote telemetry or a recorded file.
+
+@author: albertowd
+"""
+import ctypes
+from ctypes import c_bool, c_char, c_float, c_int32, c_uint16
+import os
+import struct
+
+from lib.lt_util import log
+from lib.sim_info import (SNAPSHOT_RETRIES, SPageFileGraphic, SPageFilePhysics,
+                          SPageFileStatic, SimSnapshot, StaticInfo, info as sim_info)
+
+# Overrides the [Telemetry] source of the config, like LT_SHM_DIR does
+# for the pages, so headless runs pick a source without editing it.
+SOURCE_ENV = "LT_TELEMETRY"
+
+# AC's remote telemetry protocol, see
+# resources/docs/ACRemoteTelemetryDocumentation.pdf.
+RT_PORT = 9996
+RT_IDENTIFIER = 1
+RT_VERSION = 1
+RT_HANDSHAKE = 0
+RT_SUBSCRIBE_UPDATE = 1
+RT_SUBSCRIBE_SPOT = 2
+RT_DISMISS = 3
+# Seconds between handshakes while AC doesn't answer.
+RT_HANDSHAKE_RETRY = 1.0
+
+
+class RTHandshaker(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    """ Every datagram the client sends. """
+    _pack_ = 4
+    _fields_ = [
+        ('identifier', c_int32),
+        ('version', c_int32),
+        ('operationId', c_int32)
+        ]
+
+
+class RTHandshakerResponse(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    """ AC's answer to the handshake. Names are UTF-16 on the wire on
+    every OS, unlike ``c_wchar``. """
+    _pack_ = 4
+    _fields_ = [
+        ('carName', c_uint16 * 50),
+        ('driverName', c_uint16 * 50),
+        ('identifier', c_int32),
+        ('version', c_int32),
+        ('trackName', c_uint16 * 50),
+        ('trackConfig', c_uint16 * 50)
+        ]
+
+
+class RTCarInfo(ctypes.Structure):  # pylint: disable=too-few-public-methods
+    """ The car state AC sends once per physics step after a
+    SUBSCRIBE_UPDATE, 328 bytes. """
+    _pack_ = 4
+    _fields_ = [
+        ('identifier', c_char),
+        ('size', c_int32),
+        ('speed_Kmh', c_float),
+        ('speed_Mph', c_float),
+        ('speed_Ms', c_float),
+        ('isAbsEnabled', c_bool),
+        ('isAbsInAction', c_bool),
+        ('isTcInAction', c_bool),
+        ('isTcEnabled', c_bool),
+        ('isInPit', c_bool),
+        ('isEngineLimiterOn', c_bool),
+        ('accG_vertical', c_float),
+        ('accG_horizontal', c_float),
+        ('accG_frontal', c_float),
+        ('lapTime', c_int32),
+        ('lastLap', c_int32),
+        ('bestLap', c_int32),
+        ('lapCount', c_int32),
+        ('gas', c_float),
+        ('brake', c_float),
+        ('clutch', c_float),
+        ('engineRPM', c_float),
+        ('steer', c_float),
+        ('gear', c_int32),
+        ('cgHeight', c_float),
+        ('wheelAngularSpeed', c_float * 4),
+        ('slipAngle', c_float * 4),
+        ('slipAngle_ContactPatch', c_float * 4),
+        ('slipRatio', c_float * 4),
+        ('tyreSlip', c_float * 4),
+        ('ndSlip', c_float * 4),
+        ('load', c_float * 4),
+        ('Dy', c_float * 4),
+        ('Mz', c_float * 4),
+        ('tyreDirtyLevel', c_float * 4),
+        ('camberRAD', c_float * 4),
+        ('tyreRadius', c_float * 4),
+        ('tyreLoadedRadius', c_float * 4),
+        ('suspensionHeight', c_float * 4),
+        ('carPositionNormalized', c_float),
+        ('carSlope', c_float),
+        ('carCoordinates', c_float * 3)
+        ]
+
+
+def decode_name(name) -> str:
+    """ Returns the text of a UTF-16 name of a handshake response. """
+    return bytes(name).decode("utf-16-le", "ignore").split("\0", 1)[0]
+
+
+# Recording layout: the magic, the sizes of the static, physics and
+# graphics pages, the static page, then one record per tick of its time
+# in seconds and the physics and graphics pages.
+RECORDING_MAGIC = b"LTREC\0\1\0"
+_RECORDING_SIZES = struct.Struct("<III")
+_RECORD_TIME = struct.Struct("<d")
+
+
+def _page_sizes():
+    """ Returns the sizes of the pages on this OS, ``c_wchar`` is 2 bytes
+    on Windows and 4 anywhere else. """
+    return (ctypes.sizeof(SPageFileStatic), ctypes.sizeof(SPageFilePhysics),
+            ctypes.sizeof(SPageFileGraphic))
+
+
+class RecordingWriter:
+    """ Writes the pages tick by tick into a file ``ReplaySource`` plays. """
+
+    def __init__(self, path: str, static) -> None:
+        """ Starts the recording with the session static page. """
+        self.__file = open(path, "wb")
+        self.__file.write(RECORDING_MAGIC)
+        self.__file.write(_RECORDING_SIZES.pack(*_page_sizes()))
+        self.__file.write(bytes(static))
+
+    def write(self, seconds: float, physics, graphics) -> None:
+        """ Appends the pages of the tick ``seconds`` into the recording. """
+        self.__file.write(_RECORD_TIME.pack(seconds))
+        self.__file.write(bytes(physics))
+        self.__file.write(bytes(graphics))
+
+    def close(self) -> None:
+        """ Closes the recording file. """
+        self.__file.close()
+
+
+class TelemetrySource:
+    """ Where the info windows read each tick from. ``pages`` is a
+    ``SimSnapshot`` refreshed by ``poll``, so the windows read the shared
+    memory field names whatever the source. """
+
+    def __init__(self, pages) -> None:
+        self.pages = pages
+
+    def poll(self, delta_t: float) -> None:
+        """ Reads the newest packet into ``pages``, once per acUpdate.
+        Must be overrided. """
+
+    def read_static(self):
+        """ Returns the ``StaticInfo`` of the session. """
+        return self.pages.static
+
+    def summary(self) -> str:
+        """ Returns the source and its counters, for the shutdown log.
+        Should be overrided, the default is only the source name. """
+        return type(self).__name__
+
+    def close(self) -> None:
+        """ Releases what the source opened. """
+
+
+class SharedMemorySource(TelemetrySource):
+    """ AC's shared memory pages, through the ``sim_info`` snapshot. """
+
+    def __init__(self, info=sim_info) -> None:
+        super().__init__(info.snapshot)
+        self.__info = info
+
+    def poll(self, delta_t: float) -> None:
+        self.__info.take_snapshot()
+
+    def read_static(self):
+        return self.__info.read_static()
+
+    def summary(self) -> str:
+        return "shared memory, {} snapshots retried, {} kept torn after {} retries".format(
+            self.__info.snapshot_retries, self.__info.torn_snapshots, SNAPSHOT_RETRIES)
+
+
+class RemoteTelemetrySource(TelemetrySource):
+    """ AC's UDP remote telemetry: a handshake, then one ``RTCarInfo``
+    datagram per physics step. The socket never blocks, ``poll`` reads
+    every datagram queued since the last tick and keeps the newest. The
+    feed has no temperatures, pressures, wear, ride height or engine
+    limits, the windows read zeros for them. """
+
+    def __init__(self, host: str, port: int = RT_PORT) -> None:
+        super().__init__(SimSnapshot())
+        self.pages.static = StaticInfo(SPageFileStatic())
+        self.packets = 0
+        self.superseded = 0
+        self.__address = (host, port)
+        # Sends the first handshake on the first poll.
+        self.__since_handshake = RT_HANDSHAKE_RETRY
+        self.__subscribed = False
+        # _socket is a separate module that AC's embedded Python may not
+        # ship, so only this source needs it.
+        import socket  # pylint: disable=import-outside-toplevel
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__socket.setblocking(False)
+
+    def __send(self, operation: int) -> None:
+        """ Sends one handshaker datagram. """
+        try:
+            self.__socket.sendto(bytes(RTHandshaker(RT_IDENTIFIER, RT_VERSION, operation)), self.__address)
+        except OSError:
+            # Nothing to do until the next handshake.
+            pass
+
+    def __on_handshake(self, response) -> None:
+        """ Takes the session from AC's answer and subscribes to the car
+        updates. """
+        static = SPageFileStatic()
+        static.carModel = decode_name(response.carName)
+        static.track = decode_name(response.trackName)
+        self.pages.static = StaticInfo(static)
+        self.__send(RT_SUBSCRIBE_UPDATE)
+        self.__subscribed = True
+        log("Remote telemetry from {}:{}: {} driven by {} on {}.".format(
+            self.__address[0], self.__address[1], static.carModel,
+            decode_name(response.driverName), static.track))
+
+    def __on_car_info(self, car) -> None:
+        """ Copies a car update into the pages as a new packet. """
+        physics = self.pages.physics
+        graphics = self.pages.graphics
+        physics.abs = 1.0 if car.isAbsEnabled else 0.0
+        physics.brake = car.brake
+        physics.cgHeight = car.cgHeight
+        physics.clutch = car.clutch
+        physics.gas = car.gas
+        physics.gear = car.gear
+        physics.rpms = int(car.engineRPM)
+        physics.speedKmh = car.speed_Kmh
+        physics.steerAngle = car.steer
+        physics.tc = 1.0 if car.isTcEnabled else 0.0
+        physics.accG[0] = car.accG_horizontal
+        physics.accG[1] = car.accG_vertical
+        physics.accG[2] = car.accG_frontal
+        angular_speed = car.wheelAngularSpeed
+        camber = car.camberRAD
+        dirt = car.tyreDirtyLevel
+        load = car.load
+        slip = car.tyreSlip
+        for index in range(4):
+            physics.wheelAngularSpeed[index] = angular_speed[index]
+            physics.camberRAD[index] = camber[index]
+            physics.tyreDirtyLevel[index] = dirt[index]
+            physics.wheelLoad[index] = load[index]
+            physics.wheelSlip[index] = slip[index]
+        graphics.completedLaps = car.lapCount
+        graphics.iBestTime = car.bestLap
+        graphics.iCurrentTime = car.lapTime
+        graphics.iLastTime = car.lastLap
+        graphics.isInPit = int(car.isInPit)
+        graphics.normalizedCarPosition = car.carPositionNormalized
+        coordinates = car.carCoordinates
+        for index in range(3):
+            graphics.carCoordinates[index] = coordinates[index]
+        self.packets += 1
+        physics.packetId = self.packets
+        graphics.packetId = self.packets
+
+    def poll(self, delta_t: float) -> None:
+        if not self.__subscribed:
+            self.__since_handshake += delta_t
+            if self.__since_handshake >= RT_HANDSHAKE_RETRY:
+                self.__since_handshake = 0.0
+                self.__send(RT_HANDSHAKE)
+
+        newest = None
+        while True:
+            try:
+                datagram = self.__socket.recv(1024)
+            except OSError:
+                # Nothing queued, or on Windows the ICMP error of a
+                # handshake nobody listened to.
+                break
+            if len(datagram) == ctypes.sizeof(RTCarInfo):
+                if newest is not None:
+                    self.superseded += 1
+                newest = datagram
+            elif len(datagram) == ctypes.sizeof(RTHandshakerResponse) and not self.__subscribed:
+                self.__on_handshake(RTHandshakerResponse.from_buffer_copy(datagram))
+        if newest is not None:
+            self.__on_car_info(RTCarInfo.from_buffer_copy(newest))
+
+    def summary(self) -> str:
+        return "remote telemetry from {}:{}, {} car updates read, {} superseded within a tick".format(
+            self.__address[0], self.__address[1], self.packets, self.superseded)
+
+    def close(self) -> None:
+        if self.__subscribed:
+            self.__send(RT_DISMISS)
+            self.__subscribed = False
+        self.__socket.close()
+
+
+class ReplaySource(TelemetrySource):
+    """ Plays a recording at the pace it was recorded: each poll moves the
+    clock by ``delta_t`` and reads every record up to it, the pages keep
+    the newest. At the end of the file the last packet stays. """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(SimSnapshot())
+        self.records = 0
+        self.__path = path
+        self.__file = open(path, "rb")
+        header_size = len(RECORDING_MAGIC) + _RECORDING_SIZES.size
+        header = self.__file.read(header_size)
+        if len(header) != header_size or header[:len(RECORDING_MAGIC)] != RECORDING_MAGIC:
+            self.__file.close()
+            raise ValueError("{} is not a Live Telemetry recording.".format(path))
+        sizes = _RECORDING_SIZES.unpack_from(header, len(RECORDING_MAGIC))
+        if sizes != _page_sizes():
+            self.__file.close()
+            raise ValueError("{} was recorded with pages of {} bytes, these are {} bytes.".format(
+                path, sizes, _page_sizes()))
+        static = self.__file.read(sizes[0])
+        if len(static) != sizes[0]:
+            self.__file.close()
+            raise ValueError("{} ends inside its static page.".format(path))
+        self.pages.static = StaticInfo(SPageFileStatic.from_buffer_copy(static))
+
+        self.__record = bytearray(_RECORD_TIME.size + sizes[1] + sizes[2])
+        record = memoryview(self.__record)
+        self.__physics_raw = record[_RECORD_TIME.size:_RECORD_TIME.size + sizes[1]]
+        self.__graphics_raw = record[_RECORD_TIME.size + sizes[1]:]
+        self.total = (os.path.getsize(path) - self.__file.tell()) // len(self.__record)
+        self.__clock = 0.0
+        self.__time = self.__read()
+
+    def __read(self):
+        """ Reads the next record, returns its time or None at the end. """
+        if self.__file.readinto(self.__record) != len(self.__record):
+            return None
+        return _RECORD_TIME.unpack_from(self.__record)[0]
+
+    def poll(self, delta_t: float) -> None:
+        self.__clock += delta_t
+        while self.__time is not None and self.__time <= self.__clock:
+            self.pages.copy_from(self.__physics_raw, self.__graphics_raw, self.pages.static)
+            self.records += 1
+            self.__time = self.__read()
+
+    def summary(self) -> str:
+        return "replay of {}, {} of {} records played".format(self.__path, self.records, self.total)
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+def open_source(spec: str) -> TelemetrySource:
+    """ Opens the source ``spec`` names: ``shm``, ``udp[:HOST[:PORT]]``
+    or ``replay:FILE``. Anything that can't open, including the UDP
+    source without a ``socket`` module, falls back to the shared memory. """
+    kind, _, rest = spec.strip().partition(":")
+    try:
+        if kind == "udp":
+            host, _, port = rest.partition(":")
+            return RemoteTelemetrySource(host or "127.0.0.1", int(port) if port else RT_PORT)
+        if kind == "replay":
+            return ReplaySource(rest)
+    except (ImportError, OSError, ValueError) as error:
+        log("Could not open telemetry source '{}': {}".format(spec, error))
+        kind = "shm"
+    if kind != "shm":
+        log("Unknown telemetry source '{}', reading the shared memory.".format(spec))
+    return SharedMemorySource()
+
+
+def configured_source(configs) -> str:
+    """ Returns the source spec of the config, or of LT_TELEMETRY when set. """
+    return os.environ.get(SOURCE_ENV, "") or configs.get_telemetry_source()
@@ -6,12 +6,32 @@ Module to keep some utility functions.
 @author: albertowd
 """
 
+from collections import deque
 from datetime import datetime
 from sys import exc_info
 import ctypes.wintypes
 import os
+import threading
 
-import ac
+# Offline tools (tools/precompile_cars.py) import the car data modules
+# outside AC, where log() falls back to the standard output.
+try:
+    import ac
+except ImportError:
+    ac = None
+
+
+# AC only accepts API calls from the thread that runs acMain, which is the
+# one importing this module. Messages logged from worker threads wait in
+# the queue until the next log or flush_logs call from that thread.
+_MAIN_THREAD = threading.current_thread()
+_PENDING_LOGS = deque()
+
+# The app's cfg folder, shipping settings_defaults.ini. LT_CFG_DIR points
+# conf.ini and the car cache somewhere else, so headless runs and
+# benchmarks leave the source tree untouched.
+APP_CFG_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "cfg")
+CFG_DIR_ENV = "LT_CFG_DIR"
 
 
 class WheelPos:
@@ -63,7 +83,13 @@ def color_interpolate(c_1, c_2, perc):
     c_g = c_1[1] + (c_2[1] - c_1[1]) * perc
     c_b = c_1[2] + (c_2[2] - c_1[2]) * perc
     c_a = c_1[3] + (c_2[3] - c_1[3]) * perc
-    return [c_r, c_g, c_b, c_a]
+    return (c_r, c_g, c_b, c_a)
+
+
+def get_cfg_dir():
+    """ Returns the folder of conf.ini and the car cache, LT_CFG_DIR when
+    it's set. """
+    return os.environ.get(CFG_DIR_ENV, "") or APP_CFG_DIR
 
 
 def get_docs_path():
@@ -81,11 +107,30 @@ def get_docs_path():
         return ""
 
 
+def flush_logs():
+    """ Writes the messages logged by worker threads, main thread only. """
+    while len(_PENDING_LOGS) > 0:
+        formated, console, app_log = _PENDING_LOGS.popleft()
+        if console:
+            ac.console(formated)
+        if app_log:
+            ac.log(formated)
+
+
 def log(message, console=True, app_log=True):
     """ Logs a message on the log and console. """
     time_str = datetime.utcnow().strftime("%H:%M:%S.%f")
     formated = "[LT][{}] {}".format(time_str, message)
 
+    if ac is None:
+        print(formated)
+        return
+
+    if threading.current_thread() is not _MAIN_THREAD:
+        _PENDING_LOGS.append((formated, console, app_log))
+        return
+
+    flush_logs()
     if console:
         ac.console(formated)
 
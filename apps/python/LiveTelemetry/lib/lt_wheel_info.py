@@ -10,14 +10,13 @@ import copy
 import ac
 import acsys
 
-from lib.lt_acd import ACD
-from lib.lt_components import (BoxComponent, Camber, Dirt, Height,
-                               Load, Lock, Pressure, Temps, Suspension, Tire,
-                               Wear, WheelTitle)
+from lib.lt_components import (BoxComponent, Camber, CamberRotation, Dirt,
+                               Height, Load, Lock, Pressure, Temps,
+                               Suspension, Tire, Wear, WheelTitle)
 from lib.lt_config import Config
 from lib.lt_info_window import InfoWindow
+from lib.lt_profile import CarProfile, WheelTyres
 from lib.lt_util import WheelPos
-from lib.sim_info import info
 
 
 class Data:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
@@ -112,6 +111,14 @@ class Data:  # pylint: disable=too-few-public-methods,too-many-instance-attribut
         self.tire_w = info_arg.physics.tyreWear[index] / 100.0
 
 
+def get_tyre_compound() -> str:
+    """ Returns the player's current tyre compound short name. """
+    try:
+        return ac.getCarTyreCompound(0) or ""
+    except (TypeError, ValueError):
+        return ""
+
+
 # Bool-typed options shared across the wheel widget components.
 WHEEL_BOOL_OPTIONS = ("Camber", "Dirt", "Height", "Load", "Lock", "Logging",
                       "Pressure", "Suspension", "Temps", "Tire", "Wear")
@@ -120,13 +127,21 @@ WHEEL_BOOL_OPTIONS = ("Camber", "Dirt", "Height", "Load", "Lock", "Logging",
 class WheelInfo(InfoWindow):
     """ Wheel info to draw and update each wheel. """
 
-    def __init__(self, acd: ACD, configs: Config, wheel_index: int) -> None:
-        """ Default constructor receive the index of the wheel it will draw info. """
+    def __init__(self, configs: Config, wheel_index: int, source) -> None:
+        """ Default constructor receive the index of the wheel it will draw
+        info and the telemetry source to read. """
         self.__wheel = WheelPos(wheel_index)
         super().__init__("Live Telemetry {}".format(self.__wheel.name()))
-        self.__abs_slip_limit = acd.get_abs_slip_limit()
+        # Neutral profile until the car data is loaded, see set_profile.
+        profile = CarProfile()
+        self.__abs_slip_limit = profile.abs_slip_limit
+        # Every compound of the axle is built up front, update() only
+        # switches between them when AC reports a different compound.
+        self.__tyres = WheelTyres(profile, self.__wheel)
+        self.__tyres.select(get_tyre_compound())
         self._data = Data()
-        self._info = info
+        # Read through the pages the source refreshes once per acUpdate.
+        self._info = source.pages
         self._options = {key: configs.get_bool_option(key) for key in WHEEL_BOOL_OPTIONS}
 
         # Per-wheel anchor pins the widget to its on-screen corner so a
@@ -145,28 +160,30 @@ class WheelInfo(InfoWindow):
         # Dirt, Lock, contact patches, ...) lands on top of it. The
         # new geometry is solid-filled — drawing it later would cover
         # the IMO temperature grid and dirt bar.
-        self._components.append(Tire(acd, size, self.__wheel))
+        # Tire, Temps and Dirt tilt together through one camber rotation.
+        rotation = CamberRotation()
+        self._components.append(Tire(self.__tyres, rotation, size))
         self._components.append(
-            Temps(acd, size, self.__wheel, self._window_id))
-        self._components.append(Dirt(size))
-        self._components.append(Lock(acd, size, self.__wheel))
+            Temps(self.__tyres, rotation, size, self.__wheel, self._window_id))
+        self._components.append(Dirt(rotation, size))
+        self._components.append(Lock(size, self.__wheel))
 
         # Camber option now toggles the contact-patch load-distribution
         # heuristic — the trapezoidal camber strip was replaced in 1.8.0.
         # The component class kept its "Camber" name so the existing
         # option toggle and saved configs continue to work without a
         # migration step.
-        self._components.append(Camber(acd, size, self.__wheel))
+        self._components.append(Camber(self.__tyres, size, self.__wheel))
         self._components.append(Suspension(size, self.__wheel))
         self._components.append(Height(size, self.__wheel, self._window_id))
         self._components.append(
-            Pressure(acd, size, self.__wheel, self._window_id))
+            Pressure(self.__tyres, size, self.__wheel, self._window_id))
         self._components.append(Wear(size, self.__wheel, self._window_id))
         # Wheel ID + compound abbreviation stacked above the height
         # widget. Always rendered (text-only, cheap); gating it behind
         # an option would just be UI noise.
         self._components.append(
-            WheelTitle(size, self.__wheel, self._window_id))
+            WheelTitle(self.__tyres, size, self.__wheel, self._window_id))
         # Needs to be the last to render above all components
         self._components.append(Load(size, self.__wheel))
 
@@ -184,8 +201,16 @@ class WheelInfo(InfoWindow):
         for component in self._components:
             component.resize(size)
 
+    def set_profile(self, profile: CarProfile) -> None:
+        """ Switches every component to the loaded car profile. """
+        self.__abs_slip_limit = profile.abs_slip_limit
+        self.__tyres.set_profile(profile)
+        super().set_profile(profile)
+
     def update(self, _delta_t: float) -> None:
         """ Updates the wheel information. """
+        self.__tyres.select(get_tyre_compound())
         self._data.update(self.__wheel, self._info, self.__abs_slip_limit)
+        self.__tyres.update_temps(self._data)
         if self._options["Logging"] is True:
             self._data_log.append(copy.copy(self._data))
@@ -5,6 +5,7 @@ Siminfo updated to AC 1.14.3
 import mmap
 import ctypes
 from ctypes import c_int32, c_float, c_wchar
+import os
 import time
 
 class Def:  # pylint: disable=too-few-public-methods
@@ -183,18 +184,155 @@ class SPageFileStatic(ctypes.Structure):  # pylint: disable=too-few-public-metho
         ('pitWindowEnd', c_int32)
         ]
 
+# Folder of regular files standing in for the named pages, one file per
+# page named after its tag. Lets another process (tools/telemetry_driver.py)
+# feed the plugin on any OS.
+PAGE_DIR_ENV = "LT_SHM_DIR"
+
+def map_file(path, size):
+    """ Maps a regular file as a page, growing it to the page size. """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = "r+b" if os.path.isfile(path) else "w+b"
+    with open(path, mode) as page_file:
+        if os.fstat(page_file.fileno()).st_size < size:
+            page_file.truncate(size)
+        # The mapping keeps its own handle, the file can close.
+        return mmap.mmap(page_file.fileno(), size)
+
+def open_page(struct, tagname):
+    """ Maps one of AC's named shared memory pages. With LT_SHM_DIR set
+    the page is the file named after the tag in that folder. Otherwise
+    named mappings only exist on Windows, anywhere else (headless runs of
+    the plugin) the page is zeroed anonymous memory that the caller fills
+    itself. """
+    folder = os.environ.get(PAGE_DIR_ENV, "")
+    if folder:
+        return map_file(os.path.join(folder, tagname), ctypes.sizeof(struct))
+    if os.name == "nt":
+        return mmap.mmap(0, ctypes.sizeof(struct), tagname)
+    return mmap.mmap(-1, ctypes.sizeof(struct))
+
+# memoryview formats of the array items a snapshot exposes without ctypes.
+_ARRAY_FORMATS = {c_float: "f", c_int32: "i"}
+
+def snapshot_page(struct):
+    """ Returns a zeroed private copy of a page structure. Its 1-D number
+    arrays are memoryviews over the copy, so ``copy.wheelLoad[index]``
+    is a plain float instead of a temporary ctypes array plus an item
+    read; every other field keeps its ctypes descriptor. """
+    arrays = {}
+    for name, field_type in struct._fields_:  # pylint: disable=protected-access
+        if getattr(field_type, "_type_", None) in _ARRAY_FORMATS:
+            arrays[name] = _ARRAY_FORMATS[field_type._type_]  # pylint: disable=protected-access
+    # Plain class attributes hide the inherited array descriptors, so the
+    # memoryviews stored on the instance win the attribute lookup.
+    copy_type = type("{}Copy".format(struct.__name__), (struct,), dict.fromkeys(arrays))
+    page = copy_type()
+    raw = memoryview(page).cast("B")
+    for name, item_format in arrays.items():
+        field = getattr(struct, name)
+        setattr(page, name, raw[field.offset:field.offset + field.size].cast(item_format))
+    return page
+
+class StaticInfo:  # pylint: disable=too-few-public-methods
+    """ Plain Python copy of the static page, with the same field names
+    and the arrays as tuples. AC only rewrites that page when a session
+    starts, so reading ``maxRpm`` or ``suspensionMaxTravel[index]`` off
+    the copy skips ctypes on every tick. """
+    def __init__(self, static):
+        for name, _ in static._fields_:  # pylint: disable=protected-access
+            value = getattr(static, name)
+            if not isinstance(value, (str, float, int)):
+                value = tuple(value)
+            setattr(self, name, value)
+        self.fingerprint = static_fingerprint(static)
+
+def static_fingerprint(static):
+    """ Returns the static page fields that change with the session. """
+    return static.carModel, static.track, static.sectorCount
+
+# Copies retried when AC published a packet during the snapshot copy.
+SNAPSHOT_RETRIES = 3
+
+class SimSnapshot:  # pylint: disable=too-few-public-methods
+    """ Copies of the physics and graphics pages taken once per tick,
+    which every ``Data.update`` of that tick reads instead of the live
+    pages: one buffer copy per page instead of each window reading dozens
+    of fields through ctypes. ``static`` is the decoded ``StaticInfo``
+    of the session. """
+    def __init__(self):
+        self.physics = snapshot_page(SPageFilePhysics)
+        self.graphics = snapshot_page(SPageFileGraphic)
+        self.static = None
+        self.__physics_raw = memoryview(self.physics).cast("B")
+        self.__graphics_raw = memoryview(self.graphics).cast("B")
+
+    def copy_from(self, physics_raw, graphics_raw, static):
+        """ Copies the live pages, given as byte memoryviews, into the
+        snapshot. """
+        self.__physics_raw[:] = physics_raw
+        self.__graphics_raw[:] = graphics_raw
+        self.static = static
+
 class LTSimInfo:
     """ Main Sim info class to import within the module. """
     def __init__(self):
-        self._acpmf_physics = mmap.mmap(0, ctypes.sizeof(SPageFilePhysics), "acpmf_physics")
-        self._acpmf_graphics = mmap.mmap(0, ctypes.sizeof(SPageFileGraphic), "acpmf_graphics")
-        self._acpmf_static = mmap.mmap(0, ctypes.sizeof(SPageFileStatic), "acpmf_static")
+        self._acpmf_physics = open_page(SPageFilePhysics, "acpmf_physics")
+        self._acpmf_graphics = open_page(SPageFileGraphic, "acpmf_graphics")
+        self._acpmf_static = open_page(SPageFileStatic, "acpmf_static")
         self.physics = SPageFilePhysics.from_buffer(self._acpmf_physics)
         self.graphics = SPageFileGraphic.from_buffer(self._acpmf_graphics)
         self.static = SPageFileStatic.from_buffer(self._acpmf_static)
+        self.static_info = StaticInfo(self.static)
+        self.snapshot = SimSnapshot()
+        self.snapshot_retries = 0
+        self.torn_snapshots = 0
+        # Byte views of the live pages, slice-copied in one C call each.
+        self.__physics_raw = memoryview(self.physics).cast("B")
+        self.__graphics_raw = memoryview(self.graphics).cast("B")
+
+    def read_static(self):
+        """ Returns ``static_info``, decoded again when the session
+        fingerprint of the static page changed. """
+        if static_fingerprint(self.static) != self.static_info.fingerprint:
+            self.static_info = StaticInfo(self.static)
+        return self.static_info
+
+    def take_snapshot(self):
+        """ Refreshes ``snapshot`` from the live pages, once per tick.
+
+        AC writes the pages from its own thread, so a copy can catch a
+        packet being published and mix fields of two packets. Like a
+        seqlock reader, the packetIds are read before the copy, in it and
+        after it; when they disagree the copy is retried, up to
+        SNAPSHOT_RETRIES times, then kept and counted as torn. """
+        physics = self.physics
+        graphics = self.graphics
+        snapshot = self.snapshot
+        static_info = self.read_static()
+        attempt = 0
+        while True:
+            physics_id = physics.packetId
+            graphics_id = graphics.packetId
+            snapshot.copy_from(self.__physics_raw, self.__graphics_raw, static_info)
+            if (snapshot.physics.packetId == physics_id == physics.packetId
+                    and snapshot.graphics.packetId == graphics_id == graphics.packetId):
+                return snapshot
+            if attempt == SNAPSHOT_RETRIES:
+                self.torn_snapshots += 1
+                return snapshot
+            attempt += 1
+            self.snapshot_retries += 1
 
     def close(self):
         """ Closes the session shared memory. """
+        # The structures are views on the pages, a page can't close while
+        # one still points into it.
+        self.__physics_raw.release()
+        self.__graphics_raw.release()
+        self.physics = None
+        self.graphics = None
+        self.static = None
         self._acpmf_physics.close()
         self._acpmf_graphics.close()
         self._acpmf_static.close()
@@ -0,0 +1,17 @@
+"""Benchmarks of the plugin hot paths, run outside the game.
+
+    python -m benchmarks --output benchmarks/baseline.json
+    python -m benchmarks --compare benchmarks/baseline.json --threshold 10
+
+The plugin modules run on top of the ``tools/headless`` stand-ins for
+``ac`` and ``acsys``, with recording turned off so only the plugin's own
+work is timed. ``fixtures`` builds the synthetic car and session every
+case draws from, ``cases`` registers the benchmarks and ``harness``
+times them and stores or compares the results.
+"""
+import sys
+from pathlib import Path
+
+TOOLS = Path(__file__).resolve().parents[1] / "tools"
+if str(TOOLS) not in sys.path:
+    sys.path.insert(0, str(TOOLS))
@@ -0,0 +1,63 @@
+"""Command line of the benchmark suite, see ``python -m benchmarks -h``."""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from . import cases  # noqa: F401  pylint: disable=unused-import
+from .harness import CASES, compare, format_time, load, run, save
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results.json"
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Times the Live Telemetry hot paths outside the game.")
+    parser.add_argument("--filter", action="append", default=[],
+                        help="only run the cases whose name contains this text (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--warmup", type=int, default=2, help="samples dropped before measuring")
+    parser.add_argument("--repeat", type=int, default=7, help="samples kept per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="JSON file the results are written to")
+    parser.add_argument("--compare", default=None, help="baseline JSON file to compare the results against")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percentage a median may grow before it counts as a regression")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if not args.filter or any(text in name for text in args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print("No case matches {}.".format(", ".join(args.filter)))
+        return 2
+    baseline = load(args.compare) if args.compare else None
+
+    width = max(len(name) for name in names)
+    results = run(names, args.warmup, args.repeat, args.min_time, lambda result: print(
+        "{:<{}}  {:>10}/op  (min {}, +-{:.1f}%)".format(
+            result.name, width, format_time(result.median), format_time(result.minimum),
+            100.0 * result.stdev / result.mean if result.mean > 0.0 else 0.0)))
+    save(args.output, results)
+    print("results: {}".format(args.output))
+
+    if baseline is None:
+        return 0
+    changes = compare(baseline, results, args.threshold / 100.0)
+    print("\nagainst {} (threshold {:.1f}%):".format(args.compare, args.threshold))
+    for change in changes:
+        print("{:<{}}  {:>10} -> {:>10}  {:+7.1f}%{}".format(
+            change.name, width, format_time(change.baseline), format_time(change.current),
+            (change.ratio - 1.0) * 100.0, "  REGRESSION" if change.regression else ""))
+    missing = [name for name in names if name not in baseline]
+    if missing:
+        print("not in the baseline: {}".format(", ".join(missing)))
+    regressions = [change for change in changes if change.regression]
+    print("{} regression(s) in {} compared case(s).".format(len(regressions), len(changes)))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,185 @@
+"""The benchmark cases, registered in the order they run.
+
+Names are dotted so ``--filter`` can select a family: ``data.update``,
+``acupdate``, ``draw.<window>.<component>``, ``window.draw``, ``curve.interpolate``,
+``acd.decode`` and ``csv.export``.
+"""
+from __future__ import annotations
+
+import copy
+import itertools
+import os
+import tempfile
+
+from .fixtures import CAR, session
+from .harness import case
+
+# pylint: disable=wrong-import-order,import-error
+from acd_writer import make_car, power_lut, synthetic_car
+from lib.lt_acd import ACD
+from lib.lt_interpolation import Curve, parse_lut
+from lib.lt_util import WheelPos, export_saved_log
+import lib.lt_engine_info
+import lib.lt_wheel_info
+
+DELTA_T = 1.0 / 60.0
+
+
+# Data.update off the per-tick snapshot, as acUpdate runs it.
+@case("data.update.engine")
+def _data_update_engine():
+    snapshot = session().info.take_snapshot()
+    data = lib.lt_engine_info.Data()
+    return lambda: data.update(snapshot), 1
+
+
+@case("data.update.wheel")
+def _data_update_wheel():
+    snapshot = session().info.take_snapshot()
+    data = lib.lt_wheel_info.Data()
+    wheel = WheelPos(0)
+    return lambda: data.update(wheel, snapshot, 0.17), 1
+
+
+# A whole tick of updates: the engine and the four wheels, reading the
+# live pages or taking the snapshot first.
+def _tick_case(take_snapshot):
+    def setup():
+        info = session().info
+        engine = lib.lt_engine_info.Data()
+        wheels = [(lib.lt_wheel_info.Data(), WheelPos(index)) for index in range(4)]
+
+        def tick():
+            pages = info.take_snapshot() if take_snapshot else info
+            engine.update(pages)
+            for data, wheel in wheels:
+                data.update(wheel, pages, 0.17)
+        return tick, 1
+    return setup
+
+
+case("data.update.tick.live")(_tick_case(False))
+case("data.update.tick.snapshot")(_tick_case(True))
+
+
+# acUpdate as AC calls it, with a new physics packet every call or the
+# same one repeated (high frame rates, pauses), which skips the updates.
+def _acupdate_case(new_packets):
+    def setup():
+        current = session()
+        physics = current.info.physics
+
+        def update():
+            if new_packets:
+                physics.packetId += 1
+            current.module.acUpdate(DELTA_T)
+        return update, 1
+    return setup
+
+
+case("acupdate.new_packet")(_acupdate_case(True))
+case("acupdate.same_packet")(_acupdate_case(False))
+
+
+# Every component of the engine window and of one wheel window (the
+# other wheels run the same components).
+def _component_case(window_name, index):
+    def setup():
+        window = session().windows[window_name]
+        component = window._components[index]  # pylint: disable=protected-access
+        frames = itertools.cycle(session().snapshots[window_name])
+        return lambda: component.draw(next(frames), DELTA_T), 1
+    return setup
+
+
+# The component list depends on the car (BoostBar needs a turbo), so
+# naming these cases starts the session.
+for _window_name in ("EN", "FL"):
+    for _index, _component in enumerate(session().windows[_window_name]._components):  # pylint: disable=protected-access
+        case("draw.{}.{}".format(_window_name, type(_component).__name__))(_component_case(_window_name, _index))
+
+
+# InfoWindow.draw, the whole render callback of each window.
+def _window_case(window_name):
+    def setup():
+        window = session().windows[window_name]
+        frames = itertools.cycle(session().snapshots[window_name])
+
+        def draw():
+            window._data = next(frames)  # pylint: disable=protected-access
+            window.draw(DELTA_T)
+        return draw, 1
+    return setup
+
+
+for _window_name in ("EN", "FL", "FR", "RL", "RR"):
+    case("window.draw.{}".format(_window_name))(_window_case(_window_name))
+
+
+# Curve.interpolate over a sweep of the curve range, per lookup.
+def _curve_case(points):
+    def setup():
+        # Drops the comment header, like ACD.get_filtered_file does.
+        curve = Curve(points=parse_lut(power_lut(points).split("\n", 1)[1]))
+        values = [8600.0 * i / 999 - 50.0 for i in range(1000)]
+        interpolate = curve.interpolate
+
+        def sweep():
+            for value in values:
+                interpolate(value)
+        return sweep, len(values)
+    return setup
+
+
+case("curve.interpolate.18pt")(_curve_case(18))
+case("curve.interpolate.128pt")(_curve_case(128))
+
+
+# ACD decode: index the archive and decrypt every inner file.
+ACD_SIZES = {"small": (0, 0), "medium": (16, 16 * 1024), "large": (48, 64 * 1024)}
+
+
+def _acd_case(size):
+    def setup():
+        directory = tempfile.TemporaryDirectory(prefix="lt_bench_acd_")
+        count, file_size = ACD_SIZES[size]
+        car_path = make_car(directory.name, CAR, synthetic_car(filler=count, filler_size=file_size))
+
+        def decode():
+            acd = ACD(car_path.as_posix())
+            for name in acd.get_file_names():
+                acd.get_file(name)
+            acd.close()
+        # Keeps the folder alive as long as the case.
+        decode.directory = directory
+        return decode, 1
+    return setup
+
+
+for _size in ACD_SIZES:
+    case("acd.decode.{}".format(_size))(_acd_case(_size))
+
+
+# export_saved_log of a wheel log, per row.
+def _csv_case(rows):
+    def setup():
+        snapshots = session().snapshots["FL"]
+        data_log = [copy.copy(snapshots[row % len(snapshots)]) for row in range(rows)]
+        directory = tempfile.TemporaryDirectory(prefix="lt_bench_csv_")
+
+        def export():
+            # Off Windows there are no My Documents, the CSV goes to the
+            # working directory.
+            cwd = os.getcwd()
+            os.chdir(directory.name)
+            try:
+                export_saved_log(data_log, "bench")
+            finally:
+                os.chdir(cwd)
+        export.directory = directory
+        return export, rows
+    return setup
+
+
+case("csv.export.10k")(_csv_case(10000))
+case("csv.export.100k")(_csv_case(100000))
@@ -0,0 +1,78 @@
+"""The headless plugin session the cases draw from.
+
+Importing this module installs the ``ac`` / ``acsys`` stand-ins with
+recording off, so it must be imported before any plugin module.
+"""
+from __future__ import annotations
+
+import copy
+import os
+import tempfile
+import time
+
+from headless import Recorder, SyntheticDrive, install
+
+CAR = "lt_bench"
+
+RECORDER = install(Recorder(CAR))
+RECORDER.recording = False
+
+# acd_writer imports the plugin, so only once the stand-ins are in.
+from acd_writer import SHORT_NAMES, make_car, synthetic_car  # noqa: E402  pylint: disable=wrong-import-position,wrong-import-order
+
+RECORDER.tyre_compound = SHORT_NAMES[0]
+
+
+class Session:  # pylint: disable=too-few-public-methods
+    """The plugin started on the synthetic car with every window open,
+    plus ``frames`` data snapshots per window taken along a synthetic
+    lap, so draw cases can cycle through changing values."""
+
+    def __init__(self, frames: int = 240, hz: float = 60.0):
+        # pylint: disable=import-outside-toplevel
+        import LiveTelemetry
+        from lib.lt_util import CFG_DIR_ENV
+        from lib.sim_info import info
+
+        self.directory = tempfile.TemporaryDirectory(prefix="lt_bench_")
+        make_car(self.directory.name, CAR, synthetic_car())
+        # conf.ini and the car cache go to the session folder too, the
+        # plugin's cfg keeps the developer's own.
+        os.environ[CFG_DIR_ENV] = os.path.join(self.directory.name, "cfg")
+        self.info = info
+        self.module = LiveTelemetry
+        self.drive = SyntheticDrive(hz)
+        self.drive.setup(info, RECORDER)
+        self.drive.step(info, RECORDER, 0)
+
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        try:
+            LiveTelemetry.acMain("benchmarks")
+            for window_id, listener in RECORDER.activated_listeners.items():
+                listener(window_id)
+            deadline = time.monotonic() + 30.0
+            while LiveTelemetry.LT.loader is not None and time.monotonic() < deadline:
+                LiveTelemetry.acUpdate(0.0)
+                time.sleep(0.001)
+        finally:
+            os.chdir(cwd)
+
+        self.windows = {"EN": LiveTelemetry.LT.engine_info}
+        self.windows.update(LiveTelemetry.LT.wheel_infos)
+        self.snapshots: dict[str, list] = {name: [] for name in self.windows}
+        for frame in range(1, frames + 1):
+            self.drive.step(info, RECORDER, frame)
+            LiveTelemetry.acUpdate(1.0 / hz)
+            for name, window in self.windows.items():
+                self.snapshots[name].append(copy.copy(window._data))  # pylint: disable=protected-access
+
+
+_SESSION: list[Session] = []
+
+
+def session() -> Session:
+    """Returns the shared session, started on first use."""
+    if not _SESSION:
+        _SESSION.append(Session())
+    return _SESSION[0]
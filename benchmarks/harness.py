@@ -0,0 +1,140 @@
+"""Timing, result files and regression checks.
+
+A case is a setup function registered with ``@case``: it returns the
+callable to time and how many operations one call performs, so results
+are reported per operation (one interpolation, one CSV row...). The
+setup runs once, outside of the timed region.
+"""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+RESULTS_VERSION = 1
+
+CASES: dict[str, Callable[[], tuple[Callable[[], object], int]]] = {}
+
+
+def case(name: str):
+    """Registers a setup function under ``name``."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@dataclass
+class Result:
+    """Seconds per operation of one case, over ``repeat`` samples of
+    ``number`` calls each."""
+    name: str
+    median: float
+    minimum: float
+    mean: float
+    stdev: float
+    number: int
+    repeat: int
+    ops: int
+
+
+def _time(func: Callable[[], object], number: int) -> float:
+    """Returns the seconds ``number`` calls of ``func`` took."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def measure(name: str, func: Callable[[], object], ops: int = 1, warmup: int = 2,
+            repeat: int = 7, min_time: float = 0.05) -> Result:
+    """Times ``func``: the calls per sample grow until a sample lasts at
+    least ``min_time``, ``warmup`` samples are dropped and ``repeat``
+    samples are kept."""
+    number = 1
+    while True:
+        elapsed = _time(func, number)
+        if elapsed >= min_time:
+            break
+        # Aim a bit past min_time so the loop rarely needs a third pass.
+        number = max(number * 2, int(number * min_time * 1.2 / max(elapsed, 1e-9)))
+    for _ in range(warmup):
+        _time(func, number)
+    samples = [_time(func, number) / (number * ops) for _ in range(repeat)]
+    return Result(name, statistics.median(samples), min(samples), statistics.fmean(samples),
+                  statistics.stdev(samples) if len(samples) > 1 else 0.0, number, repeat, ops)
+
+
+def run(names: list[str], warmup: int, repeat: int, min_time: float,
+        report: Callable[[Result], None] | None = None) -> list[Result]:
+    """Sets up and measures every named case, in order."""
+    results = []
+    for name in names:
+        func, ops = CASES[name]()
+        result = measure(name, func, ops, warmup, repeat, min_time)
+        if report is not None:
+            report(result)
+        results.append(result)
+    return results
+
+
+def save(path: str, results: list[Result]) -> None:
+    """Writes the results as a JSON baseline."""
+    document = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+
+def load(path: str) -> dict[str, Result]:
+    """Reads a JSON baseline written by ``save``."""
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError("{} has results version {}, expected {}".format(
+            path, document.get("version"), RESULTS_VERSION))
+    return {name: Result(**values) for name, values in document["results"].items()}
+
+
+@dataclass
+class Change:
+    """Median of one case against its baseline."""
+    name: str
+    baseline: float
+    current: float
+    regression: bool
+
+    @property
+    def ratio(self) -> float:
+        """Current over baseline median, above 1 is slower."""
+        return self.current / self.baseline if self.baseline > 0.0 else float("inf")
+
+
+def compare(baseline: dict[str, Result], results: list[Result], threshold: float) -> list[Change]:
+    """Compares the medians of the cases present in both runs. A case
+    regressed when it got slower by more than ``threshold`` (0.1 = 10%)."""
+    changes = []
+    for result in results:
+        if result.name in baseline:
+            base = baseline[result.name].median
+            current = result.median
+            changes.append(Change(result.name, base, current, current > base * (1.0 + threshold)))
+    return changes
+
+
+def format_time(seconds: float) -> str:
+    """Formats seconds per operation with a readable unit."""
+    if seconds >= 1e-3:
+        return "{:.2f} ms".format(seconds * 1e3)
+    if seconds >= 1e-6:
+        return "{:.2f} us".format(seconds * 1e6)
+    return "{:.1f} ns".format(seconds * 1e9)
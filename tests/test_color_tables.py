@@ -0,0 +1,75 @@
+"""Checks the quantized colour tables against the exact colour functions.
+
+The tables round every value to the nearest sample, so pressure and
+temperature colours may drift by a fraction of a step, and the power
+colour may only flip early or late right at a band edge:
+
+    python -m unittest discover tests
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+PLUGIN = Path(__file__).resolve().parents[1] / "apps" / "python" / "LiveTelemetry"
+
+# The plugin modules are imported as ``lib.*``, the same way AC does.
+if str(PLUGIN) not in sys.path:
+    sys.path.insert(0, str(PLUGIN))
+
+# pylint: disable=wrong-import-position,import-error
+from lib.lt_interpolation import RPM_COLOR_STEP, Power, TirePsi, TireTemp  # noqa: E402
+
+# Largest per channel difference allowed between a table and the exact colour.
+PSI_TOLERANCE = 0.021
+TEMP_TOLERANCE = 0.007
+
+# A torque curve peaking mid range, its power peak around 7000 RPM.
+TORQUE = [(0.0, 160.0), (1000.0, 220.0), (2000.0, 290.0), (3000.0, 350.0), (4000.0, 390.0),
+          (5000.0, 400.0), (6000.0, 385.0), (7000.0, 350.0), (8000.0, 290.0), (8500.0, 240.0)]
+
+# A grip over temperature curve peaking at 85 C.
+GRIP = [(0.0, 0.75), (30.0, 0.86), (60.0, 0.96), (85.0, 1.0), (110.0, 0.97), (150.0, 0.88),
+        (200.0, 0.72), (240.0, 0.6)]
+
+
+def sweep(low: float, high: float, count: int = 20000) -> list[float]:
+    """``count`` evenly spread values from ``low`` to ``high``."""
+    return [low + (high - low) * index / (count - 1) for index in range(count)]
+
+
+def difference(color_a: tuple, color_b: tuple) -> float:
+    """Largest per channel difference of two RGBA colours."""
+    return max(abs(channel_a - channel_b) for channel_a, channel_b in zip(color_a, color_b))
+
+
+class ColorTableTest(unittest.TestCase):
+    """Table lookups against the exact colour of the same value."""
+
+    def test_psi(self):
+        for ref in (14.0, 18.0, 26.0, 32.0, 45.0):
+            psi = TirePsi(ref)
+            worst = max(difference(psi.interpolate_color(value), psi._color(value))  # pylint: disable=protected-access
+                        for value in sweep(ref * 0.9, ref * 1.1))
+            self.assertLessEqual(worst, PSI_TOLERANCE, "reference {} psi".format(ref))
+
+    def test_temp(self):
+        temp = TireTemp(points=GRIP)
+        worst = max(difference(temp.interpolate_color(value), temp._color(value))  # pylint: disable=protected-access
+                    for value in sweep(-20.0, 260.0))
+        self.assertLessEqual(worst, TEMP_TOLERANCE)
+
+    def test_power(self):
+        power = Power(points=TORQUE)
+        # pylint: disable=protected-access
+        for rpm in sweep(-500.0, 9000.0):
+            if power.interpolate_color(rpm) == power._color(rpm):
+                continue
+            # Only a sample on the other side of a band edge may answer.
+            self.assertNotEqual(power._color(rpm - RPM_COLOR_STEP), power._color(rpm + RPM_COLOR_STEP),
+                                "{} RPM is not next to a band edge".format(rpm))
+
+
+if __name__ == "__main__":
+    unittest.main()
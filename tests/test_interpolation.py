@@ -0,0 +1,81 @@
+"""Checks the batch curve interpolation against the one value at a time one.
+
+``Curve.interpolate_many`` goes through ``numpy.interp`` when NumPy
+imports, AC's embedded Python runs the plain Python fallback. Both must
+give what ``interpolate`` gives, value by value:
+
+    python -m unittest discover tests
+"""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+PLUGIN = Path(__file__).resolve().parents[1] / "apps" / "python" / "LiveTelemetry"
+
+# The plugin modules are imported as ``lib.*``, the same way AC does.
+if str(PLUGIN) not in sys.path:
+    sys.path.insert(0, str(PLUGIN))
+
+# pylint: disable=wrong-import-position,import-error
+from lib import lt_interpolation  # noqa: E402
+from lib.lt_interpolation import Curve, TireTemp  # noqa: E402
+
+# NumPy as the plugin imported it, the tests switch it off and back on.
+NUMPY = lt_interpolation.numpy
+
+# Largest difference allowed between NumPy's and plain Python's arithmetic.
+TOLERANCE = 1e-9
+
+# A grip over temperature curve peaking at 85 C.
+GRIP = [(0.0, 0.75), (30.0, 0.86), (60.0, 0.96), (85.0, 1.0), (110.0, 0.97), (150.0, 0.88),
+        (200.0, 0.72), (240.0, 0.6)]
+
+# Curves numpy.interp can't take, the fallback answers them on both paths.
+REPEATED = [(0.0, 1.0), (50.0, 2.0), (50.0, 3.0), (100.0, 4.0)]
+UNSORTED = [(0.0, 1.0), (100.0, 2.0), (50.0, 3.0)]
+
+# Outside, on and between the breakpoints of the curves above.
+VALUES = [-50.0, 0.0, 12.5, 30.0, 49.9, 50.0, 50.1, 84.99, 85.0, 85.01, 100.0, 173.3, 240.0, 300.0]
+
+
+class InterpolateManyTest(unittest.TestCase):
+    """Both batch paths against ``Curve.interpolate``."""
+
+    def tearDown(self):
+        lt_interpolation.numpy = NUMPY
+
+    def assert_batch(self, curve: Curve) -> list:
+        """Checks the batch of ``VALUES`` value by value, returns it."""
+        batch = curve.interpolate_many(VALUES)
+        self.assertEqual(len(batch), len(VALUES))
+        for value, result in zip(VALUES, batch):
+            self.assertAlmostEqual(result, curve.interpolate(value), delta=TOLERANCE, msg="at {}".format(value))
+        return batch
+
+    def test_fallback(self):
+        lt_interpolation.numpy = None
+        for points in (GRIP, REPEATED, UNSORTED, []):
+            self.assert_batch(Curve(points=points))
+
+    @unittest.skipIf(lt_interpolation.numpy is None, "NumPy is not installed")
+    def test_numpy_matches_fallback(self):
+        for points in (GRIP, REPEATED, UNSORTED, []):
+            with_numpy = self.assert_batch(Curve(points=points))
+            lt_interpolation.numpy = None
+            without_numpy = self.assert_batch(Curve(points=points))
+            lt_interpolation.numpy = NUMPY
+            for value, result_a, result_b in zip(VALUES, with_numpy, without_numpy):
+                self.assertAlmostEqual(result_a, result_b, delta=TOLERANCE, msg="at {}".format(value))
+
+    def test_temp_colors(self):
+        temp = TireTemp(points=GRIP)
+        grips, colors = temp.interpolate_colors(VALUES)
+        for value, grip, color in zip(VALUES, grips, colors):
+            self.assertAlmostEqual(grip, temp.interpolate(value), delta=TOLERANCE)
+            self.assertEqual(color, temp.interpolate_color(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
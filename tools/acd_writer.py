@@ -0,0 +1,243 @@
+"""Write synthetic Kunos ``data.acd`` archives.
+
+The inverse of the plugin's ``lt_acd`` reader: every byte of an inner
+file is shifted by the key ``generate_key`` derives from the car folder
+name and packed in 4 bytes, in either layout the reader accepts:
+
+- new style, an 8 byte ``(-1111, 0)`` version header first;
+- old style, the inner files straight from the first byte.
+
+Besides packing any set of files, it generates plausible car data at
+configurable sizes: ``engine.ini`` with its power curve,
+``drivetrain.ini``, ``electronics.ini`` and ``tyres.ini`` with the
+temperature and wear curves of every compound, plus filler files to
+reach the size of a real archive.
+
+Usage:
+
+    python tools/acd_writer.py <car folder> [--from-folder DIR] [--old-style]
+                               [--compounds N] [--power-points N] [--temp-points N]
+                               [--wear-points N] [--gears N] [--max-rpm RPM]
+                               [--filler N] [--filler-size BYTES] [--seed N]
+
+The car name, and so the key, is the last part of the car folder, the
+archive is written as ``<car folder>/data.acd``. ``--from-folder``
+packs an unpacked ``data/`` folder instead of generating the files.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import struct
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PLUGIN = ROOT / "apps" / "python" / "LiveTelemetry"
+
+# The plugin modules are imported as ``lib.*``, the same way AC does.
+if str(PLUGIN) not in sys.path:
+    sys.path.insert(0, str(PLUGIN))
+
+from lib.lt_acd import generate_key  # noqa: E402  pylint: disable=wrong-import-position
+
+# Version header of the new style archives, read back as a negative int.
+NEW_STYLE_HEADER = struct.pack("<lL", -1111, 0)
+
+# Kunos short names, in the order compounds are generated.
+SHORT_NAMES = ("SM", "M", "H", "S", "ST", "SV", "SS", "I", "W", "HR")
+
+
+def encrypt(content: bytes, key: str) -> bytes:
+    """Returns ``content`` shifted by ``key`` and packed in 4 bytes per
+    byte. ``content`` must stay below 256 minus the key codes (any ASCII
+    text does), the reader can't recover bytes that wrapped around."""
+    codes = key.encode("ascii")
+    stride = len(codes)
+    packed = bytearray(len(content) * 4)
+    for i, key_code in enumerate(codes):
+        table = bytes((code + key_code) & 0xff for code in range(256))
+        packed[i * 4::stride * 4] = content[i::stride].translate(table)
+    return bytes(packed)
+
+
+def pack_acd(car: str, files: dict[str, str], new_style: bool = True) -> bytes:
+    """Returns the archive of ``files`` (inner name to content) for the
+    car folder named ``car``."""
+    key = generate_key(car)
+    out = bytearray(NEW_STYLE_HEADER if new_style else b"")
+    for name, content in files.items():
+        raw_name = name.encode("utf8")
+        data = content.encode("latin-1")
+        out += struct.pack("<L", len(raw_name)) + raw_name + struct.pack("<L", len(data))
+        out += encrypt(data, key)
+    return bytes(out)
+
+
+def write_acd(path: str | Path, car: str, files: dict[str, str], new_style: bool = True) -> int:
+    """Writes the archive to ``path``, returning its size."""
+    content = pack_acd(car, files, new_style)
+    Path(path).write_bytes(content)
+    return len(content)
+
+
+def make_car(root: str | Path, car: str, files: dict[str, str], new_style: bool = True) -> Path:
+    """Creates ``content/cars/<car>/data.acd`` under ``root`` and returns
+    the car folder."""
+    car_path = Path(root) / "content" / "cars" / car
+    car_path.mkdir(parents=True, exist_ok=True)
+    write_acd(car_path / "data.acd", car, files, new_style)
+    return car_path
+
+
+def read_folder(path: str | Path) -> dict[str, str]:
+    """Returns the files of an unpacked ``data/`` folder."""
+    return {entry.name: entry.read_bytes().decode("latin-1")
+            for entry in sorted(Path(path).iterdir(), key=lambda entry: entry.name) if entry.is_file()}
+
+
+def _lut(points: list[tuple[float, float]], comment: str) -> str:
+    """Formats ``(x, y)`` points as a ``.lut`` file, with the comment
+    header Kunos curves carry (the plugin filters it out)."""
+    return "; {}\n".format(comment) + "\n".join("{:g}|{:.4f}".format(x, y) for x, y in points)
+
+
+def power_lut(points: int = 18, max_rpm: int = 8000, peak_torque: float = 400.0) -> str:
+    """A torque curve peaking around half the rev range, with the power
+    peak at about 85% of the limiter."""
+    top = max_rpm * 1.0625
+    rows = []
+    for index in range(points):
+        rpm = round(top * index / max(points - 1, 1))
+        shape = math.sin(math.pi * min(rpm / top, 1.0) * 0.9)
+        rows.append((rpm, peak_torque * (0.4 + 0.6 * shape)))
+    return _lut(rows, "rpm | torque (Nm)")
+
+
+def temp_lut(points: int = 9, ideal: float = 85.0, spread: float = 120.0) -> str:
+    """A grip over temperature curve peaking at ``ideal`` degrees."""
+    rows = [(round(240.0 * index / max(points - 1, 1), 1),
+             max(0.5, 1.0 - 0.5 * ((240.0 * index / max(points - 1, 1) - ideal) / spread) ** 2))
+            for index in range(points)]
+    return _lut(rows, "temperature (C) | grip")
+
+
+def wear_lut(points: int = 12, drop: float = 0.05) -> str:
+    """A grip over distance curve losing ``drop`` percent per km."""
+    return _lut([(10 * index, 100.0 - 10 * index * drop * (1.0 + index / max(points, 1)))
+                 for index in range(points)], "distance (km) | grip (%)")
+
+
+def engine_ini(max_rpm: int = 8000, turbo: bool = True) -> str:
+    """engine.ini pointing at ``power.lut``."""
+    ini = ("[HEADER]\nVERSION=1\nPOWER_CURVE=power.lut ; torque curve\nCOAST_CURVE=FROM_COAST_REF\n\n"
+           "[ENGINE_DATA]\nALTITUDE_SENSITIVITY=0.1\nINERTIA=0.12\nLIMITER={}\nLIMITER_HZ=30\nMINIMUM=900\n\n"
+           "[COAST_REF]\nRPM={}\nTORQUE=60\nNON_LINEARITY=0\n").format(max_rpm, max_rpm)
+    if turbo:
+        ini += "\n[TURBO_0]\nLAG_DN=0.99\nLAG_UP=0.965\nMAX_BOOST=1.2\nWASTEGATE=1.2\nREFERENCE_RPM=4500\nGAMMA=2.5\n"
+    return ini
+
+
+def drivetrain_ini(gears: int = 6) -> str:
+    """drivetrain.ini with ``gears`` forward ratios, closing up towards the top."""
+    ratios = "".join("GEAR_{}={:.3f}\n".format(gear, 3.2 * 0.78 ** (gear - 1)) for gear in range(1, gears + 1))
+    return ("[HEADER]\nVERSION=3\n\n[TRACTION]\nTYPE=RWD\n\n[GEARS]\nCOUNT={}\nGEAR_R=-3.2\n{}FINAL=3.9\n\n"
+            "[DIFFERENTIAL]\nPOWER=0.3\nCOAST=0.2\nPRELOAD=40\n").format(gears, ratios)
+
+
+def electronics_ini(abs_slip: float = 0.17, abs_hz: float = 30.0) -> str:
+    """electronics.ini with ABS and traction control."""
+    return ("[ABS]\nSLIP_RATIO_LIMIT={}\nCURVE=abs.lut\nPRESENT=1\nACTIVE=1\nRATE_HZ={:g}\n\n"
+            "[TRACTION_CONTROL]\nSLIP_RATIO_LIMIT=0.15\nCURVE=tcs.lut\nPRESENT=1\nACTIVE=1\nRATE_HZ=50\n").format(abs_slip, abs_hz)
+
+
+def tyres_ini(compounds: int = 1) -> str:
+    """tyres.ini with ``compounds`` compounds per axle, the first being
+    the default, each with its own temperature and wear curves."""
+    sections = ["[HEADER]\nVERSION=10\n\n[COMPOUND_DEFAULT]\nINDEX=0\n"]
+    for index in range(compounds):
+        suffix = "" if index == 0 else "_{}".format(index)
+        for axle in ("FRONT", "REAR"):
+            lower = "{}{}".format(axle.lower(), suffix)
+            sections.append(
+                "[{axle}{suffix}]\nNAME=Compound {index}\nSHORT_NAME={short}\nWIDTH=0.265\nRADIUS=0.33\n"
+                "PRESSURE_STATIC=24\nPRESSURE_IDEAL={ideal}\nWEAR_CURVE=wear_{lower}.lut\n\n"
+                "[THERMAL_{axle}{suffix}]\nSURFACE_TRANSFER=0.0150\nPERFORMANCE_CURVE=temps_{lower}.lut\n".format(
+                    axle=axle, suffix=suffix, index=index, short=SHORT_NAMES[index % len(SHORT_NAMES)],
+                    ideal=26 + index, lower=lower))
+    return "\n".join(sections)
+
+
+def filler_files(count: int, size: int, rng: random.Random | None = None) -> dict[str, str]:
+    """``count`` INI files of about ``size`` characters, standing in for
+    the inner files a car carries but the plugin never reads."""
+    rng = rng or random.Random(0)
+    files = {}
+    for index in range(count):
+        lines = ["[DATA]"]
+        length = 7
+        while length < size:
+            line = "KEY_{:05d}={:.6f}, {:.6f} ; filler".format(len(lines), rng.uniform(-10, 10), rng.uniform(0, 100))
+            lines.append(line)
+            length += len(line) + 1
+        files["extra_{:03d}.ini".format(index)] = "\n".join(lines) + "\n"
+    return files
+
+
+def synthetic_car(compounds: int = 1, power_points: int = 18, temp_points: int = 9, wear_points: int = 12,  # pylint: disable=too-many-arguments
+                  gears: int = 6, max_rpm: int = 8000, filler: int = 0, filler_size: int = 0,
+                  seed: int = 0) -> dict[str, str]:
+    """The inner files of a plausible car, ready for ``pack_acd``."""
+    rng = random.Random(seed)
+    files = {
+        "engine.ini": engine_ini(max_rpm),
+        "power.lut": power_lut(power_points, max_rpm),
+        "drivetrain.ini": drivetrain_ini(gears),
+        "electronics.ini": electronics_ini(),
+        "tyres.ini": tyres_ini(compounds),
+    }
+    for index in range(compounds):
+        suffix = "" if index == 0 else "_{}".format(index)
+        for axle in ("front", "rear"):
+            files["temps_{}{}.lut".format(axle, suffix)] = temp_lut(temp_points, 80.0 + 5.0 * index + rng.uniform(-2, 2))
+            files["wear_{}{}.lut".format(axle, suffix)] = wear_lut(wear_points, 0.04 + 0.01 * index)
+    files.update(filler_files(filler, filler_size, rng))
+    return files
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic data.acd.")
+    parser.add_argument("car", type=Path, help="car folder, its name is the archive key")
+    parser.add_argument("--from-folder", type=Path, default=None, help="pack this unpacked data/ folder")
+    parser.add_argument("--old-style", action="store_true", help="write the layout without version header")
+    parser.add_argument("--compounds", type=int, default=1, help="tyre compounds per axle")
+    parser.add_argument("--power-points", type=int, default=18, help="points of the power curve")
+    parser.add_argument("--temp-points", type=int, default=9, help="points of each temperature curve")
+    parser.add_argument("--wear-points", type=int, default=12, help="points of each wear curve")
+    parser.add_argument("--gears", type=int, default=6, help="forward gears")
+    parser.add_argument("--max-rpm", type=int, default=8000, help="rev limiter")
+    parser.add_argument("--filler", type=int, default=0, help="extra inner files the plugin doesn't read")
+    parser.add_argument("--filler-size", type=int, default=16 * 1024, help="characters per filler file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the generated values")
+    args = parser.parse_args(argv)
+
+    if args.from_folder is not None:
+        if not args.from_folder.is_dir():
+            sys.stderr.write("not a folder: {}\n".format(args.from_folder))
+            return 2
+        files = read_folder(args.from_folder)
+    else:
+        files = synthetic_car(args.compounds, args.power_points, args.temp_points, args.wear_points,
+                              args.gears, args.max_rpm, args.filler, args.filler_size, args.seed)
+
+    car = args.car.resolve().name
+    args.car.mkdir(parents=True, exist_ok=True)
+    size = write_acd(args.car / "data.acd", car, files, not args.old_style)
+    print("{}: {} inner files, {} bytes, key {}".format(args.car / "data.acd", len(files), size, generate_key(car)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
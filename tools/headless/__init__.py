@@ -0,0 +1,25 @@
+"""Headless stand-ins for Assetto Corsa's ``ac`` and ``acsys`` modules.
+
+Lets the plugin run on any OS without the game: ``install()`` registers
+recording versions of both modules, after which ``LiveTelemetry.py`` and
+every ``lib`` module import normally. ``lib.sim_info.info`` needs no
+stand-in, off Windows it maps plain memory that ``SyntheticDrive`` fills.
+
+    from headless import SyntheticDrive, install
+
+    recorder = install()
+    import LiveTelemetry
+    LiveTelemetry.acMain("1.0")
+    ...
+    recorder.next_frame()
+    LiveTelemetry.acUpdate(1 / 60)
+    recorder.render(1 / 60)
+    recorder.counts(recorder.frame)
+
+See ``tools/run_headless.py`` for a complete session runner.
+"""
+from .backend import APP, GL, LABEL, PLUGIN, ROOT, WINDOW, Command, Control, Recorder, install
+from .driving import SyntheticDrive
+
+__all__ = ["APP", "GL", "LABEL", "PLUGIN", "ROOT", "WINDOW", "Command", "Control", "Recorder",
+           "SyntheticDrive", "install"]
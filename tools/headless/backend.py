@@ -0,0 +1,289 @@
+"""Recording stand-ins for AC's ``ac`` and ``acsys`` modules.
+
+``install`` registers both modules in ``sys.modules`` before the plugin
+is imported. Every GL primitive, label mutation and window call the
+plugin makes is then appended to ``Recorder.commands`` as a ``Command``,
+tagged with the frame and the window being rendered, while the recorder
+keeps the current state of every window and label the same way the game
+would. The recorder also plays the game side: it invokes the render
+callbacks and the click listeners the plugin registered.
+"""
+from __future__ import annotations
+
+import sys
+import types
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+
+ROOT = Path(__file__).resolve().parents[2]
+PLUGIN = ROOT / "apps" / "python" / "LiveTelemetry"
+
+GL = "gl"
+LABEL = "label"
+WINDOW = "window"
+APP = "app"
+
+
+class Command(NamedTuple):
+    """One recorded API call. ``window`` is the window whose render
+    callback was running, -1 outside of rendering."""
+    frame: int
+    window: int
+    kind: str
+    name: str
+    args: tuple
+
+
+@dataclass
+class Control:
+    """State of a window, label or button as the game would keep it."""
+    kind: str
+    parent: int
+    text: str = ""
+    color: tuple = (1.0, 1.0, 1.0, 1.0)
+    font_size: float = 0.0
+    alignment: str = "left"
+    position: tuple = (0.0, 0.0)
+    size: tuple = (0.0, 0.0)
+    extra: dict = field(default_factory=dict)
+
+
+class Recorder:  # pylint: disable=too-many-instance-attributes
+    """Command log and game-side state behind the stand-in modules."""
+
+    def __init__(self, car_name: str = "headless", tyre_compound: str = ""):
+        self.car_name = car_name
+        self.tyre_compound = tyre_compound
+        # acsys.CS value -> per-wheel tuple returned by getCarState.
+        self.car_state: dict[int, tuple] = {}
+        self.commands: list[Command] = []
+        self.controls: dict[int, Control] = {}
+        self.frame = 0
+        self.window = -1
+        self.render_callbacks: dict[int, Callable] = {}
+        self.click_listeners: dict[int, Callable] = {}
+        self.activated_listeners: dict[int, Callable] = {}
+        self.dismissed_listeners: dict[int, Callable] = {}
+        self.messages: list[str] = []
+        # Off for timing runs: the calls still update the controls but
+        # the command log and the messages stay empty.
+        self.recording = True
+        self.__next_id = 1
+
+    def add_control(self, kind: str, parent: int, text: str = "") -> int:
+        """Creates a control and returns its id, shared by every kind like in AC."""
+        control_id = self.__next_id
+        self.__next_id += 1
+        self.controls[control_id] = Control(kind, parent, text)
+        return control_id
+
+    def click(self, control_id: int) -> None:
+        """Clicks a button, calling the listener the plugin registered."""
+        self.click_listeners[control_id](0, 0)
+
+    def counts(self, frame: int | None = None) -> Counter:
+        """Returns how many times each call was made, in one frame or overall."""
+        return Counter(command.name for command in self.commands if frame is None or command.frame == frame)
+
+    def kind_counts(self, frame: int | None = None) -> Counter:
+        """Returns how many GL, label, window and app calls were made."""
+        return Counter(command.kind for command in self.commands if frame is None or command.frame == frame)
+
+    def next_frame(self) -> None:
+        """Starts recording the next frame."""
+        self.frame += 1
+
+    def record(self, kind: str, name: str, *args: Any) -> None:
+        """Appends one call to the command log."""
+        if self.recording:
+                self.commands.append(Command(self.frame, self.window, kind, name, args))
+
+    def render(self, delta_t: float) -> None:
+        """Calls every render callback, as AC does once per rendered frame."""
+        for window_id, callback in list(self.render_callbacks.items()):
+            self.window = window_id
+            try:
+                callback(delta_t)
+            finally:
+                self.window = -1
+
+    def reset(self) -> None:
+        """Drops the recorded commands, keeping the controls and callbacks."""
+        self.commands = []
+        self.messages = []
+
+    def to_dicts(self) -> list[dict]:
+        """Returns the command log as JSON-friendly dictionaries."""
+        return [{"frame": command.frame, "window": command.window, "kind": command.kind,
+                 "name": command.name, "args": [list(arg) if isinstance(arg, tuple) else arg for arg in command.args]}
+                for command in self.commands]
+
+
+def _kind_of(recorder: Recorder, control_id: int) -> str:
+    """Label calls on windows (setPosition, setSize...) count as window calls."""
+    control = recorder.controls.get(control_id)
+    return WINDOW if control is None or control.kind == "window" else LABEL
+
+
+def make_ac(recorder: Recorder) -> types.ModuleType:  # pylint: disable=too-many-locals,too-many-statements
+    """Builds the stand-in ``ac`` module on top of ``recorder``."""
+    module = types.ModuleType("ac")
+    module.__doc__ = "Headless stand-in for Assetto Corsa's ac module."
+
+    # Console and app.
+    def console(message):
+        if recorder.recording:
+            recorder.messages.append(str(message))
+        recorder.record(APP, "console", message)
+
+    def log(message):
+        if recorder.recording:
+            recorder.messages.append(str(message))
+        recorder.record(APP, "log", message)
+
+    def getCarName(car):  # pylint: disable=invalid-name,unused-argument
+        return recorder.car_name
+
+    def getCarState(car, state, *_args):  # pylint: disable=invalid-name,unused-argument
+        return recorder.car_state.get(state, (0.0, 0.0, 0.0, 0.0))
+
+    def getCarTyreCompound(car):  # pylint: disable=invalid-name,unused-argument
+        return recorder.tyre_compound
+
+    def initFont(*args):  # pylint: disable=invalid-name
+        recorder.record(APP, "initFont", *args)
+
+    def newTexture(path):  # pylint: disable=invalid-name
+        texture_id = recorder.add_control("texture", -1, str(path))
+        recorder.record(APP, "newTexture", path)
+        return texture_id
+
+    # Windows and controls.
+    def newApp(title):  # pylint: disable=invalid-name
+        window_id = recorder.add_control("window", -1, title)
+        recorder.record(WINDOW, "newApp", title)
+        return window_id
+
+    def addLabel(window_id, text):  # pylint: disable=invalid-name
+        label_id = recorder.add_control("label", window_id, text)
+        recorder.record(LABEL, "addLabel", window_id, text)
+        return label_id
+
+    def addButton(window_id, text):  # pylint: disable=invalid-name
+        button_id = recorder.add_control("button", window_id, text)
+        recorder.record(LABEL, "addButton", window_id, text)
+        return button_id
+
+    def setText(control_id, text):  # pylint: disable=invalid-name
+        recorder.controls[control_id].text = text
+        recorder.record(_kind_of(recorder, control_id), "setText", control_id, text)
+
+    def setFontColor(control_id, r, g, b, a):  # pylint: disable=invalid-name,too-many-arguments
+        recorder.controls[control_id].color = (r, g, b, a)
+        recorder.record(_kind_of(recorder, control_id), "setFontColor", control_id, r, g, b, a)
+
+    def setFontSize(control_id, size):  # pylint: disable=invalid-name
+        recorder.controls[control_id].font_size = size
+        recorder.record(_kind_of(recorder, control_id), "setFontSize", control_id, size)
+
+    def setFontAlignment(control_id, alignment):  # pylint: disable=invalid-name
+        recorder.controls[control_id].alignment = alignment
+        recorder.record(_kind_of(recorder, control_id), "setFontAlignment", control_id, alignment)
+
+    def setCustomFont(control_id, *args):  # pylint: disable=invalid-name
+        recorder.controls[control_id].extra["font"] = args
+        recorder.record(_kind_of(recorder, control_id), "setCustomFont", control_id, *args)
+
+    def setPosition(control_id, x, y):  # pylint: disable=invalid-name
+        recorder.controls[control_id].position = (x, y)
+        recorder.record(_kind_of(recorder, control_id), "setPosition", control_id, x, y)
+
+    def getPosition(control_id):  # pylint: disable=invalid-name
+        return list(recorder.controls[control_id].position)
+
+    def setSize(control_id, width, height):  # pylint: disable=invalid-name
+        recorder.controls[control_id].size = (width, height)
+        recorder.record(_kind_of(recorder, control_id), "setSize", control_id, width, height)
+
+    def setTitle(window_id, title):  # pylint: disable=invalid-name
+        recorder.controls[window_id].extra["title"] = title
+        recorder.record(WINDOW, "setTitle", window_id, title)
+
+    def setIconPosition(window_id, x, y):  # pylint: disable=invalid-name
+        recorder.controls[window_id].extra["icon"] = (x, y)
+        recorder.record(WINDOW, "setIconPosition", window_id, x, y)
+
+    def setBackgroundOpacity(window_id, opacity):  # pylint: disable=invalid-name
+        recorder.controls[window_id].extra["opacity"] = opacity
+        recorder.record(WINDOW, "setBackgroundOpacity", window_id, opacity)
+
+    def drawBorder(window_id, border):  # pylint: disable=invalid-name
+        recorder.controls[window_id].extra["border"] = border
+        recorder.record(WINDOW, "drawBorder", window_id, border)
+
+    # Listeners.
+    def addRenderCallback(window_id, callback):  # pylint: disable=invalid-name
+        recorder.render_callbacks[window_id] = callback
+        return 1
+
+    def addOnClickedListener(control_id, callback):  # pylint: disable=invalid-name
+        recorder.click_listeners[control_id] = callback
+        return 1
+
+    def addOnAppActivatedListener(window_id, callback):  # pylint: disable=invalid-name
+        recorder.activated_listeners[window_id] = callback
+        return 1
+
+    def addOnAppDismissedListener(window_id, callback):  # pylint: disable=invalid-name
+        recorder.dismissed_listeners[window_id] = callback
+        return 1
+
+    # GL primitives.
+    def glBegin(primitive):  # pylint: disable=invalid-name
+        recorder.record(GL, "glBegin", primitive)
+
+    def glEnd():  # pylint: disable=invalid-name
+        recorder.record(GL, "glEnd")
+
+    def glVertex2f(x, y):  # pylint: disable=invalid-name
+        recorder.record(GL, "glVertex2f", x, y)
+
+    def glColor4f(r, g, b, a):  # pylint: disable=invalid-name
+        recorder.record(GL, "glColor4f", r, g, b, a)
+
+    def glQuad(x, y, width, height):  # pylint: disable=invalid-name
+        recorder.record(GL, "glQuad", x, y, width, height)
+
+    def glQuadTextured(x, y, width, height, texture_id):  # pylint: disable=invalid-name,too-many-arguments
+        recorder.record(GL, "glQuadTextured", x, y, width, height, texture_id)
+
+    for name, value in list(locals().items()):
+        if callable(value):
+            setattr(module, name, value)
+    return module
+
+
+def make_acsys() -> types.ModuleType:
+    """Builds the stand-in ``acsys`` module. Only the names matter to the
+    recorder, the GL values follow the game's own ``acsys.py``."""
+    module = types.ModuleType("acsys")
+    module.__doc__ = "Headless stand-in for Assetto Corsa's acsys module."
+    module.GL = types.SimpleNamespace(Lines=0, LineStrip=1, Triangles=2, Quads=3)
+    module.CS = types.SimpleNamespace(SpeedMS=0, SpeedMPH=1, SpeedKMH=2, Gas=3, Brake=4, Clutch=5, Gear=6,
+                                      RPM=8, Steer=14, SuspensionTravel=48)
+    return module
+
+
+def install(recorder: Recorder | None = None) -> Recorder:
+    """Registers the stand-in modules and puts the plugin folder on the
+    path, so ``import ac`` and ``from lib... import ...`` behave as inside
+    AC. Must run before any plugin module is imported."""
+    recorder = recorder or Recorder()
+    sys.modules["ac"] = make_ac(recorder)
+    sys.modules["acsys"] = make_acsys()
+    if str(PLUGIN) not in sys.path:
+        sys.path.insert(0, str(PLUGIN))
+    return recorder
@@ -0,0 +1,93 @@
+"""Synthetic telemetry written into the plugin's own ``sim_info.info``.
+
+Outside Windows ``lib.sim_info`` maps zeroed anonymous memory instead of
+AC's shared memory pages, so a headless run fills the same ctypes
+structures the game would. ``SyntheticDrive`` loops a simple lap: the
+engine sweeps through the gears while tyre temperatures, pressures,
+ride height, camber and suspension travel oscillate around plausible
+values, so every widget keeps redrawing with changing numbers. The same
+drive feeds the file-backed pages of ``tools/telemetry_driver.py``, where
+there is no recorder and the lap counters matter.
+"""
+from __future__ import annotations
+
+import math
+
+
+class SyntheticDrive:
+    """Deterministic driving state as a function of the frame number."""
+
+    def __init__(self, hz: float = 60.0, max_rpm: int = 8000, gears: int = 6, lap_seconds: float = 90.0):
+        self.hz = hz
+        self.max_rpm = max_rpm
+        self.gears = gears
+        self.lap_seconds = lap_seconds
+
+    def setup(self, info, recorder=None, car: str = "headless", track: str = "headless_ring") -> None:
+        """Writes the static page, once per session like AC does."""
+        static = info.static
+        static.carModel = car
+        static.track = track
+        static.sectorCount = 3
+        static.maxRpm = self.max_rpm
+        static.maxPower = 300000.0
+        static.maxTurboBoost = 1.2
+        static.kersMaxJ = 0.0
+        for index in range(4):
+            static.suspensionMaxTravel[index] = 0.1
+        info.graphics.status = 2  # AC_LIVE
+        if recorder is not None:
+            recorder.car_state.clear()
+
+    def step(self, info, recorder, frame: int) -> None:
+        """Writes the physics and graphics pages of one frame. The
+        suspension travel also goes to the recorder, the plugin reads it
+        through ``ac.getCarState``."""
+        seconds = frame / self.hz
+        physics = info.physics
+        physics.packetId = frame
+        # Each gear pulls from 60% to 100% of the rev range in 4 s.
+        gear_phase = (seconds / 4.0) % self.gears
+        physics.gear = 2 + int(gear_phase)
+        physics.rpms = int(self.max_rpm * (0.6 + 0.4 * (gear_phase % 1.0)))
+        physics.speedKmh = 60.0 + 30.0 * gear_phase
+        physics.turboBoost = 1.0 + 0.2 * math.sin(seconds)
+        physics.brake = 1.0 if (gear_phase % 1.0) > 0.95 else 0.0
+        physics.abs = 1.0
+        physics.tc = 1.0
+        physics.fuel = max(0.0, 60.0 - seconds * 0.01)
+        physics.brakeBias = 0.58
+        physics.rideHeight[0] = 0.05 + 0.005 * math.sin(seconds * 3.0)
+        physics.rideHeight[1] = 0.06 + 0.005 * math.sin(seconds * 3.0 + 1.0)
+        travel = []
+        for index in range(4):
+            offset = index * 0.7
+            physics.tyreCoreTemperature[index] = 80.0 + 10.0 * math.sin(seconds / 5.0 + offset)
+            physics.tyreTempI[index] = 82.0 + 12.0 * math.sin(seconds / 3.0 + offset)
+            physics.tyreTempM[index] = 80.0 + 10.0 * math.sin(seconds / 3.5 + offset)
+            physics.tyreTempO[index] = 78.0 + 8.0 * math.sin(seconds / 4.0 + offset)
+            physics.wheelsPressure[index] = 27.0 + 0.8 * math.sin(seconds / 6.0 + offset)
+            physics.camberRAD[index] = -0.05 + 0.004 * math.sin(seconds * 2.0 + offset)
+            physics.wheelLoad[index] = 3000.0 + 1500.0 * math.sin(seconds * 1.5 + offset)
+            physics.tyreWear[index] = 99.0 - seconds * 0.001
+            physics.tyreDirtyLevel[index] = 0.0
+            physics.wheelSlip[index] = 0.05
+            physics.wheelAngularSpeed[index] = physics.speedKmh / 3.6 / 0.33
+            travel.append(0.05 + 0.02 * math.sin(seconds * 4.0 + offset))
+            physics.suspensionTravel[index] = travel[index]
+        if recorder is not None:
+            recorder.car_state[_suspension_travel()] = tuple(travel)
+        graphics = info.graphics
+        graphics.packetId = frame
+        laps, lap_time = divmod(seconds, self.lap_seconds)
+        graphics.completedLaps = int(laps)
+        graphics.iCurrentTime = int(lap_time * 1000.0)
+        graphics.iLastTime = int(self.lap_seconds * 1000.0) if laps > 0 else 0
+        graphics.normalizedCarPosition = lap_time / self.lap_seconds
+        graphics.currentSectorIndex = int(3 * lap_time / self.lap_seconds)
+
+
+def _suspension_travel() -> int:
+    """Returns the acsys value the plugin reads suspension travel with."""
+    import acsys  # pylint: disable=import-outside-toplevel
+    return acsys.CS.SuspensionTravel
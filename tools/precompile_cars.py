@@ -0,0 +1,102 @@
+"""Pre-compile the car cache for every car of an Assetto Corsa install.
+
+Walks a ``content/cars`` folder and, for each car with a ``data.acd`` or
+an unpacked ``data/`` folder, decodes it with the plugin's own ``ACD``
+reader and stores the compiled car profile in the plugin cache, the
+same file the plugin would write on the first session with that car.
+Cars whose cache is still valid are skipped.
+
+Usage:
+
+    python tools/precompile_cars.py <content/cars> [--cache-dir DIR] [--jobs N] [--verbose]
+
+The cache folder defaults to ``apps/python/LiveTelemetry/cfg/cache`` of
+the AC install owning the cars folder. Exits 1 when any car failed.
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PLUGIN = ROOT / "apps" / "python" / "LiveTelemetry"
+
+# The plugin modules are imported as ``lib.*``, the same way AC does.
+sys.path.insert(0, str(PLUGIN))
+
+from lib.lt_cache import CarCache, source_fingerprint  # noqa: E402  pylint: disable=wrong-import-position
+from lib.lt_profile import load_profile  # noqa: E402  pylint: disable=wrong-import-position
+
+
+def _quiet_worker() -> None:
+    """Silences the plugin log inside pool workers."""
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+
+
+def compile_car(job: tuple[str, str]) -> tuple[str, str, int, str]:
+    """Compiles one car, returning ``(car, status, source bytes, error)``
+    where status is ``compiled``, ``cached`` or ``failed``."""
+    car_path, cache_dir = job
+    car = car_path.split("/")[-1]
+    try:
+        source = source_fingerprint(car_path)
+        if source is None:
+            return car, "failed", 0, "no data.acd or data/ folder"
+        cache = CarCache(car_path, cache_dir)
+        if cache.has("profile"):
+            return car, "cached", 0, ""
+        load_profile(car_path, cache)
+        if not CarCache(car_path, cache_dir).has("profile"):
+            return car, "failed", source["size"], "cache was not written"
+        return car, "compiled", source["size"], ""
+    except Exception as exc:  # pylint: disable=broad-except
+        return car, "failed", 0, "{}: {}".format(type(exc).__name__, exc)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Pre-compile the Live Telemetry car cache.")
+    parser.add_argument("cars", type=Path, help="the content/cars folder")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help="cache folder (default: <cars>/../../apps/python/LiveTelemetry/cfg/cache)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--verbose", action="store_true", help="show the plugin log of every car")
+    args = parser.parse_args(argv)
+
+    if not args.cars.is_dir():
+        sys.stderr.write("not a folder: {}\n".format(args.cars))
+        return 2
+    cache_dir = args.cache_dir or args.cars.resolve().parents[1] / "apps" / "python" / "LiveTelemetry" / "cfg" / "cache"
+
+    # Forward slashes: the ACD key is derived from the last path part.
+    cars_dir = args.cars.as_posix().rstrip("/")
+    jobs = [("{}/{}".format(cars_dir, entry.name), str(cache_dir))
+            for entry in sorted(args.cars.iterdir(), key=lambda entry: entry.name) if entry.is_dir()]
+
+    counts = {"compiled": 0, "cached": 0, "failed": 0}
+    total_bytes = 0
+    start = time.perf_counter()
+    with multiprocessing.Pool(max(1, args.jobs), initializer=None if args.verbose else _quiet_worker) as pool:
+        for car, status, size, error in pool.imap_unordered(compile_car, jobs):
+            counts[status] += 1
+            if status == "compiled":
+                total_bytes += size
+            elif status == "failed":
+                sys.stderr.write("FAILED {}: {}\n".format(car, error))
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    compiled = counts["compiled"]
+    print("{} cars in {:.2f} s: {} compiled, {} already cached, {} failed".format(
+        len(jobs), elapsed, compiled, counts["cached"], counts["failed"]))
+    print("{:.1f} cars/s, {:.2f} MB/s of car data compiled".format(
+        compiled / elapsed, total_bytes / elapsed / (1024.0 * 1024.0)))
+    print("cache: {}".format(cache_dir))
+    return 1 if counts["failed"] > 0 else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
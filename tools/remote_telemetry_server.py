@@ -0,0 +1,138 @@
+"""Stand-in for AC's UDP remote telemetry server.
+
+Answers the handshake of ``resources/docs/ACRemoteTelemetryDocumentation.pdf``
+and streams an ``RTCarInfo`` of the ``SyntheticDrive`` lap to every client
+that subscribed to updates, at the physics rate, until it dismisses. Lets
+the plugin's ``udp`` telemetry source run on any OS:
+
+    python tools/remote_telemetry_server.py --hz 333 &
+    python tools/run_headless.py --source udp:127.0.0.1:9996 --frames 600
+
+Usage:
+
+    python tools/remote_telemetry_server.py [--host HOST] [--port PORT] [--hz HZ]
+                                            [--seconds S] [--car NAME] [--driver NAME]
+                                            [--track NAME] [--lap-seconds S]
+
+Spot (lap) events are not sent. Runs until ``--seconds`` elapsed (forever
+by default) or Ctrl+C, then prints how many updates it sent.
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import select
+import socket
+import sys
+import time
+from types import SimpleNamespace
+
+from headless import PLUGIN, SyntheticDrive
+
+if str(PLUGIN) not in sys.path:
+    sys.path.insert(0, str(PLUGIN))
+# pylint: disable=wrong-import-position,import-error
+from lib.lt_telemetry import (RT_DISMISS, RT_HANDSHAKE, RT_PORT, RT_SUBSCRIBE_UPDATE, RTCarInfo,
+                              RTHandshaker, RTHandshakerResponse)
+from lib.sim_info import SPageFileGraphic, SPageFilePhysics, SPageFileStatic
+
+
+def encode_name(field, text: str) -> None:
+    """Writes ``text`` into a UTF-16 name of a handshake response."""
+    encoded = text.encode("utf-16-le")[:2 * (len(field) - 1)]
+    ctypes.memmove(field, encoded, len(encoded))
+
+
+def handshake_response(car: str, driver: str, track: str) -> bytes:
+    """Returns AC's answer to a handshake."""
+    response = RTHandshakerResponse(identifier=4242, version=1)
+    encode_name(response.carName, car)
+    encode_name(response.driverName, driver)
+    encode_name(response.trackName, track)
+    return bytes(response)
+
+
+def car_info(pages) -> bytes:
+    """Returns the ``RTCarInfo`` of the pages a ``SyntheticDrive`` wrote."""
+    physics = pages.physics
+    graphics = pages.graphics
+    car = RTCarInfo(identifier=b"a", size=ctypes.sizeof(RTCarInfo))
+    car.speed_Kmh = physics.speedKmh
+    car.speed_Mph = physics.speedKmh / 1.609344
+    car.speed_Ms = physics.speedKmh / 3.6
+    car.isAbsEnabled = physics.abs > 0.0
+    car.isTcEnabled = physics.tc > 0.0
+    car.lapTime = graphics.iCurrentTime
+    car.lastLap = graphics.iLastTime
+    car.lapCount = graphics.completedLaps
+    car.brake = physics.brake
+    car.engineRPM = physics.rpms
+    car.gear = physics.gear
+    for index in range(4):
+        car.wheelAngularSpeed[index] = physics.wheelAngularSpeed[index]
+        car.tyreSlip[index] = physics.wheelSlip[index]
+        car.load[index] = physics.wheelLoad[index]
+        car.tyreDirtyLevel[index] = physics.tyreDirtyLevel[index]
+        car.camberRAD[index] = physics.camberRAD[index]
+    car.carPositionNormalized = graphics.normalizedCarPosition
+    return bytes(car)
+
+
+def main(argv: list[str]) -> int:  # pylint: disable=too-many-locals
+    parser = argparse.ArgumentParser(description="Serve synthetic AC remote telemetry over UDP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=RT_PORT, help="UDP port, AC uses 9996")
+    parser.add_argument("--hz", type=float, default=333.0, help="updates per second")
+    parser.add_argument("--seconds", type=float, default=0.0, help="stop after this long, 0 runs until Ctrl+C")
+    parser.add_argument("--car", default="headless", help="car name of the handshake")
+    parser.add_argument("--driver", default="Headless Driver", help="driver name of the handshake")
+    parser.add_argument("--track", default="headless_ring", help="track name of the handshake")
+    parser.add_argument("--lap-seconds", type=float, default=90.0, help="length of the synthetic lap")
+    args = parser.parse_args(argv)
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind((args.host, args.port))
+    pages = SimpleNamespace(physics=SPageFilePhysics(), graphics=SPageFileGraphic(), static=SPageFileStatic())
+    drive = SyntheticDrive(args.hz, lap_seconds=args.lap_seconds)
+    drive.setup(pages, car=args.car, track=args.track)
+    response = handshake_response(args.car, args.driver, args.track)
+    print("serving {} Hz on {}:{}".format(args.hz, args.host, args.port))
+
+    clients: set = set()
+    period = 1.0 / args.hz
+    start = time.perf_counter()
+    sent = 0
+    tick = 0
+    try:
+        while args.seconds <= 0.0 or tick * period < args.seconds:
+            # Answers the clients until the next tick is due.
+            delay = start + (tick + 1) * period - time.perf_counter()
+            while delay > 0.0 and select.select([server], [], [], delay)[0]:
+                datagram, address = server.recvfrom(1024)
+                if len(datagram) == ctypes.sizeof(RTHandshaker):
+                    operation = RTHandshaker.from_buffer_copy(datagram).operationId
+                    if operation == RT_HANDSHAKE:
+                        server.sendto(response, address)
+                    elif operation == RT_SUBSCRIBE_UPDATE:
+                        clients.add(address)
+                        print("{}:{} subscribed".format(*address))
+                    elif operation == RT_DISMISS:
+                        clients.discard(address)
+                        print("{}:{} dismissed".format(*address))
+                delay = start + (tick + 1) * period - time.perf_counter()
+            tick += 1
+            if clients:
+                drive.step(pages, None, tick)
+                update = car_info(pages)
+                for address in clients:
+                    server.sendto(update, address)
+                    sent += 1
+    except KeyboardInterrupt:
+        pass
+    print("{} updates sent in {} ticks".format(sent, tick))
+    server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,200 @@
+"""Run the plugin headless: acMain, then acUpdate and the render callbacks
+for a number of frames, on top of the recording ``ac`` stand-in.
+
+Reports how long acMain took, the per-frame cost of acUpdate and of the
+render callbacks, and how many GL, label and window calls each frame
+made. The telemetry comes from ``headless.SyntheticDrive``, or with
+``--external`` from another process writing the file-backed pages
+``LT_SHM_DIR`` points at (see ``tools/telemetry_driver.py``). Frames are
+then paced in real time at ``--hz`` and the report adds how many
+physics packets the frames saw, repeated and missed. ``--source`` reads
+another telemetry source instead of the pages, a recording or a UDP
+remote telemetry server such as ``tools/remote_telemetry_server.py``,
+also in real time.
+
+Usage:
+
+    python tools/run_headless.py [--frames N] [--hz HZ] [--car NAME] [--compound NAME]
+                                 [--ac-root DIR] [--dump FILE] [--external]
+                                 [--source udp:HOST:PORT|replay:FILE] [--cfg-dir DIR]
+                                 [--compare-startup]
+
+``--ac-root`` is the folder holding ``content/cars/<car>`` (default: the
+repository root). Without a readable car the plugin falls back to its
+neutral profile, which still draws every widget. ``--dump`` writes the
+full command log as JSON. acShutdown is not called, so no CSV log is
+written. ``conf.ini`` and the car cache go to a temporary folder, or to
+``--cfg-dir`` (``LT_CFG_DIR`` when set) to keep them between runs; the
+plugin's own ``cfg`` is never touched.
+
+``--compare-startup`` measures how long acMain takes to return with the
+car data loading in background and with acMain loading it itself
+(``LT_BLOCKING_LOAD``, the path before the loader thread). Each is a run
+of its own, from a cold car cache unless ``--cfg-dir`` is shared.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from headless import APP, GL, LABEL, ROOT, WINDOW, Recorder, SyntheticDrive, install
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def startup_ms(argv: list[str], blocking: bool) -> float:
+    """Runs acMain alone in a child runner, returns the time it took."""
+    env = dict(os.environ)
+    env.pop("LT_BLOCKING_LOAD", None)
+    if blocking:
+        env["LT_BLOCKING_LOAD"] = "1"
+    output = subprocess.run([sys.executable, __file__, "--frames", "0"] + argv, env=env, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return float(re.search(r"^acMain: ([0-9.]+) ms", output, re.MULTILINE).group(1))
+
+
+def compare_startup(argv: list[str]) -> int:
+    """Prints acMain's time with the car data loading in background and
+    with acMain loading it itself, both measured."""
+    argv = [arg for arg in argv if arg != "--compare-startup"]
+    background = startup_ms(argv, False)
+    blocking = startup_ms(argv, True)
+    print("acMain: {:.1f} ms loading the car data in background, {:.1f} ms loading it itself".format(
+        background, blocking))
+    return 0
+
+
+def main(argv: list[str]) -> int:  # pylint: disable=too-many-locals
+    parser = argparse.ArgumentParser(description="Run Live Telemetry without Assetto Corsa.")
+    parser.add_argument("--frames", type=int, default=600, help="frames to run")
+    parser.add_argument("--hz", type=float, default=60.0, help="simulated frame rate")
+    parser.add_argument("--car", default="headless", help="car folder name under content/cars")
+    parser.add_argument("--compound", default="", help="tyre compound short name reported by the car")
+    parser.add_argument("--ac-root", default=str(ROOT), help="folder holding content/cars")
+    parser.add_argument("--dump", default=None, help="write the command log to this JSON file")
+    parser.add_argument("--external", action="store_true",
+                        help="read the pages another process writes into LT_SHM_DIR, in real time")
+    parser.add_argument("--source", default=None,
+                        help="telemetry source of the plugin, udp:HOST:PORT or replay:FILE, in real time")
+    parser.add_argument("--cfg-dir", default=os.environ.get("LT_CFG_DIR") or None,
+                        help="folder of conf.ini and the car cache (default: LT_CFG_DIR, else a temporary folder)")
+    parser.add_argument("--compare-startup", action="store_true",
+                        help="measure acMain with the car data loading in background and loading in acMain")
+    args = parser.parse_args(argv)
+    if args.compare_startup:
+        return compare_startup(argv)
+    if args.external and not os.environ.get("LT_SHM_DIR"):
+        parser.error("--external needs LT_SHM_DIR, the folder tools/telemetry_driver.py writes to")
+    if args.source:
+        if args.external:
+            parser.error("--source and --external are exclusive")
+        os.environ["LT_TELEMETRY"] = args.source
+    paced_run = args.external or bool(args.source)
+    temp_cfg = None
+    if args.cfg_dir:
+        os.environ["LT_CFG_DIR"] = os.path.abspath(args.cfg_dir)
+    else:
+        temp_cfg = tempfile.TemporaryDirectory(prefix="lt_headless_")
+        os.environ["LT_CFG_DIR"] = temp_cfg.name
+
+    dump_path = os.path.abspath(args.dump) if args.dump else None
+    recorder = install(Recorder(args.car, args.compound))
+    os.chdir(args.ac_root)
+    # pylint: disable=import-outside-toplevel,import-error
+    import LiveTelemetry
+    import acsys
+    from lib.sim_info import info
+
+    drive = SyntheticDrive(args.hz)
+    if not paced_run:
+        drive.setup(info, recorder)
+        drive.step(info, recorder, 0)
+
+    start = time.perf_counter()
+    LiveTelemetry.acMain("headless")
+    main_ms = (time.perf_counter() - start) * 1000.0
+
+    # Open every window, as if the user had clicked them on the sidebar.
+    for window_id, listener in recorder.activated_listeners.items():
+        listener(window_id)
+    deadline = time.monotonic() + 30.0
+    while LiveTelemetry.LT.loader is not None and time.monotonic() < deadline:
+        LiveTelemetry.acUpdate(0.0)
+        time.sleep(0.001)
+    recorder.reset()
+
+    windows = [LiveTelemetry.LT.engine_info] + list(LiveTelemetry.LT.wheel_infos.values())
+    ticks_before = [window.get_tick_counts() for window in windows]
+    dump = []
+    delta_t = 1.0 / args.hz
+    update_us: list[float] = []
+    render_us: list[float] = []
+    kinds: Counter = Counter()
+    names: Counter = Counter()
+    packets = Counter()
+    last_packet = info.physics.packetId
+    paced = time.perf_counter()
+    for _ in range(args.frames):
+        recorder.next_frame()
+        if paced_run:
+            paced += delta_t
+            delay = paced - time.perf_counter()
+            if delay > 0.0:
+                time.sleep(delay)
+        if args.external:
+            packet = info.physics.packetId
+            packets["new" if packet != last_packet else "repeated"] += 1
+            packets["missed"] += max(0, packet - last_packet - 1)
+            last_packet = packet
+            recorder.car_state[acsys.CS.SuspensionTravel] = tuple(info.physics.suspensionTravel)
+        elif not args.source:
+            drive.step(info, recorder, recorder.frame)
+        start = time.perf_counter()
+        LiveTelemetry.acUpdate(delta_t)
+        middle = time.perf_counter()
+        recorder.render(delta_t)
+        update_us.append((middle - start) * 1e6)
+        render_us.append((time.perf_counter() - middle) * 1e6)
+        kinds.update(recorder.kind_counts())
+        names.update(recorder.counts())
+        if dump_path:
+            dump.extend(recorder.to_dicts())
+        recorder.reset()
+
+    frames = max(1, args.frames)
+    print("acMain: {:.1f} ms".format(main_ms))
+    print("acUpdate: {:.1f} us/frame (p95 {:.1f} us)".format(sum(update_us) / frames, percentile(update_us, 0.95)))
+    print("render: {:.1f} us/frame (p95 {:.1f} us)".format(sum(render_us) / frames, percentile(render_us, 0.95)))
+    print("calls per frame: {}".format(", ".join(
+        "{} {:.1f}".format(kind, kinds[kind] / frames) for kind in (GL, LABEL, WINDOW, APP))))
+    ticks = [(after[0] - before[0], after[1] - before[1])
+             for before, after in zip(ticks_before, (window.get_tick_counts() for window in windows))]
+    print("window updates: {} processed, {} skipped".format(sum(tick[0] for tick in ticks), sum(tick[1] for tick in ticks)))
+    if args.external:
+        print("physics packets: {} new, {} repeated frames, {} missed between frames".format(
+            packets["new"], packets["repeated"], packets["missed"]))
+    if paced_run:
+        print("source: {}".format(LiveTelemetry.LT.source.summary()))
+    for name, count in names.most_common():
+        print("  {:<22} {:8.1f}".format(name, count / frames))
+    if dump_path:
+        with open(dump_path, "w", encoding="utf-8") as dump_file:
+            json.dump(dump, dump_file)
+        print("command log: {}".format(dump_path))
+    if temp_cfg is not None:
+        temp_cfg.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,110 @@
+"""Feed the plugin from another process through file-backed pages.
+
+Creates ``acpmf_physics``, ``acpmf_graphics`` and ``acpmf_static`` in a
+folder, laid out exactly like AC's shared memory pages, and writes a
+synthetic lap into them at the physics rate, with ``packetId`` going up
+by one per tick. Each tick is written into private copies of the pages
+and published with one copy per page, like AC publishes a whole packet. A plugin started with ``LT_SHM_DIR`` pointing at the
+same folder maps those files instead of AC's named pages, on any OS:
+
+    python tools/telemetry_driver.py /tmp/lt_shm --hz 333 &
+    LT_SHM_DIR=/tmp/lt_shm python tools/run_headless.py --external --frames 3600
+
+Usage:
+
+    python tools/telemetry_driver.py <folder> [--hz HZ] [--seconds S] [--car NAME]
+                                     [--track NAME] [--lap-seconds S] [--record FILE]
+
+``--record`` also writes every tick into a recording the plugin replays
+with the ``replay:FILE`` telemetry source. Runs until ``--seconds`` elapsed (forever by default) or Ctrl+C, then
+prints the achieved rate and how many ticks ran late.
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import os
+import sys
+import time
+from pathlib import Path
+
+from headless import PLUGIN, SyntheticDrive
+
+
+def open_pages(folder: Path):
+    """Returns the plugin's ``LTSimInfo`` mapped on the files of ``folder``."""
+    os.environ["LT_SHM_DIR"] = str(folder)
+    if str(PLUGIN) not in sys.path:
+        sys.path.insert(0, str(PLUGIN))
+    from lib.sim_info import info  # pylint: disable=import-outside-toplevel,import-error
+    return info
+
+
+class Staging:  # pylint: disable=too-few-public-methods
+    """Private physics and graphics pages a tick is written into."""
+
+    def __init__(self, info):
+        self.physics = type(info.physics)()
+        self.graphics = type(info.graphics)()
+        self.static = info.static
+
+    def publish(self, info) -> None:
+        """Copies the staged pages over the live ones, one page at a time."""
+        for staged, live in ((self.physics, info.physics), (self.graphics, info.graphics)):
+            ctypes.memmove(ctypes.addressof(live), ctypes.addressof(staged), ctypes.sizeof(live))
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Write synthetic AC telemetry into file-backed pages.")
+    parser.add_argument("folder", type=Path, help="folder of the page files, LT_SHM_DIR of the plugin")
+    parser.add_argument("--hz", type=float, default=333.0, help="physics ticks per second")
+    parser.add_argument("--seconds", type=float, default=0.0, help="stop after this long, 0 runs until Ctrl+C")
+    parser.add_argument("--car", default="headless", help="static.carModel")
+    parser.add_argument("--track", default="headless_ring", help="static.track")
+    parser.add_argument("--lap-seconds", type=float, default=90.0, help="length of the synthetic lap")
+    parser.add_argument("--record", type=Path, default=None, help="also write the ticks into this recording")
+    args = parser.parse_args(argv)
+
+    info = open_pages(args.folder.resolve())
+    drive = SyntheticDrive(args.hz, lap_seconds=args.lap_seconds)
+    staging = Staging(info)
+    drive.setup(staging, car=args.car, track=args.track)
+    recording = None
+    if args.record is not None:
+        from lib.lt_telemetry import RecordingWriter  # pylint: disable=import-outside-toplevel,import-error
+        recording = RecordingWriter(str(args.record), info.static)
+    print("writing {} Hz into {}".format(args.hz, args.folder))
+
+    period = 1.0 / args.hz
+    start = time.perf_counter()
+    late = 0
+    tick = 0
+    try:
+        while args.seconds <= 0.0 or tick * period < args.seconds:
+            tick += 1
+            drive.step(staging, None, tick)
+            staging.publish(info)
+            if recording is not None:
+                recording.write(tick * period, staging.physics, staging.graphics)
+            # Absolute deadlines, a late tick doesn't push back the next ones.
+            delay = start + tick * period - time.perf_counter()
+            if delay > 0.0:
+                time.sleep(delay)
+            else:
+                late += 1
+    except KeyboardInterrupt:
+        pass
+    elapsed = time.perf_counter() - start
+    print("{} ticks in {:.1f} s: {:.1f} Hz, {} late ({:.1f}%)".format(
+        tick, elapsed, tick / elapsed if elapsed > 0.0 else 0.0, late, 100.0 * late / max(tick, 1)))
+    if recording is not None:
+        recording.close()
+        print("recording: {}".format(args.record))
+    # The staged static page is the live one, close can't run while it's held.
+    staging.static = None
+    info.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))